@@ -4,7 +4,7 @@ AntiHallucination Agent for FibreFlow_React
 Handles truth validation and prevents false information
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,13 @@ from .base import BaseAgent, AgentCapability
 class AntiHallucinationAgent(BaseAgent):
     """Agent responsible for truth validation and preventing hallucinations."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="antihallucination",
-            version="1.0.0",
-            description="Truth validation and anti-hallucination agent",
-            capabilities=[
-                AgentCapability.ANALYSIS,
-                AgentCapability.CODE_VALIDATION,
-                AgentCapability.FACT_CHECKING,
-                AgentCapability.TRUTH_VALIDATION
-            ]
-        )
+    agent_type: str = "antihallucination"
+    version: str = "1.0.0"
+    description: str = "Truth validation and anti-hallucination agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.VALIDATION,
+        AgentCapability.CODE_ANALYSIS
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute truth validation task."""
@@ -4,7 +4,7 @@ Architect Agent for FibreFlow_React
 Handles system architecture and design decisions
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,14 @@ from .base import BaseAgent, AgentCapability
 class ArchitectAgent(BaseAgent):
     """Agent responsible for system architecture and design."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="architect",
-            version="1.0.0",
-            description="System architecture and design patterns agent",
-            capabilities=[
-                AgentCapability.ANALYSIS,
-                AgentCapability.REASONING,
-                AgentCapability.CODE_GENERATION,
-                AgentCapability.ARCHITECTURE_DESIGN
-            ]
-        )
+    agent_type: str = "architect"
+    version: str = "1.0.0"
+    description: str = "System architecture and design patterns agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.ARCHITECTURE,
+        AgentCapability.API_DESIGN,
+        AgentCapability.CODE_ANALYSIS
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute architecture task."""
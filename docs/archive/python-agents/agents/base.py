@@ -10,14 +10,19 @@ Provides extensible foundation for all agents with:
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union, Set
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Mapping, MutableMapping, Optional, Type, Union, Set
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
 import structlog
 
+from .codec import fingerprint
+from .exceptions import AgentCancelledError
+
 logger = structlog.get_logger()
 
 
@@ -101,18 +106,63 @@ class AgentInput(BaseModel):
     # Context
     feature_brief: Union[str, Dict[str, Any]] = Field(..., description="Original feature brief")
     project_context: Dict[str, Any] = Field(default_factory=dict, description="Project information")
+    working_directory: Optional[str] = Field(
+        default=None,
+        description="Checkout the agent reads and writes project files in (default: current directory)"
+    )
     
     # Previous outputs (for pipeline composition)
     previous_outputs: Dict[str, Any] = Field(default_factory=dict, description="Outputs from previous agents")
     artifacts: Dict[str, Any] = Field(default_factory=dict, description="Available artifacts")
     context_updates: Dict[str, Any] = Field(default_factory=dict, description="Context updates from previous agents")
+    dependency_streams: Dict[str, Any] = Field(
+        default_factory=dict,
+        exclude=True,
+        description="Live partial-output streams from stream dependencies"
+    )
     
     # Execution context
     config: AgentConfig = Field(default_factory=AgentConfig, description="Agent configuration")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    deadline: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Deadline (agents.deadline.Deadline) bounding this execution"
+    )
+    artifact_store: Optional[Any] = Field(
+        default=None,
+        exclude=True,
+        description="Artifact store (orchestration.artifacts.ArtifactStore) for streaming large artifacts"
+    )
     
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    @field_serializer("project_context", "previous_outputs")
+    def _serialize_context(self, value: Mapping[str, Any]) -> Dict[str, Any]:
+        """Flatten layered contexts (see layer_contexts) when serializing."""
+        return dict(value)
+    
+    def content_hash(self) -> str:
+        """
+        Stable hash of everything that determines an agent's output.
+        
+        Identifiers, timestamps and runtime handles (deadline, streams,
+        artifact store) are excluded, so identical requests from different
+        runs hash the same. Used as the key for output reuse and coalescing.
+        """
+        return fingerprint({
+            'feature_brief': self.feature_brief,
+            'project_context': self.project_context,
+            'working_directory': self.working_directory,
+            'previous_outputs': self.previous_outputs,
+            'previous_agent': self.previous_agent,
+            'artifacts': self.artifacts,
+            'context_updates': self.context_updates,
+            'config': self.config,
+            'metadata': self.metadata,
+            'extra': self.__pydantic_extra__
+        })
 
 
 class AgentOutput(BaseModel):
@@ -124,6 +174,7 @@ class AgentOutput(BaseModel):
     agent_execution_id: UUID = Field(..., description="Execution identifier")
     agent_type: str = Field(..., description="Agent type identifier")
     status: str = Field(..., description="Execution status (success/failure/partial)")
+    is_chunk: bool = Field(default=False, description="Intermediate chunk of a streamed execution, not its result")
     
     # Results
     primary_result: Any = Field(default=None, description="Main output of the agent")
@@ -168,6 +219,8 @@ class BaseAgent(ABC):
         self.logger = structlog.get_logger().bind(agent=self.agent_type)
         self._capabilities: Set[AgentCapability] = set()
         self._tools: Dict[str, Any] = {}
+        self.deadline = None  # Deadline of the current execution, if any
+        self.working_directory = Path(".")  # Checkout of the current execution
         
         # Initialize agent-specific setup
         self._initialize()
@@ -200,6 +253,21 @@ class BaseAgent(ABC):
         """Agent types this agent depends on (for pipeline ordering)."""
         return []
     
+    @property
+    def stream_dependencies(self) -> List[str]:
+        """Dependencies whose partial outputs this agent can consume as a stream."""
+        return []
+    
+    @property
+    def optional_dependencies(self) -> List[str]:
+        """Dependencies whose failure doesn't prevent this agent from running."""
+        return []
+    
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether this agent yields partial outputs from _stream_impl."""
+        return False
+    
     @property
     def compatible_agents(self) -> List[str]:
         """Agent types this agent can work with."""
@@ -218,6 +286,8 @@ class BaseAgent(ABC):
         """
         start_time = datetime.utcnow()
         execution_id = input_data.agent_execution_id
+        self.deadline = input_data.deadline
+        self.working_directory = Path(input_data.working_directory or ".")
         
         self.logger.info(
             "agent_execution_started",
@@ -226,6 +296,9 @@ class BaseAgent(ABC):
         )
         
         try:
+            if self.deadline:
+                self.deadline.check()
+            
             # Pre-execution validation
             await self._validate_input(input_data)
             
@@ -250,6 +323,10 @@ class BaseAgent(ABC):
             
             return result
             
+        except AgentCancelledError:
+            # Cancellation is not an agent failure; let the caller handle it
+            raise
+        
         except Exception as e:
             error_output = await self._handle_error(input_data, e, start_time)
             
@@ -262,11 +339,157 @@ class BaseAgent(ABC):
             
             return error_output
     
+    async def execute_stream(self, input_data: AgentInput) -> AsyncIterator[AgentOutput]:
+        """
+        Execute agent, yielding partial outputs as they are produced.
+        
+        Intermediate chunks are marked is_chunk; the last yielded output is
+        the final result, whatever its status. Agents that don't support streaming yield only
+        the final output of execute().
+        """
+        if not self.supports_streaming:
+            yield await self.execute(input_data)
+            return
+        
+        start_time = datetime.utcnow()
+        execution_id = input_data.agent_execution_id
+        self.deadline = input_data.deadline
+        self.working_directory = Path(input_data.working_directory or ".")
+        
+        self.logger.info(
+            "agent_stream_started",
+            execution_id=str(execution_id),
+            run_id=str(input_data.run_id)
+        )
+        
+        try:
+            if self.deadline:
+                self.deadline.check()
+            
+            await self._validate_input(input_data)
+            
+            result = None
+            chunk_count = 0
+            async for chunk in self._stream_impl(input_data):
+                if chunk.is_chunk:
+                    chunk_count += 1
+                    yield chunk
+                else:
+                    result = chunk
+            
+            if result is None:
+                raise ValueError("Streaming agent produced no final output")
+            
+            await self._validate_output(result)
+            
+            end_time = datetime.utcnow()
+            result.execution_time = (end_time - start_time).total_seconds()
+            result.completed_at = end_time
+            result.started_at = start_time
+            
+            self.logger.info(
+                "agent_stream_completed",
+                execution_id=str(execution_id),
+                duration=result.execution_time,
+                chunks=chunk_count,
+                status=result.status
+            )
+        
+        except AgentCancelledError:
+            raise
+        
+        except Exception as e:
+            result = await self._handle_error(input_data, e, start_time)
+            
+            self.logger.error(
+                "agent_stream_failed",
+                execution_id=str(execution_id),
+                error=str(e),
+                exc_info=True
+            )
+        
+        yield result
+    
+    async def execute_batch(self, inputs: List[AgentInput]) -> List[AgentOutput]:
+        """
+        Execute several inputs in one call, returning outputs in input order.
+        
+        Inputs are validated individually and a failing input gets its own
+        failure output without failing the rest of the batch. Each input
+        carries its own deadline and working directory, so neither is set
+        on the agent.
+        """
+        start_time = datetime.utcnow()
+        outputs: List[Optional[AgentOutput]] = [None] * len(inputs)
+        
+        self.logger.info("agent_batch_started", batch_size=len(inputs))
+        
+        valid = []
+        for index, input_data in enumerate(inputs):
+            try:
+                await self._validate_input(input_data)
+                valid.append(index)
+            except Exception as e:
+                outputs[index] = await self._handle_error(input_data, e, start_time)
+        
+        try:
+            results = await self._execute_batch_impl([inputs[index] for index in valid])
+            if len(results) != len(valid):
+                raise ValueError(f"Batch produced {len(results)} outputs for {len(valid)} inputs")
+        except AgentCancelledError:
+            raise
+        except Exception as e:
+            results = [e] * len(valid)
+        
+        end_time = datetime.utcnow()
+        for index, result in zip(valid, results):
+            try:
+                if isinstance(result, BaseException):
+                    raise result
+                await self._validate_output(result)
+                result.execution_time = (end_time - start_time).total_seconds()
+                result.completed_at = end_time
+                result.started_at = start_time
+                outputs[index] = result
+            except Exception as e:
+                outputs[index] = await self._handle_error(inputs[index], e, start_time)
+        
+        self.logger.info(
+            "agent_batch_completed",
+            batch_size=len(inputs),
+            failed=sum(1 for output in outputs if output.status == "failure"),
+            duration=(end_time - start_time).total_seconds()
+        )
+        
+        return outputs
+    
     @abstractmethod
     async def _execute_impl(self, input_data: AgentInput) -> AgentOutput:
         """Agent-specific implementation. Override in subclasses."""
         pass
     
+    async def _execute_batch_impl(
+        self,
+        inputs: List[AgentInput]
+    ) -> List[Union[AgentOutput, Exception]]:
+        """
+        Agent-specific batch implementation, e.g. one LLM call for all inputs.
+        
+        Returns one output (or the exception that input failed with) per
+        input. The default runs _execute_impl for each input concurrently.
+        """
+        return await asyncio.gather(
+            *(self._execute_impl(input_data) for input_data in inputs),
+            return_exceptions=True
+        )
+    
+    async def _stream_impl(self, input_data: AgentInput) -> AsyncIterator[AgentOutput]:
+        """
+        Agent-specific streaming implementation. Override together with
+        supports_streaming to yield is_chunk outputs before the final output.
+        """
+        yield await self._execute_impl(input_data)
+    
     async def _validate_input(self, input_data: AgentInput) -> None:
         """Validate input data. Override for agent-specific validation."""
         if not input_data.feature_brief:
@@ -355,8 +578,30 @@ def create_agent_output(
     )
 
 
+def layer_contexts(*contexts: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """
+    Combine contexts without copying them; earlier contexts take precedence.
+    
+    The layers are shared, so writes go to a fresh front layer
+    (copy-on-write) and never reach the underlying contexts.
+    """
+    return ChainMap({}, *contexts)
+
+
+def fork_context(context: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """Give a layered context a fresh write layer, dropping earlier local writes."""
+    if isinstance(context, ChainMap):
+        return context.parents.new_child()
+    return layer_contexts(context)
+
+
 def merge_contexts(context1: Dict[str, Any], context2: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge two context dictionaries with deep merge."""
+    """
+    Merge two context dictionaries with deep merge.
+    
+    Copies along the keys both contexts share; prefer layer_contexts for
+    read-mostly propagation.
+    """
     result = context1.copy()
     for key, value in context2.items():
         if key in result and isinstance(result[key], dict) and isinstance(value, dict):
@@ -0,0 +1,273 @@
+"""
+Build Cache for ForgeFlow
+
+Change-aware build and test execution for the DeploymentAgent. The
+project's inputs (lockfiles, configuration and the source tree of every
+package) are hashed into a build key per build command:
+
+- a build whose key matches the outputs in the project tree is skipped;
+- a build whose key was built before gets its outputs restored from the
+  cache instead of rebuilding;
+- tests only run for files changed since the last passing run of the same
+  command, and not at all when nothing changed. Lockfile or configuration
+  changes and deletions fall back to the full suite.
+
+File digests are cached by (mtime, size), so re-hashing an unchanged tree
+only stats it.
+
+Layout:
+    
+    <root>/<project id>/state.json           file digests, build and test records
+    <root>/<project id>/outputs/<key>/...    build outputs per build key
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_BUILD_CACHE_ROOT = Path(tempfile.gettempdir()) / "forgeflow-build-cache"
+
+LOCKFILES = {"package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml", "bun.lockb"}
+CONFIG_PATTERNS = ("package.json", "tsconfig*.json", "*.config.*", ".babelrc*", ".env*", ".npmrc")
+BUILD_OUTPUTS = ("dist", "build", ".next", "out")
+EXCLUDED_DIRS = {".git", "node_modules", "coverage", ".turbo", ".cache"}
+
+
+def is_global_input(path: str) -> bool:
+    """Whether a file affects every build and test, not just the code importing it."""
+    name = path.rsplit("/", 1)[-1]
+    return name in LOCKFILES or any(fnmatch.fnmatch(name, pattern) for pattern in CONFIG_PATTERNS)
+
+
+def _input_dirs(dirnames: List[str], filenames: List[str]) -> List[str]:
+    """Subdirectories to walk; build outputs only count as such next to a package.json."""
+    excluded = EXCLUDED_DIRS | set(BUILD_OUTPUTS) if "package.json" in filenames else EXCLUDED_DIRS
+    return [name for name in dirnames if name not in excluded]
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """
+    Input hashes, build outputs and test records of one project.
+    
+    The methods do blocking file I/O; async callers run them in a thread.
+    """
+    
+    def __init__(
+        self,
+        project_path: Union[str, Path],
+        root: Optional[Union[str, Path]] = None,
+        max_entries: int = 4
+    ):
+        self.project_path = Path(project_path).resolve()
+        project_id = hashlib.sha256(str(self.project_path).encode()).hexdigest()[:16]
+        self.root = Path(root or DEFAULT_BUILD_CACHE_ROOT) / project_id
+        self.max_entries = max_entries
+        self._state_path = self.root / "state.json"
+        self._state = self._load_state()
+        
+        # Statistics
+        self.cache_stats = {
+            'files_hashed': 0,
+            'build_hits': 0,
+            'build_restores': 0,
+            'build_misses': 0,
+            'tests_unchanged': 0,
+            'tests_changed': 0,
+            'tests_invalidated': 0
+        }
+    
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self._state_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        
+        state.setdefault("stat", {})
+        state.setdefault("builds", {})
+        state.setdefault("tests", {})
+        state.setdefault("outputs", {})
+        state.setdefault("current_outputs", None)
+        return state
+    
+    def _save_state(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self._state_path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(self._state, f)
+        os.replace(temp_path, self._state_path)
+    
+    def snapshot(self) -> Dict[str, str]:
+        """Digest of every input file, by project-relative path."""
+        previous = self._state["stat"]
+        stat_cache: Dict[str, List] = {}
+        files: Dict[str, str] = {}
+        
+        for dirpath, dirnames, filenames in os.walk(self.project_path):
+            dirnames[:] = _input_dirs(dirnames, filenames)
+            for name in filenames:
+                path = Path(dirpath) / name
+                relative = path.relative_to(self.project_path).as_posix()
+                try:
+                    stat = path.stat()
+                    cached = previous.get(relative)
+                    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        digest = cached[2]
+                    else:
+                        digest = _hash_file(path)
+                        self.cache_stats['files_hashed'] += 1
+                except OSError:
+                    continue
+                
+                stat_cache[relative] = [stat.st_mtime_ns, stat.st_size, digest]
+                files[relative] = digest
+        
+        self._state["stat"] = stat_cache
+        return files
+    
+    def package_hashes(self, files: Dict[str, str]) -> Dict[str, str]:
+        """Hash of each package's files; packages are directories with a package.json."""
+        # Deepest package first, the project root last
+        roots = sorted(
+            (path.rsplit("/", 1)[0] for path in files if path.endswith("/package.json")),
+            key=len, reverse=True
+        )
+        roots.append(".")
+        
+        digests: Dict[str, Any] = {}
+        for path in sorted(files):
+            package = next(root for root in roots if root == "." or path.startswith(f"{root}/"))
+            digest = digests.get(package)
+            if digest is None:
+                digest = digests[package] = hashlib.sha256()
+            digest.update(f"{path}\0{files[path]}\n".encode())
+        
+        return {package: digest.hexdigest() for package, digest in digests.items()}
+    
+    def build_key(self, command: str, packages: Dict[str, str]) -> str:
+        """Key of a build: the command and every package's input hash."""
+        digest = hashlib.sha256(command.encode())
+        for package in sorted(packages):
+            digest.update(f"\n{package}\0{packages[package]}".encode())
+        return digest.hexdigest()
+    
+    def changed_packages(self, command: str, packages: Dict[str, str]) -> List[str]:
+        """Packages whose inputs changed since the last build of command."""
+        previous = self._state["builds"].get(command, {}).get("packages", {})
+        return sorted(
+            package for package in set(packages) | set(previous)
+            if packages.get(package) != previous.get(package)
+        )
+    
+    def _output_dirs(self) -> List[str]:
+        """Project-relative build output directories currently present."""
+        outputs = []
+        for dirpath, dirnames, filenames in os.walk(self.project_path):
+            dirnames[:] = _input_dirs(dirnames, filenames)
+            if "package.json" not in filenames:
+                continue
+            for name in BUILD_OUTPUTS:
+                output = Path(dirpath) / name
+                if output.is_dir():
+                    outputs.append(output.relative_to(self.project_path).as_posix())
+        return sorted(outputs)
+    
+    def restore_build(self, key: str) -> Optional[str]:
+        """
+        Make the outputs of build key current. Returns "hit" when they
+        already are, "restored" when copied back from the cache, or None.
+        """
+        cached_dir = self.root / "outputs" / key
+        
+        outputs = self._state["outputs"].get(key)
+        if outputs is None:
+            self.cache_stats['build_misses'] += 1
+            return None
+        
+        if self._state["current_outputs"] == key:
+            if all((self.project_path / output).is_dir() for output in outputs):
+                self.cache_stats['build_hits'] += 1
+                return "hit"
+        
+        if cached_dir.is_dir():
+            for output in self._output_dirs():
+                shutil.rmtree(self.project_path / output, ignore_errors=True)
+            for output in outputs:
+                shutil.copytree(cached_dir / output, self.project_path / output)
+            
+            self._state["current_outputs"] = key
+            self._save_state()
+            self.cache_stats['build_restores'] += 1
+            return "restored"
+        
+        self.cache_stats['build_misses'] += 1
+        return None
+    
+    def store_build(self, command: str, key: str, packages: Dict[str, str]):
+        """Record a successful build and cache its outputs under its key."""
+        outputs = self._output_dirs()
+        cached_dir = self.root / "outputs" / key
+        
+        shutil.rmtree(cached_dir, ignore_errors=True)
+        for output in outputs:
+            shutil.copytree(self.project_path / output, cached_dir / output)
+        
+        # Most recent last; evict the oldest beyond max_entries
+        cached_outputs = self._state["outputs"]
+        cached_outputs.pop(key, None)
+        cached_outputs[key] = outputs
+        while len(cached_outputs) > self.max_entries:
+            stale = next(iter(cached_outputs))
+            del cached_outputs[stale]
+            shutil.rmtree(self.root / "outputs" / stale, ignore_errors=True)
+        
+        self._state["current_outputs"] = key
+        self._state["builds"][command] = {"key": key, "packages": packages}
+        self._save_state()
+    
+    def test_changes(self, command: str, files: Dict[str, str]) -> Optional[List[str]]:
+        """
+        Files changed since the last passing run of a test command, or None
+        when the full suite has to run.
+        """
+        previous = self._state["tests"].get(command)
+        if previous is None:
+            return None
+        
+        changed = sorted(path for path, digest in files.items() if previous.get(path) != digest)
+        deleted = any(path not in files for path in previous)
+        if deleted or any(is_global_input(path) for path in changed):
+            self.cache_stats['tests_invalidated'] += 1
+            return None
+        
+        self.cache_stats['tests_changed' if changed else 'tests_unchanged'] += 1
+        return changed
+    
+    def record_tests(self, command: str, files: Dict[str, str]):
+        """Record a passing run of a test command."""
+        self._state["tests"][command] = files
+        self._save_state()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get build cache statistics."""
+        return {
+            **self.cache_stats,
+            'cached_builds': len(self._state["outputs"])
+        }
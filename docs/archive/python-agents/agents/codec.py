@@ -0,0 +1,80 @@
+"""
+JSON codec for agent models.
+
+Serializes pydantic models (AgentInput, AgentOutput, ...) and the values
+they carry (UUIDs, datetimes, enums, sets, layered contexts) to compact
+JSON bytes, and computes stable fingerprints of them. Used by the artifact
+store for payload blobs and by AgentInput.content_hash.
+
+orjson is used when installed; otherwise the standard json module.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Mapping, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
+
+def _default(value: Any) -> Any:
+    """Serialize values the JSON backends don't handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Mapping):
+        return dict(value)  # layered contexts (ChainMap, MappingProxyType)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+
+if orjson_available:
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    
+    def _dumps_canonical(value: Any) -> bytes:
+        return orjson.dumps(
+            value, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+        )
+    
+    def _loads(data: Union[bytes, memoryview]) -> Any:
+        return orjson.loads(data)
+else:
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=_default, separators=(",", ":")).encode()
+    
+    def _dumps_canonical(value: Any) -> bytes:
+        return json.dumps(value, default=_default, separators=(",", ":"), sort_keys=True).encode()
+    
+    def _loads(data: Union[bytes, memoryview]) -> Any:
+        return json.loads(bytes(data))
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes (models, UUIDs, datetimes and enums included)."""
+    return _dumps(value)
+
+
+def loads(data: Union[bytes, memoryview]) -> Any:
+    """Parse JSON bytes produced by dumps."""
+    return _loads(data)
+
+
+def fingerprint(value: Any) -> str:
+    """Stable sha256 hex digest of a value's key-sorted JSON form."""
+    return hashlib.sha256(_dumps_canonical(value)).hexdigest()
+
@@ -4,7 +4,7 @@ Coder Agent for FibreFlow_React
 Handles code implementation and generation
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,13 @@ from .base import BaseAgent, AgentCapability
 class CoderAgent(BaseAgent):
     """Agent responsible for code implementation."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="coder",
-            version="1.0.0",
-            description="Code implementation and generation agent",
-            capabilities=[
-                AgentCapability.CODE_GENERATION,
-                AgentCapability.REFACTORING,
-                AgentCapability.DEBUGGING,
-                AgentCapability.FILE_OPERATIONS
-            ]
-        )
+    agent_type: str = "coder"
+    version: str = "1.0.0"
+    description: str = "Code implementation and generation agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.CODE_GENERATION,
+        AgentCapability.DEBUGGING
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute coding task."""
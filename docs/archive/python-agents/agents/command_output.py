@@ -0,0 +1,208 @@
+"""
+Streaming Command Output for ForgeFlow
+
+Captures the output of long-running commands (builds, test suites,
+deployments) without buffering it in memory. stdout and stderr are read
+concurrently in chunks and split into lines, and every line is:
+
+- appended to a rotating log file on disk, which keeps the full output
+  bounded by max_bytes per file and backup_count rotated files;
+- kept in a bounded tail of the last lines of its stream;
+- passed to an optional callback as it arrives, for progress events.
+
+Both pipes are drained until EOF, so a process writing a lot to one of
+them never blocks on a full pipe, and overlong lines are split instead of
+accumulating.
+"""
+
+import asyncio
+import os
+import subprocess
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional, Union
+
+DEFAULT_COMMAND_LOG_DIR = Path(tempfile.gettempdir()) / "forgeflow-command-logs"
+
+CHUNK_SIZE = 64 * 1024
+
+# Called with the stream name ("stdout" or "stderr") and the line, without newline
+LineCallback = Callable[[str, str], None]
+
+
+class RotatingLogFile:
+    """Append-only log file, rotated to path.1 ... path.N when it grows past max_bytes."""
+    
+    def __init__(self, path: Union[str, Path], max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotations = 0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+    
+    def write(self, data: bytes):
+        """Append data, rotating first if it would overflow the current file."""
+        if self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._size += len(data)
+    
+    def flush(self):
+        """Flush written data to disk."""
+        self._file.flush()
+    
+    def _rotate(self):
+        self._file.close()
+        
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        
+        self._file = open(self.path, "wb")
+        self._size = 0
+        self.rotations += 1
+    
+    def close(self):
+        """Close the current file."""
+        self._file.close()
+
+
+class CommandResult(subprocess.CompletedProcess):
+    """
+    CompletedProcess of a streamed command. stdout and stderr hold only the
+    tail of each stream; the full output is in the log file.
+    """
+    
+    def __init__(
+        self,
+        args: str,
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        duration: float,
+        log_path: Optional[Path],
+        line_counts: Dict[str, int],
+        truncated: bool
+    ):
+        super().__init__(args, returncode, stdout, stderr)
+        self.duration = duration
+        self.log_path = log_path
+        self.line_counts = line_counts
+        self.truncated = truncated
+
+
+class OutputCapture:
+    """Line-by-line capture of a process's stdout and stderr."""
+    
+    def __init__(
+        self,
+        log: Optional[RotatingLogFile] = None,
+        tail_lines: int = 200,
+        on_line: Optional[LineCallback] = None,
+        max_line_length: int = 8192
+    ):
+        self.log = log
+        self.on_line = on_line
+        self.max_line_length = max_line_length
+        self.tails: Dict[str, Deque[str]] = {
+            "stdout": deque(maxlen=tail_lines),
+            "stderr": deque(maxlen=tail_lines)
+        }
+        self.line_counts = {"stdout": 0, "stderr": 0}
+    
+    async def drain(self, process: asyncio.subprocess.Process) -> int:
+        """Read both pipes to EOF, then wait for the process. Returns its exit code."""
+        await asyncio.gather(
+            self._pump("stdout", process.stdout),
+            self._pump("stderr", process.stderr)
+        )
+        return await process.wait()
+    
+    async def _pump(self, stream: str, reader: Optional[asyncio.StreamReader]):
+        if reader is None:
+            return
+        
+        pending = b""
+        while True:
+            chunk = await reader.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                self._emit_split(stream, line)
+            
+            # Emit the full pieces of an unfinished line rather than buffering it whole
+            if len(pending) >= self.max_line_length:
+                split_at = len(pending) - len(pending) % self.max_line_length
+                self._emit_split(stream, pending[:split_at])
+                pending = pending[split_at:]
+            
+            if self.log:
+                self.log.flush()
+        
+        if pending:
+            self._emit_split(stream, pending)
+    
+    def _emit_split(self, stream: str, line: bytes):
+        """Emit a line as pieces of at most max_line_length bytes."""
+        for start in range(0, len(line), self.max_line_length):
+            self._emit(stream, line[start:start + self.max_line_length])
+        if not line:
+            self._emit(stream, line)
+    
+    def _emit(self, stream: str, line: bytes):
+        if self.log:
+            self.log.write(line + b"\n")
+        
+        text = line.rstrip(b"\r").decode(errors="replace")
+        self.tails[stream].append(text)
+        self.line_counts[stream] += 1
+        
+        if self.on_line:
+            self.on_line(stream, text)
+    
+    def tail(self, stream: str) -> str:
+        """Last captured lines of a stream."""
+        lines = self.tails[stream]
+        return "\n".join(lines) + "\n" if lines else ""
+    
+    def result(self, command: str, returncode: int, duration: float) -> CommandResult:
+        """Build the command result from the captured tails."""
+        return CommandResult(
+            command,
+            returncode,
+            self.tail("stdout"),
+            self.tail("stderr"),
+            duration=duration,
+            log_path=self.log.path if self.log else None,
+            line_counts=dict(self.line_counts),
+            truncated=any(
+                self.line_counts[stream] > len(tail) for stream, tail in self.tails.items()
+            )
+        )
+
+
+def prune_logs(directory: Union[str, Path], keep: int) -> int:
+    """Delete all but the newest keep command logs (and their rotations). Returns how many were deleted."""
+    directory = Path(directory)
+    if not directory.is_dir():
+        return 0
+    
+    logs = sorted(directory.glob("*.log"), key=lambda path: path.stat().st_mtime, reverse=True)
+    deleted = 0
+    for log_path in logs[keep:]:
+        for path in [log_path, *directory.glob(f"{log_path.name}.*")]:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+        deleted += 1
+    return deleted
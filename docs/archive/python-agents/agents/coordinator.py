@@ -8,9 +8,12 @@ git branch management, and GitHub integration.
 import asyncio
 import json
 import subprocess
+from collections import Counter
 from datetime import datetime
+from fnmatch import fnmatch
+from itertools import combinations
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 import structlog
@@ -18,7 +21,9 @@ from pydantic import BaseModel, Field
 
 from .base import BaseAgent, AgentInput, AgentOutput, AgentCapability, create_agent_output
 from .factory import AgentFactory
+from .git_repository import GitRepository, run_process
 from .registry import get_registry
+from .worktrees import get_worktree_pool
 
 logger = structlog.get_logger()
 
@@ -32,6 +37,7 @@ class CoordinationStrategy(BaseModel):
     branch_strategy: str = Field(default="feature_branches", description="Git branching strategy")
     merge_strategy: str = Field(default="merge_commits", description="How to merge agent work")
     handoff_points: List[str] = Field(default_factory=list, description="Where to pause for approval")
+    max_parallel_agents: int = Field(default=4, ge=1, description="Maximum agents running at once")
 
 
 class AgentAssignment(BaseModel):
@@ -133,16 +139,13 @@ class CoordinatorAgent(BaseAgent):
                        strategy=coordination_plan.strategy.name,
                        agents=len(coordination_plan.assignments))
             
-            # Execute coordination based on strategy
-            if coordination_plan.strategy.type == "sequential":
-                result = await self._execute_sequential(coordination_plan)
-            elif coordination_plan.strategy.type == "parallel":
-                result = await self._execute_parallel(coordination_plan)
-            elif coordination_plan.strategy.type == "hybrid":
-                result = await self._execute_hybrid(coordination_plan)
-            else:
+            if coordination_plan.strategy.type not in ("sequential", "parallel", "hybrid"):
                 raise ValueError(f"Unknown coordination strategy: {coordination_plan.strategy.type}")
             
+            # Every strategy runs the dependency graph; independent agents overlap
+            # and strategies differ in conflict resolution and handoff points
+            result = await self._execute_dag(coordination_plan)
+            
             # Create GitHub PR if requested
             if agent_input.context.get("create_pr", False):
                 result.pull_request_url = await self._create_github_pr(result, coordination_plan)
@@ -262,148 +265,226 @@ class CoordinatorAgent(BaseAgent):
             )
         ]
     
-    async def _execute_sequential(self, plan: CoordinationPlan) -> CoordinationResult:
-        """Execute agents sequentially."""
+    def _build_dependency_graph(self, assignments: List[AgentAssignment]) -> Dict[str, Tuple[str, ...]]:
+        """
+        Map each assigned agent to the assigned agents it depends on.
+        
+        Dependencies on agents without an assignment are ignored. Raises
+        ValueError for agents assigned twice or circular dependencies.
+        """
+        counts = Counter(assignment.agent_type for assignment in assignments)
+        duplicates = [agent_type for agent_type, count in counts.items() if count > 1]
+        if duplicates:
+            raise ValueError(f"Agents assigned more than once: {', '.join(duplicates)}")
+        
+        graph: Dict[str, Tuple[str, ...]] = {}
+        for assignment in assignments:
+            unknown = [dep for dep in assignment.dependencies if dep not in counts]
+            if unknown:
+                logger.warning("Ignoring dependencies on unassigned agents",
+                              agent=assignment.agent_type, dependencies=unknown)
+            graph[assignment.agent_type] = tuple(
+                dict.fromkeys(dep for dep in assignment.dependencies if dep in counts)
+            )
+        
+        # Peel off waves of agents whose dependencies are done; a leftover means a cycle
+        pending = {agent_type: set(deps) for agent_type, deps in graph.items()}
+        done: Set[str] = set()
+        waves = 0
+        while pending:
+            wave = [agent_type for agent_type, deps in pending.items() if deps <= done]
+            if not wave:
+                raise ValueError(f"Circular dependencies between agents: {', '.join(pending)}")
+            for agent_type in wave:
+                del pending[agent_type]
+            done.update(wave)
+            waves += 1
+        
+        logger.info("Coordination graph built", agents=len(graph), waves=waves)
+        return graph
+    
+    async def _execute_dag(self, plan: CoordinationPlan) -> CoordinationResult:
+        """
+        Execute assignments as a dependency graph.
+        
+        Each agent runs on its own branch and worktree as soon as its
+        dependencies have finished, up to max_parallel_agents at once. Its
+        branch forks from the feature branch after the dependencies' branches
+        were merged into it, so merges only happen where a dependent needs
+        them; the remaining branches are merged together at the end.
+        Dependents of a failed agent, or of one whose branch couldn't be
+        merged at a merge point, are skipped.
+        """
+        dependencies = self._build_dependency_graph(plan.assignments)
+        assignments = {assignment.agent_type: assignment for assignment in plan.assignments}
+        order = {agent_type: index for index, agent_type in enumerate(assignments)}
+        dependents: Dict[str, List[str]] = {agent_type: [] for agent_type in dependencies}
+        for agent_type, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(agent_type)
         
         feature_branch = await self._create_feature_branch(plan)
-        agent_results = {}
+        agent_branches = {
+            agent_type: f"{feature_branch}-{agent_type}" for agent_type in assignments
+        }
         
-        # Sort assignments by priority and dependencies
-        sorted_assignments = self._sort_assignments_by_dependencies(plan.assignments)
+        predicted_overlaps = self._predict_overlaps(plan.assignments)
+        if predicted_overlaps:
+            logger.info("Predicted overlapping assignments", pairs=predicted_overlaps)
+        predicted_branch_overlaps = {
+            (agent_branches[first], agent_branches[second]) for first, second in predicted_overlaps
+        }
         
-        for assignment in sorted_assignments:
-            logger.info("Executing agent", agent=assignment.agent_type, task=assignment.task_description)
-            
-            # Execute agent
-            result = await self._execute_single_agent(assignment, plan, feature_branch)
-            agent_results[assignment.agent_type] = result
+        semaphore = asyncio.Semaphore(plan.strategy.max_parallel_agents)
+        waiting = {agent_type: set(deps) for agent_type, deps in dependencies.items()}
+        running: Dict[asyncio.Task, str] = {}
+        unmerged: Set[str] = set()
+        agent_results: Dict[str, Dict] = {}
+        conflicts_resolved: List[str] = []
+        manual_conflicts: List[str] = []
+        
+        async def run(assignment: AgentAssignment) -> Dict:
+            async with semaphore:
+                return await self._execute_agent_on_branch(
+                    assignment, plan, agent_branches[assignment.agent_type]
+                )
+        
+        async def merge(agent_types: Set[str]) -> Set[str]:
+            """Merge the agents' branches; returns the agents whose branch couldn't be merged."""
+            branches = [agent_branches[agent_type] for agent_type in sorted(agent_types, key=order.get)]
+            resolved, manual, failed = await self._merge_agent_branches(
+                branches, feature_branch, plan, predicted_branch_overlaps
+            )
+            conflicts_resolved.extend(resolved)
+            manual_conflicts.extend(manual)
+            unmerged.difference_update(agent_types)
+            return {agent_type for agent_type in agent_types if agent_branches[agent_type] in failed}
+        
+        async def start_ready():
+            ready = sorted(
+                (agent_type for agent_type, deps in waiting.items() if not deps),
+                key=lambda agent_type: (assignments[agent_type].priority, order[agent_type])
+            )
+            if not ready:
+                return
             
-            # Commit agent's work
-            await self._commit_agent_work(assignment.agent_type, assignment.task_description)
+            # Merge point: dependencies' work must be on the feature branch before forking
+            needed = {dep for agent_type in ready for dep in dependencies[agent_type]} & unmerged
+            if needed:
+                unmergeable = await merge(needed)
+                for agent_type in list(ready):
+                    blocked = sorted(unmergeable.intersection(dependencies[agent_type]), key=order.get)
+                    if blocked:
+                        ready.remove(agent_type)
+                        del waiting[agent_type]
+                        agent_results[agent_type] = {
+                            "error": f"Dependency {blocked[0]} could not be merged",
+                            "success": False,
+                            "skipped": True
+                        }
+                        skip_dependents(agent_type, blocked[0])
+                if not ready:
+                    return
             
-            # Check for handoff points
-            if f"after_{assignment.agent_type}" in plan.strategy.handoff_points:
-                await self._handle_handoff_point(assignment.agent_type, plan)
-        
-        return CoordinationResult(
-            success=True,
-            feature_branch=feature_branch,
-            agent_results=agent_results,
-            conflicts_resolved=[],
-            manual_conflicts=[]
-        )
-    
-    async def _execute_parallel(self, plan: CoordinationPlan) -> CoordinationResult:
-        """Execute agents in parallel with conflict resolution."""
+            await self._create_agent_branches([agent_branches[agent_type] for agent_type in ready], feature_branch)
+            for agent_type in ready:
+                del waiting[agent_type]
+                running[asyncio.create_task(run(assignments[agent_type]))] = agent_type
+        
+        def skip_dependents(agent_type: str, failed: str):
+            for dependent in dependents[agent_type]:
+                if dependent in waiting:
+                    del waiting[dependent]
+                    agent_results[dependent] = {
+                        "error": f"Dependency {failed} failed",
+                        "success": False,
+                        "skipped": True
+                    }
+                    skip_dependents(dependent, failed)
         
-        feature_branch = await self._create_feature_branch(plan)
+        try:
+            await start_ready()
+            
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in sorted(done, key=lambda task: order[running[task]]):
+                    agent_type = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        logger.error("Agent failed", agent=agent_type, error=str(e))
+                        result = {"error": str(e), "success": False}
+                    
+                    agent_results[agent_type] = result
+                    unmerged.add(agent_type)
+                    
+                    if not result.get("success"):
+                        skip_dependents(agent_type, agent_type)
+                        continue
+                    
+                    # Check for handoff points
+                    if f"after_{agent_type}" in plan.strategy.handoff_points:
+                        await self._handle_handoff_point(agent_type, plan)
+                    
+                    for dependent in dependents[agent_type]:
+                        if dependent in waiting:
+                            waiting[dependent].discard(agent_type)
+                
+                await start_ready()
+            
+            if unmerged:
+                await merge(unmerged)
         
-        # Create agent-specific branches
-        agent_branches = {}
-        for assignment in plan.assignments:
-            branch_name = f"{feature_branch}-{assignment.agent_type}"
-            await self._create_agent_branch(branch_name, feature_branch)
-            agent_branches[assignment.agent_type] = branch_name
-        
-        # Execute agents in parallel
-        agent_tasks = []
-        for assignment in plan.assignments:
-            task = asyncio.create_task(
-                self._execute_agent_on_branch(assignment, plan, agent_branches[assignment.agent_type])
-            )
-            agent_tasks.append((assignment.agent_type, task))
-        
-        # Wait for all agents to complete
-        agent_results = {}
-        for agent_type, task in agent_tasks:
-            try:
-                result = await task
-                agent_results[agent_type] = result
-            except Exception as e:
-                logger.error("Agent failed", agent=agent_type, error=str(e))
-                agent_results[agent_type] = {"error": str(e), "success": False}
-        
-        # Merge agent branches with conflict resolution
-        conflicts_resolved, manual_conflicts = await self._merge_agent_branches(
-            list(agent_branches.values()), feature_branch, plan
-        )
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            
+            # Don't keep idle worktrees around between coordination runs
+            await asyncio.shield(get_worktree_pool(self.project_path).close())
         
         return CoordinationResult(
             success=len(manual_conflicts) == 0,
             feature_branch=feature_branch,
-            agent_results=agent_results,
+            agent_results={agent_type: agent_results[agent_type] for agent_type in assignments},
             conflicts_resolved=conflicts_resolved,
             manual_conflicts=manual_conflicts
         )
     
-    async def _execute_hybrid(self, plan: CoordinationPlan) -> CoordinationResult:
-        """Execute hybrid strategy with both sequential and parallel phases."""
-        
-        # Phase 1: Sequential planning and architecture
-        planning_assignments = [a for a in plan.assignments if a.agent_type in ["planner", "architect"]]
-        implementation_assignments = [a for a in plan.assignments if a.agent_type not in ["planner", "architect"]]
-        
-        # Execute planning phase sequentially
-        planning_plan = CoordinationPlan(
-            feature_brief=plan.feature_brief,
-            strategy=self.strategies["sequential"],
-            assignments=planning_assignments,
-            base_branch=plan.base_branch
-        )
-        
-        planning_result = await self._execute_sequential(planning_plan)
-        
-        # Phase 2: Parallel implementation
-        if implementation_assignments:
-            impl_plan = CoordinationPlan(
-                feature_brief=plan.feature_brief,
-                strategy=self.strategies["parallel_isolated"],
-                assignments=implementation_assignments,
-                base_branch=planning_result.feature_branch
-            )
-            
-            impl_result = await self._execute_parallel(impl_plan)
-            
-            # Combine results
-            all_results = {**planning_result.agent_results, **impl_result.agent_results}
-            
-            return CoordinationResult(
-                success=planning_result.success and impl_result.success,
-                feature_branch=impl_result.feature_branch,
-                agent_results=all_results,
-                conflicts_resolved=impl_result.conflicts_resolved,
-                manual_conflicts=impl_result.manual_conflicts
-            )
-        
-        return planning_result
-    
     async def _create_feature_branch(self, plan: CoordinationPlan) -> str:
         """Create main feature branch."""
         
         feature_id = str(uuid4())[:8]
         branch_name = f"feature/multi-agent-{feature_id}"
         
-        await self._run_git_command(f"checkout -b {branch_name} {plan.base_branch}")
+        await self._run_git_command("checkout", "-b", branch_name, plan.base_branch)
         
         return branch_name
     
-    async def _create_agent_branch(self, branch_name: str, parent_branch: str):
-        """Create a branch for an agent."""
-        await self._run_git_command(f"checkout -b {branch_name} {parent_branch}")
+    async def _create_agent_branches(self, branch_names: List[str], parent_branch: str):
+        """Create agent branches off the parent without checking them out."""
+        await self.git.create_branches(branch_names, parent_branch)
     
     async def _execute_single_agent(
         self, 
         assignment: AgentAssignment, 
         plan: CoordinationPlan,
-        branch_name: str
+        branch_name: str,
+        working_directory: Optional[Path] = None
     ) -> Dict:
-        """Execute a single agent."""
+        """Execute a single agent, in working_directory if given."""
         
         agent = await self.factory.create_agent(assignment.agent_type)
         
         try:
-            # Prepare agent input with constraints
+            # Prepare agent input with constraints; the agent works in the checkout it is given
             agent_input = AgentInput(
+                run_id=uuid4(),
+                feature_brief=plan.feature_brief,
+                working_directory=str(working_directory or self.project_path),
+                deadline=self.deadline,
                 task_description=assignment.task_description,
                 context={
                     "feature_brief": plan.feature_brief,
@@ -417,10 +498,10 @@ class CoordinatorAgent(BaseAgent):
             result = await agent.execute(agent_input)
             
             return {
-                "success": result.success,
+                "success": result.status == "success",
                 "artifacts": result.artifacts,
-                "confidence": result.confidence,
-                "reasoning": result.reasoning
+                "confidence": result.confidence_score,
+                "reasoning": getattr(result, "reasoning", result.error_message)
             }
             
         finally:
@@ -432,63 +513,205 @@ class CoordinatorAgent(BaseAgent):
         plan: CoordinationPlan,
         branch_name: str
     ) -> Dict:
-        """Execute agent on its dedicated branch."""
+        """
+        Execute agent on its dedicated branch, in a pooled worktree of its
+        own so parallel agents don't share a working copy.
+        """
+        async with get_worktree_pool(self.project_path).lease(branch_name, self.deadline) as worktree:
+            # Execute agent
+            result = await self._execute_single_agent(assignment, plan, branch_name, worktree.path)
+            
+            # Commit work
+            await self._commit_agent_work(
+                assignment.agent_type, assignment.task_description, worktree.git
+            )
+        
+        return result
+    
+    def _predict_overlaps(self, assignments: List[AgentAssignment]) -> List[Tuple[str, str]]:
+        """
+        Pairs of agents whose file patterns may cover the same files, so
+        their branches are likely to need conflict resolution.
+        
+        Patterns starting with "!" exclude files from an agent's patterns.
+        """
+        def split(patterns: List[str]) -> Tuple[List[str], List[str]]:
+            return (
+                [pattern for pattern in patterns if not pattern.startswith("!")],
+                [pattern[1:] for pattern in patterns if pattern.startswith("!")]
+            )
         
-        # Switch to agent's branch
-        await self._run_git_command(f"checkout {branch_name}")
+        def common_pattern(first: str, second: str) -> Optional[str]:
+            """The narrower of two patterns when one covers the other."""
+            if first == second or fnmatch(first, second):
+                return first
+            if fnmatch(second, first):
+                return second
+            return None
+        
+        def assignments_overlap(a: AgentAssignment, b: AgentAssignment) -> bool:
+            a_includes, a_excludes = split(a.file_patterns)
+            b_includes, b_excludes = split(b.file_patterns)
+            excludes = a_excludes + b_excludes
+            for p in a_includes:
+                for q in b_includes:
+                    common = common_pattern(p, q)
+                    if common and not any(common_pattern(common, exclude) == common for exclude in excludes):
+                        return True
+            return False
         
-        # Execute agent
-        result = await self._execute_single_agent(assignment, plan, branch_name)
+        return [
+            (a.agent_type, b.agent_type)
+            for a, b in combinations(assignments, 2)
+            if assignments_overlap(a, b)
+        ]
+    
+    async def _get_changed_paths(
+        self,
+        branches: List[str],
+        base_branch: str
+    ) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """
+        Files each branch changed since it forked from base_branch, and
+        files base_branch changed since each branch forked.
+        """
+        changed, base_changed = await asyncio.gather(
+            asyncio.gather(*(
+                self.git.changed_files(f"{base_branch}...{branch}") for branch in branches
+            )),
+            asyncio.gather(*(
+                self.git.changed_files(f"{branch}...{base_branch}") for branch in branches
+            ))
+        )
+        return (
+            {branch: set(paths) for branch, paths in zip(branches, changed)},
+            {branch: set(paths) for branch, paths in zip(branches, base_changed)}
+        )
+    
+    def _partition_by_overlap(
+        self,
+        changed_paths: Dict[str, Set[str]],
+        base_changed_paths: Optional[Dict[str, Set[str]]] = None,
+        predicted_overlaps: Optional[Set[Tuple[str, str]]] = None
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Split branches into ones whose changes no other branch touches and
+        ones that may conflict: sharing a changed file with another branch
+        or with the base branch's changes since the branch forked, or
+        predicted to overlap with another branch being merged. Branches
+        without changes are left out.
+        """
+        touched = Counter(path for paths in changed_paths.values() for path in paths)
+        base_changed_paths = base_changed_paths or {}
+        predicted = {
+            branch
+            for pair in predicted_overlaps or ()
+            if all(changed_paths.get(branch) for branch in pair)
+            for branch in pair
+        }
         
-        # Commit work
-        await self._commit_agent_work(assignment.agent_type, assignment.task_description)
+        disjoint, overlapping = [], []
+        for branch, paths in changed_paths.items():
+            if not paths:
+                continue
+            if (
+                branch not in predicted
+                and all(touched[path] == 1 for path in paths)
+                and not paths & base_changed_paths.get(branch, set())
+            ):
+                disjoint.append(branch)
+            else:
+                overlapping.append(branch)
         
-        return result
+        return disjoint, overlapping
     
     async def _merge_agent_branches(
         self,
         agent_branches: List[str],
         feature_branch: str,
-        plan: CoordinationPlan
-    ) -> tuple[List[str], List[str]]:
-        """Merge agent branches with conflict resolution."""
-        
-        await self._run_git_command(f"checkout {feature_branch}")
-        
+        plan: CoordinationPlan,
+        predicted_overlaps: Optional[Set[Tuple[str, str]]] = None
+    ) -> tuple[List[str], List[str], List[str]]:
+        """
+        Merge agent branches with conflict resolution.
+        
+        Branches whose changed files no other branch (nor the feature branch
+        since they forked) touched, and that aren't predicted to overlap, are
+        merged together in one octopus merge; if it fails they are merged one
+        by one like the rest. The other branches are merged one by one
+        through conflict resolution; a merge whose conflicts aren't resolved
+        is aborted, leaving the feature branch clean.
+        
+        Returns the resolved and unresolved conflicts, and the branches that
+        couldn't be merged.
+        """
         conflicts_resolved = []
         manual_conflicts = []
+        failed_branches = []
         
-        for branch in agent_branches:
-            try:
-                # Attempt merge
-                result = await self._run_git_command(f"merge {branch}", check=False)
-                
-                if result.returncode != 0:
-                    # Handle conflicts
-                    conflict_files = await self._detect_merge_conflicts()
+        changed_paths, base_changed_paths = await self._get_changed_paths(agent_branches, feature_branch)
+        disjoint, overlapping = self._partition_by_overlap(
+            changed_paths, base_changed_paths, predicted_overlaps
+        )
+        octopus_merged: List[str] = []
+        sequential = disjoint + overlapping
+        
+        # Keep the checkout and every merge/resolution together
+        async with self.git.exclusive():
+            await self._run_git_command("checkout", feature_branch)
+            
+            if len(disjoint) > 1:
+                result = await self._run_git_command(
+                    "merge", "--no-edit", "-m", f"Merge {len(disjoint)} agent branches", *disjoint,
+                    check=False
+                )
+                if result.returncode == 0:
+                    octopus_merged, sequential = disjoint, overlapping
+                else:
+                    logger.warning("Octopus merge failed, merging branches one by one", branches=disjoint)
+                    await self._run_git_command("merge", "--abort", check=False)
+            
+            for branch in sequential:
+                try:
+                    # Attempt merge
+                    result = await self._run_git_command("merge", "--no-edit", branch, check=False)
                     
-                    if plan.strategy.conflict_resolution == "auto":
-                        resolved = await self._auto_resolve_conflicts(conflict_files)
-                        if resolved:
-                            conflicts_resolved.extend(conflict_files)
-                            await self._run_git_command("add .")
-                            await self._run_git_command(f'commit -m "Auto-resolve conflicts from {branch}"')
-                        else:
-                            manual_conflicts.extend(conflict_files)
-                    elif plan.strategy.conflict_resolution == "ai_assisted":
-                        resolved = await self._ai_resolve_conflicts(conflict_files)
-                        if resolved:
-                            conflicts_resolved.extend(conflict_files)
+                    if result.returncode != 0:
+                        # Handle conflicts
+                        conflict_files = await self._detect_merge_conflicts()
+                        
+                        if plan.strategy.conflict_resolution == "auto":
+                            resolved = await self._auto_resolve_conflicts(conflict_files)
+                            if resolved:
+                                conflicts_resolved.extend(conflict_files)
+                                await self._run_git_command("add", ".")
+                                await self._run_git_command("commit", "-m", f"Auto-resolve conflicts from {branch}")
+                        elif plan.strategy.conflict_resolution == "ai_assisted":
+                            resolved = await self._ai_resolve_conflicts(conflict_files)
+                            if resolved:
+                                conflicts_resolved.extend(conflict_files)
                         else:
-                            manual_conflicts.extend(conflict_files)
-                    else:
-                        manual_conflicts.extend(conflict_files)
+                            resolved = False
                         
-            except Exception as e:
-                logger.error("Branch merge failed", branch=branch, error=str(e))
-                manual_conflicts.append(f"{branch}: {str(e)}")
+                        if not resolved:
+                            manual_conflicts.extend(conflict_files)
+                            failed_branches.append(branch)
+                            await self._run_git_command("merge", "--abort", check=False)
+                
+                except Exception as e:
+                    logger.error("Branch merge failed", branch=branch, error=str(e))
+                    manual_conflicts.append(f"{branch}: {str(e)}")
+                    failed_branches.append(branch)
+                    await self._run_git_command("merge", "--abort", check=False)
+        
+        logger.info(
+            "Agent branches merged",
+            octopus_merged=len(octopus_merged),
+            sequentially_merged=len(sequential) - len(failed_branches),
+            failed=len(failed_branches)
+        )
         
-        return conflicts_resolved, manual_conflicts
+        return conflicts_resolved, manual_conflicts, failed_branches
     
     async def _ai_resolve_conflicts(self, conflict_files: List[str]) -> bool:
         """Use AI to resolve merge conflicts."""
@@ -499,8 +722,8 @@ class CoordinatorAgent(BaseAgent):
             # Analyze conflicts
             conflict_content = {}
             for file_path in conflict_files:
-                if Path(file_path).exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                if (self.project_path / file_path).exists():
+                    with open(self.project_path / file_path, 'r', encoding='utf-8') as f:
                         conflict_content[file_path] = f.read()
             
             # Let reviewer resolve conflicts
@@ -516,11 +739,12 @@ class CoordinatorAgent(BaseAgent):
             if result.success and "resolved_files" in result.result:
                 # Apply resolutions
                 for file_path, content in result.result["resolved_files"].items():
-                    with open(file_path, 'w', encoding='utf-8') as f:
+                    with open(self.project_path / file_path, 'w', encoding='utf-8') as f:
                         f.write(content)
                 
-                await self._run_git_command("add .")
-                await self._run_git_command('commit -m "AI-assisted conflict resolution"')
+                async with self.git.exclusive():
+                    await self._run_git_command("add", ".")
+                    await self._run_git_command("commit", "-m", "AI-assisted conflict resolution")
                 return True
             
         except Exception as e:
@@ -535,8 +759,8 @@ class CoordinatorAgent(BaseAgent):
         
         try:
             for file_path in conflict_files:
-                if Path(file_path).exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                if (self.project_path / file_path).exists():
+                    with open(self.project_path / file_path, 'r', encoding='utf-8') as f:
                         content = f.read()
                     
                     # Simple strategy: take both sides and remove conflict markers
@@ -544,7 +768,7 @@ class CoordinatorAgent(BaseAgent):
                     resolved_content = resolved_content.replace('=======\n', '\n# --- Merged content ---\n')
                     resolved_content = resolved_content.replace('>>>>>>> ', '# From branch: ')
                     
-                    with open(file_path, 'w', encoding='utf-8') as f:
+                    with open(self.project_path / file_path, 'w', encoding='utf-8') as f:
                         f.write(resolved_content)
             
             return True
@@ -556,13 +780,16 @@ class CoordinatorAgent(BaseAgent):
     async def _detect_merge_conflicts(self) -> List[str]:
         """Detect files with merge conflicts."""
         
-        result = await self._run_git_command("diff --name-only --diff-filter=U", check=False)
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip().split('\n')
-        return []
+        return await self.git.changed_files("--diff-filter=U")
     
-    async def _commit_agent_work(self, agent_type: str, task_description: str):
-        """Commit an agent's work."""
+    async def _commit_agent_work(
+        self,
+        agent_type: str,
+        task_description: str,
+        git: Optional[GitRepository] = None
+    ):
+        """Commit an agent's work, in the given worktree or the project."""
+        git = git or self.git
         
         commit_message = f"""
 {agent_type}: {task_description}
@@ -574,15 +801,20 @@ Generated with ForgeFlow CoordinatorAgent
 Co-Authored-By: {agent_type.title()}Agent <{agent_type}@forgeflow.ai>
         """.strip()
         
-        await self._run_git_command("add .")
-        await self._run_git_command(f'commit -m "{commit_message}"')
+        async with git.exclusive():
+            await git.run("add", ".")
+            status = await git.run("status", "--porcelain")
+            if not status.stdout.strip():
+                logger.debug("Agent left no changes to commit", agent_type=agent_type)
+                return
+            await git.run("commit", "-m", commit_message)
     
     async def _create_github_pr(self, result: CoordinationResult, plan: CoordinationPlan) -> Optional[str]:
         """Create GitHub PR using GitHub CLI."""
         
         try:
             # Check if gh CLI is available
-            await self._run_git_command("gh --version")
+            await self._run_gh_command("--version")
             
             # Create PR
             pr_title = f"feat: {plan.feature_brief}"
@@ -605,8 +837,12 @@ Co-Authored-By: {agent_type.title()}Agent <{agent_type}@forgeflow.ai>
 Generated with ForgeFlow Multi-Agent Coordination
             """.strip()
             
-            gh_result = await self._run_git_command(
-                f'gh pr create --title "{pr_title}" --body "{pr_body}" --base {plan.base_branch} --head {result.feature_branch}'
+            gh_result = await self._run_gh_command(
+                "pr", "create",
+                "--title", pr_title,
+                "--body", pr_body,
+                "--base", plan.base_branch,
+                "--head", result.feature_branch
             )
             
             if gh_result.returncode == 0:
@@ -617,37 +853,6 @@ Generated with ForgeFlow Multi-Agent Coordination
         
         return None
     
-    async def _sort_assignments_by_dependencies(self, assignments: List[AgentAssignment]) -> List[AgentAssignment]:
-        """Sort assignments by dependencies and priority."""
-        
-        # Simple topological sort by dependencies
-        sorted_assignments = []
-        remaining = assignments.copy()
-        
-        while remaining:
-            # Find assignments with no unmet dependencies
-            ready = []
-            for assignment in remaining:
-                deps_met = all(
-                    any(a.agent_type == dep for a in sorted_assignments)
-                    for dep in assignment.dependencies
-                )
-                if deps_met:
-                    ready.append(assignment)
-            
-            if not ready:
-                # No dependencies, sort by priority
-                ready = [min(remaining, key=lambda a: a.priority)]
-            
-            # Sort ready assignments by priority
-            ready.sort(key=lambda a: a.priority)
-            
-            # Add first ready assignment
-            sorted_assignments.append(ready[0])
-            remaining.remove(ready[0])
-        
-        return sorted_assignments
-    
     async def _handle_handoff_point(self, current_agent: str, plan: CoordinationPlan):
         """Handle handoff point for human review."""
         
@@ -669,20 +874,18 @@ Generated with ForgeFlow Multi-Agent Coordination
         with open(handoff_file, 'w') as f:
             json.dump(handoff_data, f, indent=2)
     
-    async def _run_git_command(self, command: str, check: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command."""
-        
-        full_command = f"git {command}"
-        result = subprocess.run(
-            full_command,
-            shell=True,
-            cwd=self.project_path,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if check and result.returncode != 0:
-            raise RuntimeError(f"Git command failed: {full_command}\n{result.stderr}")
-        
-        return result
\ No newline at end of file
+    @property
+    def git(self) -> GitRepository:
+        """Async git access to the project, bounded by the current deadline."""
+        return GitRepository(self.project_path, self.deadline)
+    
+    async def _run_git_command(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a git command without blocking the event loop."""
+        return await self.git.run(*args, check=check)
+    
+    async def _run_gh_command(self, *args: str) -> subprocess.CompletedProcess:
+        """Run a GitHub CLI command."""
+        result = await run_process(("gh", *args), self.project_path, deadline=self.deadline)
+        if result.returncode != 0:
+            raise RuntimeError(f"GitHub CLI command failed: gh {' '.join(args)}\n{result.stderr}")
+        return result
@@ -0,0 +1,89 @@
+"""
+Deadline propagation for ForgeFlow agents.
+
+A Deadline is carried in AgentInput so agents and their subprocess helpers
+can bound their own waits by the time the pipeline has left, and can stop
+cooperatively when the run is cancelled.
+"""
+
+import time
+import weakref
+from typing import Optional
+
+from .exceptions import AgentCancelledError, AgentTimeoutError
+
+
+class Deadline:
+    """
+    Absolute deadline with cooperative cancellation.
+    
+    Deadlines form a tree: a child never outlives its parent, and
+    cancelling a parent cancels every child derived from it.
+    """
+    
+    def __init__(self, expires_at: Optional[float] = None, parent: Optional["Deadline"] = None):
+        if parent is not None and parent.expires_at is not None:
+            expires_at = parent.expires_at if expires_at is None else min(expires_at, parent.expires_at)
+        
+        self.expires_at = expires_at  # time.monotonic() based, None means no deadline
+        self.cancel_reason: Optional[str] = None
+        self._children: "weakref.WeakSet[Deadline]" = weakref.WeakSet()
+        
+        if parent is not None:
+            parent._children.add(self)
+            if parent.cancelled:
+                self.cancel(parent.cancel_reason)
+    
+    @classmethod
+    def after(cls, seconds: Optional[float]) -> "Deadline":
+        """Create a deadline that expires the given number of seconds from now."""
+        if seconds is None:
+            return cls()
+        return cls(time.monotonic() + seconds)
+    
+    def child(self, timeout: Optional[float] = None) -> "Deadline":
+        """Derive a child deadline, optionally tighter than this one."""
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        return Deadline(expires_at, parent=self)
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether this deadline was cancelled."""
+        return self.cancel_reason is not None
+    
+    @property
+    def expired(self) -> bool:
+        """Whether this deadline has passed."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+    
+    @property
+    def done(self) -> bool:
+        """Whether work bound by this deadline should stop."""
+        return self.cancelled or self.expired
+    
+    def remaining(self) -> Optional[float]:
+        """Seconds left before expiry (0 if cancelled), or None for no deadline."""
+        if self.cancelled:
+            return 0.0
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """Cancel this deadline and all of its children."""
+        if self.cancelled:
+            return
+        
+        self.cancel_reason = reason or "cancelled"
+        for child in list(self._children):
+            child.cancel(self.cancel_reason)
+    
+    def check(self) -> None:
+        """Raise if the deadline was cancelled or has expired."""
+        if self.cancelled:
+            raise AgentCancelledError(
+                f"Execution cancelled: {self.cancel_reason}",
+                reason=self.cancel_reason
+            )
+        if self.expired:
+            raise AgentTimeoutError("Execution deadline exceeded")
@@ -9,20 +9,30 @@ and infrastructure operations.
 import asyncio
 import json
 import os
+import shlex
+import signal
 import subprocess
+import time
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union
 from uuid import uuid4
 
 import structlog
 from pydantic import BaseModel, Field
 
 from .base import BaseAgent, AgentInput, AgentOutput, AgentCapability, create_agent_output
+from .build_cache import BuildCache
+from .command_output import (
+    DEFAULT_COMMAND_LOG_DIR, CommandResult, LineCallback, OutputCapture, RotatingLogFile, prune_logs
+)
 
 logger = structlog.get_logger()
 
+# Package managers whose scripts need "--" before arguments meant for the script
+SCRIPT_RUNNERS = ("npm", "yarn", "pnpm")
+
 
 class DeploymentEnvironment(BaseModel):
     """Deployment environment configuration."""
@@ -32,9 +42,15 @@ class DeploymentEnvironment(BaseModel):
     branch: str = Field(default="main", description="Git branch for this environment")
     build_command: str = Field(default="npm run build", description="Build command")
     test_command: Optional[str] = Field(None, description="Test command")
+    related_test_command: Optional[str] = Field(
+        None,
+        description="Command running only the tests related to the changed files appended to it; "
+                    "defaults to Jest's --findRelatedTests when the test command runs Jest"
+    )
     deploy_command: str = Field(..., description="Deployment command")
     health_check_url: Optional[str] = Field(None, description="Health check endpoint")
     requires_approval: bool = Field(default=False, description="Requires manual approval")
+    incremental: bool = Field(default=True, description="Skip builds and tests whose inputs are unchanged")
 
 
 class DeploymentPipeline(BaseModel):
@@ -86,8 +102,17 @@ class DeploymentAgent(BaseAgent):
     
     def __init__(self, config: Optional[Any] = None):
         super().__init__()
-        self.project_path = Path(".")
         self.deployment_history: List[Dict] = []
+        self._build_cache: Optional[BuildCache] = None
+        
+        # Command output capture
+        self.command_log_dir = DEFAULT_COMMAND_LOG_DIR
+        self.max_log_bytes = 10 * 1024 * 1024
+        self.max_log_files = 100
+        self.output_tail_lines = 200
+        self.max_pending_progress = 1000
+        self._progress_events: Optional[asyncio.Queue] = None
+        self._dropped_progress = 0
         
         # Default deployment environments
         self.default_environments = {
@@ -118,6 +143,11 @@ class DeploymentAgent(BaseAgent):
             )
         }
     
+    @property
+    def project_path(self) -> Path:
+        """Project checkout to build and deploy: the input's working directory."""
+        return self.working_directory
+    
     async def _execute_impl(self, agent_input: AgentInput) -> AgentOutput:
         """Execute deployment task."""
         
@@ -148,6 +178,7 @@ class DeploymentAgent(BaseAgent):
         environment = agent_input.data.get("environment", "development")
         branch = agent_input.data.get("branch")
         force_deploy = agent_input.data.get("force_deploy", False)
+        force_rebuild = agent_input.data.get("force_rebuild", False)
         
         logger.info("Starting deployment", environment=environment, branch=branch)
         
@@ -166,7 +197,7 @@ class DeploymentAgent(BaseAgent):
                     )
             
             # Build process
-            build_result = await self._execute_build(env_config)
+            build_result = await self._execute_build(env_config, force=force_rebuild)
             if not build_result["success"]:
                 return create_agent_output(
                     success=False,
@@ -233,10 +264,11 @@ class DeploymentAgent(BaseAgent):
         
         build_type = agent_input.data.get("build_type", "production")
         environment = agent_input.data.get("environment", "production")
+        force_rebuild = agent_input.data.get("force_rebuild", False)
         
         try:
             env_config = self._get_environment_config(environment)
-            build_result = await self._execute_build(env_config)
+            build_result = await self._execute_build(env_config, force=force_rebuild)
             
             return create_agent_output(
                 success=build_result["success"],
@@ -256,6 +288,7 @@ class DeploymentAgent(BaseAgent):
         
         test_type = agent_input.data.get("test_type", "all")
         environment = agent_input.data.get("environment", "development")
+        full_test_run = agent_input.data.get("full_test_run", False)
         
         try:
             env_config = self._get_environment_config(environment)
@@ -267,7 +300,7 @@ class DeploymentAgent(BaseAgent):
                     data={"error": "No test command"}
                 )
             
-            test_result = await self._execute_tests(env_config, test_type)
+            test_result = await self._execute_tests(env_config, test_type, force=full_test_run)
             
             return create_agent_output(
                 success=test_result["success"],
@@ -401,8 +434,14 @@ class DeploymentAgent(BaseAgent):
                 "error": str(e)
             }
     
-    async def _execute_build(self, env_config: DeploymentEnvironment) -> Dict[str, Any]:
-        """Execute build process."""
+    async def _execute_build(self, env_config: DeploymentEnvironment, force: bool = False) -> Dict[str, Any]:
+        """
+        Execute build process.
+        
+        Incremental builds are keyed on the hash of the project's inputs: a
+        build whose inputs were built before is skipped, or its cached
+        outputs restored, unless forced.
+        """
         
         start_time = datetime.now()
         
@@ -417,9 +456,41 @@ class DeploymentAgent(BaseAgent):
                         "logs": [install_result.stderr]
                     }
             
+            cache = self._get_build_cache() if env_config.incremental else None
+            cache_status = "disabled"
+            changed_packages: List[str] = []
+            build_key = None
+            
+            if cache:
+                files = await asyncio.to_thread(cache.snapshot)
+                packages = cache.package_hashes(files)
+                build_key = cache.build_key(env_config.build_command, packages)
+                changed_packages = cache.changed_packages(env_config.build_command, packages)
+                
+                if not force:
+                    cache_status = await asyncio.to_thread(cache.restore_build, build_key) or "miss"
+                    if cache_status != "miss":
+                        logger.info("build_cached", command=env_config.build_command,
+                                   input_hash=build_key[:12], status=cache_status)
+                        return {
+                            "success": True,
+                            "command": env_config.build_command,
+                            "duration_seconds": (datetime.now() - start_time).total_seconds(),
+                            "logs": [],
+                            "cache": cache_status,
+                            "input_hash": build_key,
+                            "changed_packages": changed_packages,
+                            "error": None
+                        }
+                else:
+                    cache_status = "forced"
+            
             # Run build command
             build_result = await self._run_command(env_config.build_command)
             
+            if build_result.returncode == 0 and cache:
+                await asyncio.to_thread(cache.store_build, env_config.build_command, build_key, packages)
+            
             duration = (datetime.now() - start_time).total_seconds()
             
             return {
@@ -427,6 +498,10 @@ class DeploymentAgent(BaseAgent):
                 "command": env_config.build_command,
                 "duration_seconds": duration,
                 "logs": [build_result.stdout, build_result.stderr],
+                "log_file": str(build_result.log_path),
+                "cache": cache_status,
+                "input_hash": build_key,
+                "changed_packages": changed_packages,
                 "error": None if build_result.returncode == 0 else "Build failed"
             }
             
@@ -437,8 +512,21 @@ class DeploymentAgent(BaseAgent):
                 "logs": []
             }
     
-    async def _execute_tests(self, env_config: DeploymentEnvironment, test_type: str = "all") -> Dict[str, Any]:
-        """Execute test suite."""
+    async def _execute_tests(
+        self,
+        env_config: DeploymentEnvironment,
+        test_type: str = "all",
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute test suite.
+        
+        Incremental runs skip the suite when no file changed since the last
+        passing run of the same command, and otherwise only run the tests
+        related to the changed files, when the test runner supports that.
+        Lockfile, configuration or deleted files, e2e runs and forced runs
+        use the full suite.
+        """
         
         start_time = datetime.now()
         
@@ -452,16 +540,50 @@ class DeploymentAgent(BaseAgent):
             elif test_type == "e2e":
                 test_command = "npm run test:e2e"
             
-            test_result = await self._run_command(test_command)
+            cache = self._get_build_cache() if env_config.incremental else None
+            run_command = test_command
+            selection = "full"
+            changed_files: Optional[List[str]] = None
+            
+            if cache:
+                files = await asyncio.to_thread(cache.snapshot)
+                if not force:
+                    changed_files = cache.test_changes(test_command, files)
+                
+                if changed_files == []:
+                    logger.info("tests_unchanged", command=test_command)
+                    return {
+                        "success": True,
+                        "command": test_command,
+                        "duration_seconds": (datetime.now() - start_time).total_seconds(),
+                        "logs": [],
+                        "test_type": test_type,
+                        "selection": "skipped",
+                        "changed_files": [],
+                        "error": None
+                    }
+                
+                related_command = self._related_test_command(env_config, test_command)
+                if changed_files and test_type != "e2e" and related_command:
+                    run_command = f"{related_command} {' '.join(map(shlex.quote, changed_files))}"
+                    selection = "related"
+            
+            test_result = await self._run_command(run_command)
+            
+            if test_result.returncode == 0 and cache:
+                await asyncio.to_thread(cache.record_tests, test_command, files)
             
             duration = (datetime.now() - start_time).total_seconds()
             
             return {
                 "success": test_result.returncode == 0,
-                "command": test_command,
+                "command": run_command,
                 "duration_seconds": duration,
                 "logs": [test_result.stdout, test_result.stderr],
+                "log_file": str(test_result.log_path),
                 "test_type": test_type,
+                "selection": selection,
+                "changed_files": changed_files,
                 "error": None if test_result.returncode == 0 else "Tests failed"
             }
             
@@ -488,6 +610,7 @@ class DeploymentAgent(BaseAgent):
                 "command": env_config.deploy_command,
                 "duration_seconds": duration,
                 "logs": [deploy_result.stdout, deploy_result.stderr],
+                "log_file": str(deploy_result.log_path),
                 "error": None if deploy_result.returncode == 0 else "Deployment failed"
             }
             
@@ -627,6 +750,54 @@ class DeploymentAgent(BaseAgent):
                 deploy_command=f"echo 'Deploy to {environment}'"
             )
     
+    def _get_build_cache(self) -> BuildCache:
+        """Build cache of the current project path."""
+        
+        if self._build_cache is None or self._build_cache.project_path != self.project_path.resolve():
+            self._build_cache = BuildCache(self.project_path)
+        return self._build_cache
+    
+    def _related_test_command(self, env_config: DeploymentEnvironment, test_command: str) -> Optional[str]:
+        """
+        Command running the tests related to the files appended to it, or
+        None when the test runner isn't known to support that.
+        """
+        if env_config.related_test_command:
+            return env_config.related_test_command
+        
+        args = shlex.split(test_command)
+        if not args:
+            return None
+        
+        runner_args = args
+        if args[0] in SCRIPT_RUNNERS:
+            script = self._package_script(args)
+            if script is None:
+                return None
+            runner_args = shlex.split(script)
+        
+        if not any(os.path.basename(arg) == "jest" for arg in runner_args):
+            return None
+        
+        separator = " --" if args[0] in SCRIPT_RUNNERS and "--" not in args else ""
+        return f"{test_command}{separator} --findRelatedTests"
+    
+    def _package_script(self, args: List[str]) -> Optional[str]:
+        """The package.json script an npm/yarn/pnpm command runs, if any."""
+        names = [arg for arg in args[1:] if not arg.startswith("-")]
+        if names and names[0] in ("run", "run-script"):
+            names = names[1:]
+        if not names:
+            return None
+        name = "test" if names[0] == "t" else names[0]
+        
+        try:
+            with open(self.project_path / "package.json") as f:
+                scripts = json.load(f).get("scripts", {})
+        except (OSError, ValueError):
+            return None
+        return scripts.get(name)
+    
     def _get_previous_successful_deployment(self, environment: str) -> Optional[Dict]:
         """Get previous successful deployment record."""
         
@@ -684,12 +855,136 @@ class DeploymentAgent(BaseAgent):
                 data={"error": str(e)}
             )
     
-    async def _run_command(self, command: str) -> subprocess.CompletedProcess:
-        """Run shell command."""
+    async def _run_command(self, command: str, on_line: Optional[LineCallback] = None) -> CommandResult:
+        """
+        Run shell command, bounded by the execution deadline.
+        
+        Output is streamed rather than buffered: the full output goes to a
+        rotating log file, only the last lines of each stream are kept in
+        the result, and every line is passed to on_line and published as a
+        progress event as it arrives. On timeout or cancellation the whole
+        process group is killed so no child processes outlive the agent.
+        """
+        
+        if self.deadline:
+            self.deadline.check()
+        
+        log_path = self.command_log_dir / f"{datetime.now():%Y%m%d-%H%M%S}-{uuid4().hex[:8]}.log"
+        prune_logs(self.command_log_dir, self.max_log_files - 1)
+        log = RotatingLogFile(log_path, max_bytes=self.max_log_bytes)
+        
+        def handle_line(stream: str, line: str):
+            if on_line:
+                on_line(stream, line)
+            self._publish_progress({"command": command, "stream": stream, "line": line})
+        
+        capture = OutputCapture(log, tail_lines=self.output_tail_lines, on_line=handle_line)
+        started = time.perf_counter()
+        
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.project_path,
+                start_new_session=True
+            )
+            
+            try:
+                returncode = await asyncio.wait_for(
+                    capture.drain(process),
+                    timeout=self.deadline.remaining() if self.deadline else None
+                )
+            except BaseException:
+                self._kill_process_group(process)
+                await process.wait()
+                logger.warning("command_killed", command=command, pid=process.pid, log_file=str(log_path))
+                raise
+        finally:
+            log.close()
+        
+        result = capture.result(command, returncode, time.perf_counter() - started)
+        logger.debug(
+            "command_completed",
+            command=command,
+            returncode=returncode,
+            duration=result.duration,
+            lines=result.line_counts,
+            log_file=str(log_path)
+        )
+        return result
+    
+    def _publish_progress(self, event: Dict[str, Any]):
+        """Queue a progress event for the running stream, if any; drops events when it lags."""
+        
+        events = self._progress_events
+        if events is None:
+            return
+        
+        if events.qsize() >= self.max_pending_progress:
+            self._dropped_progress += 1
+            return
+        events.put_nowait(event)
+    
+    @property
+    def supports_streaming(self) -> bool:
+        """Command output is streamed as partial outputs while a task runs."""
+        return True
+    
+    async def _stream_impl(self, input_data: AgentInput) -> AsyncIterator[AgentOutput]:
+        """
+        Run the task, yielding the command output lines produced since the
+        previous chunk as intermediate chunks, then the task's final output.
+        """
         
-        return await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=self.project_path
-        )
\ No newline at end of file
+        events: asyncio.Queue = asyncio.Queue()
+        self._progress_events = events
+        self._dropped_progress = 0
+        
+        task = asyncio.create_task(self._execute_impl(input_data))
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                
+                # Batch whatever else arrived meanwhile into the same chunk
+                lines = [event]
+                while not events.empty():
+                    event = events.get_nowait()
+                    if event is None:
+                        events.put_nowait(None)
+                        break
+                    lines.append(event)
+                
+                dropped, self._dropped_progress = self._dropped_progress, 0
+                yield AgentOutput(
+                    agent_execution_id=input_data.agent_execution_id,
+                    agent_type=self.agent_type,
+                    status="partial",
+                    is_chunk=True,
+                    primary_result={"output_lines": lines, "dropped_lines": dropped}
+                )
+            
+            yield await task
+        
+        finally:
+            self._progress_events = None
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+    
+    def _kill_process_group(self, process: asyncio.subprocess.Process):
+        """Kill a command's process and any children it spawned."""
+        
+        if process.returncode is not None:
+            return
+        
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        except OSError:
+            process.kill()
\ No newline at end of file
@@ -147,4 +147,17 @@ class AgentCapabilityError(AgentError):
     ):
         super().__init__(message, agent_type, **kwargs)
         self.required_capability = required_capability
-        self.available_capabilities = available_capabilities or []
\ No newline at end of file
+        self.available_capabilities = available_capabilities or []
+
+class AgentCancelledError(AgentError):
+    """Raised when agent execution is cancelled before completion."""
+    
+    def __init__(
+        self,
+        message: str,
+        agent_type: Optional[str] = None,
+        reason: Optional[str] = None,
+        **kwargs
+    ):
+        super().__init__(message, agent_type, **kwargs)
+        self.reason = reason
@@ -9,7 +9,9 @@ Provides centralized agent creation with:
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Type
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple, Type, TypeVar
 from uuid import uuid4
 from datetime import datetime
 
@@ -17,14 +19,19 @@ import structlog
 
 from .base import BaseAgent, AgentConfig, AgentInput, AgentCapability
 from .registry import get_registry, AgentRegistry
+from .performance import AgentPerformanceStats, get_performance_stats
 from .exceptions import (
     AgentNotFoundError,
     AgentConfigurationError,
-    AgentDependencyError
+    AgentDependencyError,
+    AgentTimeoutError
 )
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class AgentFactory:
     """
@@ -35,13 +42,48 @@ class AgentFactory:
     - Configuration injection
     - Resource pooling (future)
     - Health monitoring
+    
+    Bulk operations (health checks, cleanup, pipeline creation) fan out
+    concurrently, at most max_concurrency at a time. Health results are
+    cached per instance for health_cache_ttl seconds.
+    
+    Pooled instances (acquire_agent/release_agent) are version aware: once
+    an agent type is hot-reloaded, instances of the old class are no longer
+    handed out, and are destroyed when idle or as soon as they're released.
     """
     
-    def __init__(self, registry: Optional[AgentRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional[AgentRegistry] = None,
+        max_concurrency: int = 32,
+        health_check_timeout: float = 5.0,
+        health_cache_ttl: float = 10.0,
+        performance_stats: Optional[AgentPerformanceStats] = None,
+        max_pooled_per_type: int = 8
+    ):
         self.registry = registry or get_registry()
         self._active_agents: Dict[str, BaseAgent] = {}
-        self._agent_pools: Dict[str, List[BaseAgent]] = {}
+        self._active_counts: Dict[str, int] = {}
+        self._agent_pools: Dict[str, List[BaseAgent]] = {}  # Idle instances per agent type
+        self.max_pooled_per_type = max_pooled_per_type
         self._default_configs: Dict[str, AgentConfig] = {}
+        
+        # Bulk operation limits and health caching
+        self.max_concurrency = max_concurrency
+        self.health_check_timeout = health_check_timeout
+        self.health_cache_ttl = health_cache_ttl
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        
+        # Execution statistics fed by the pipeline executor, for agent selection
+        self.performance_stats = performance_stats or get_performance_stats()
+        
+        # Statistics
+        self.health_stats = {
+            'checks': 0,
+            'cache_hits': 0,
+            'timeouts': 0,
+            'failures': 0
+        }
     
     def set_default_config(self, agent_type: str, config: AgentConfig) -> None:
         """Set default configuration for an agent type."""
@@ -94,12 +136,13 @@ class AgentFactory:
             
             # Track active agent
             self._active_agents[agent.instance_id] = agent
+            self._active_counts[agent_type] = self._active_counts.get(agent_type, 0) + 1
             
             logger.info(
                 "agent_created",
                 agent_type=agent_type,
                 instance_id=agent.instance_id,
-                config=config.model_dump()
+                config_overrides=sorted(config.model_fields_set)
             )
             
             return agent
@@ -144,7 +187,7 @@ class AgentFactory:
         """Initialize agent with resources and health check."""
         try:
             # Perform health check
-            health = await agent.health_check()
+            health = await self._check_health(agent, use_cache=False)
             if health.get("status") != "healthy":
                 raise AgentConfigurationError(
                     f"Agent health check failed: {health}",
@@ -166,6 +209,53 @@ class AgentFactory:
             )
             raise
     
+    async def _check_health(self, agent: BaseAgent, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Health check an agent, bounded by health_check_timeout.
+        
+        Returns a cached result younger than health_cache_ttl when
+        use_cache is set. Failures and timeouts are reported (and cached)
+        as an "error" status rather than raised.
+        """
+        instance_id = agent.instance_id
+        now = time.monotonic()
+        
+        if use_cache:
+            cached = self._health_cache.get(instance_id)
+            if cached is not None and cached[0] > now:
+                self.health_stats['cache_hits'] += 1
+                return cached[1]
+        
+        self.health_stats['checks'] += 1
+        try:
+            health = await asyncio.wait_for(agent.health_check(), timeout=self.health_check_timeout)
+        except asyncio.TimeoutError:
+            self.health_stats['timeouts'] += 1
+            error = AgentTimeoutError(
+                f"Health check timed out after {self.health_check_timeout}s",
+                agent_type=agent.agent_type,
+                timeout_seconds=self.health_check_timeout
+            )
+            health = {"status": "error", "error": str(error), "agent_type": agent.agent_type}
+        except Exception as e:
+            self.health_stats['failures'] += 1
+            health = {"status": "error", "error": str(e), "agent_type": agent.agent_type}
+        
+        # Only cache tracked agents, so destroyed ones don't linger
+        if instance_id in self._active_agents:
+            self._health_cache[instance_id] = (time.monotonic() + self.health_cache_ttl, health)
+        return health
+    
+    async def _fan_out(self, items: List[T], call: Callable[[T], Awaitable[R]]) -> List[R]:
+        """Run call over items concurrently, at most max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def bounded(item: T) -> R:
+            async with semaphore:
+                return await call(item)
+        
+        return await asyncio.gather(*(bounded(item) for item in items))
+    
     async def get_agent(self, instance_id: str) -> Optional[BaseAgent]:
         """Get an active agent by instance ID."""
         return self._active_agents.get(instance_id)
@@ -181,7 +271,12 @@ class AgentFactory:
             await agent.cleanup()
             
             # Remove from tracking
+            pool = self._agent_pools.get(agent.agent_type)
+            if pool and agent in pool:
+                pool.remove(agent)
             del self._active_agents[instance_id]
+            self._active_counts[agent.agent_type] -= 1
+            self._health_cache.pop(instance_id, None)
             
             logger.info(
                 "agent_destroyed",
@@ -199,38 +294,89 @@ class AgentFactory:
             )
             return False
     
-    async def list_active_agents(self) -> List[Dict[str, Any]]:
+    def _is_stale(self, agent: BaseAgent) -> bool:
+        """Whether an instance's class was replaced or unregistered since it was created."""
+        return not self.registry.is_current(type(agent), agent.agent_type)
+    
+    async def acquire_agent(self, agent_type: str) -> BaseAgent:
+        """
+        Take an idle pooled instance of the current agent version, or
+        create one with the default configuration.
+        """
+        pool = self._agent_pools.get(agent_type)
+        while pool:
+            agent = pool.pop()
+            if not self._is_stale(agent):
+                return agent
+            await self.destroy_agent(agent.instance_id)
+        
+        return await self.create_agent(agent_type)
+    
+    async def release_agent(self, agent: BaseAgent) -> None:
+        """Return an acquired instance to its pool; stale or surplus instances are destroyed."""
+        pool = self._agent_pools.setdefault(agent.agent_type, [])
+        
+        if (
+            agent.instance_id not in self._active_agents
+            or self._is_stale(agent)
+            or len(pool) >= self.max_pooled_per_type
+        ):
+            await self.destroy_agent(agent.instance_id)
+            return
+        
+        pool.append(agent)
+    
+    async def evict_stale_agents(self) -> int:
+        """
+        Destroy idle pooled instances of replaced agent versions. Stale
+        instances still in use are destroyed when released.
+        """
+        stale = [
+            agent.instance_id
+            for pool in self._agent_pools.values()
+            for agent in pool
+            if self._is_stale(agent)
+        ]
+        evicted = sum(await self._fan_out(stale, self.destroy_agent))
+        
+        if evicted:
+            logger.info("stale_agents_evicted", count=evicted)
+        return evicted
+    
+    async def list_active_agents(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """List all active agent instances."""
+        active = list(self._active_agents.items())
+        healths = await self._fan_out(
+            [agent for _, agent in active],
+            lambda agent: self._check_health(agent, use_cache)
+        )
+        
         agents = []
-        for instance_id, agent in self._active_agents.items():
-            try:
-                health = await agent.health_check()
+        for (instance_id, agent), health in zip(active, healths):
+            if health.get("status") == "error":
                 agents.append({
                     "instance_id": instance_id,
                     "agent_type": agent.agent_type,
-                    "version": agent.version,
-                    "status": health.get("status", "unknown"),
-                    "capabilities": [cap.value for cap in agent.capabilities],
-                    "created_at": getattr(agent, "created_at", None)
+                    "status": "error",
+                    "error": health.get("error")
                 })
-            except Exception as e:
+            else:
                 agents.append({
                     "instance_id": instance_id,
                     "agent_type": agent.agent_type,
-                    "status": "error",
-                    "error": str(e)
+                    "version": agent.version,
+                    "status": health.get("status", "unknown"),
+                    "capabilities": [cap.value for cap in agent.capabilities],
+                    "created_at": getattr(agent, "created_at", None)
                 })
         
         return agents
     
     async def cleanup_all(self) -> int:
         """Cleanup all active agents."""
-        cleanup_count = 0
         instance_ids = list(self._active_agents.keys())
-        
-        for instance_id in instance_ids:
-            if await self.destroy_agent(instance_id):
-                cleanup_count += 1
+        destroyed = await self._fan_out(instance_ids, self.destroy_agent)
+        cleanup_count = sum(destroyed)
         
         logger.info("all_agents_cleaned_up", count=cleanup_count)
         return cleanup_count
@@ -238,7 +384,8 @@ class AgentFactory:
     async def create_pipeline_agents(
         self,
         required_capabilities: List[AgentCapability],
-        config_overrides: Optional[Dict[str, AgentConfig]] = None
+        config_overrides: Optional[Dict[str, AgentConfig]] = None,
+        selection_strategy: str = "performance"
     ) -> Dict[AgentCapability, BaseAgent]:
         """
         Create agents for a complete pipeline based on required capabilities.
@@ -246,6 +393,7 @@ class AgentFactory:
         Args:
             required_capabilities: List of capabilities needed for the pipeline
             config_overrides: Optional configuration overrides per agent type
+            selection_strategy: Strategy for choosing among capable agents
             
         Returns:
             Dictionary mapping capabilities to agent instances
@@ -255,49 +403,49 @@ class AgentFactory:
         # Find agents for each capability
         capability_agents = self.registry.find_agents_for_pipeline(required_capabilities)
         
-        # Create agent instances
-        pipeline_agents = {}
-        created_agents = []
-        
-        try:
-            for capability, agent_types in capability_agents.items():
-                # Select best agent based on strategy
-                agent_type = await self._select_best_agent(
-                    agent_types, 
-                    capability,
-                    selection_strategy
-                )
-                
-                # Get configuration
-                config = config_overrides.get(agent_type, None)
-                
-                # Create agent
-                agent = await self.create_agent(agent_type, config)
-                pipeline_agents[capability] = agent
-                created_agents.append(agent)
-            
-            logger.info(
-                "pipeline_agents_created",
-                capabilities=[cap.value for cap in required_capabilities],
-                agents=[agent.agent_type for agent in created_agents]
+        # Select best agent for each capability based on strategy
+        selections = []
+        for capability, agent_types in capability_agents.items():
+            agent_type = await self._select_best_agent(
+                agent_types,
+                capability,
+                selection_strategy
             )
-            
-            return pipeline_agents
-            
-        except Exception as e:
+            selections.append((capability, agent_type))
+        
+        # Create agent instances concurrently
+        async def create(selection: Tuple[AgentCapability, str]) -> Any:
+            agent_type = selection[1]
+            try:
+                return await self.create_agent(agent_type, config_overrides.get(agent_type, None))
+            except Exception as e:
+                return e
+        
+        results = await self._fan_out(selections, create)
+        created_agents = [result for result in results if isinstance(result, BaseAgent)]
+        errors = [result for result in results if not isinstance(result, BaseAgent)]
+        
+        if errors:
             # Cleanup any created agents on failure
-            for agent in created_agents:
-                try:
-                    await self.destroy_agent(agent.instance_id)
-                except:
-                    pass
+            await self._fan_out(
+                [agent.instance_id for agent in created_agents],
+                self.destroy_agent
+            )
             
             logger.error(
                 "pipeline_creation_failed",
                 capabilities=[cap.value for cap in required_capabilities],
-                error=str(e)
+                error=str(errors[0])
             )
-            raise
+            raise errors[0]
+        
+        logger.info(
+            "pipeline_agents_created",
+            capabilities=[cap.value for cap in required_capabilities],
+            agents=[agent.agent_type for agent in created_agents]
+        )
+        
+        return {capability: agent for (capability, _), agent in zip(selections, results)}
     
     async def _select_best_agent(
         self,
@@ -312,7 +460,7 @@ class AgentFactory:
         - "first": Use first available (simplest)
         - "random": Random selection
         - "performance": Based on historical performance metrics
-        - "load": Based on current load/resource usage
+        - "load": Less loaded of two random candidates (power of two choices)
         - "version": Prefer newest version
         - "reliability": Based on success rate
         """
@@ -328,7 +476,6 @@ class AgentFactory:
             return agent_types[0]
         
         elif strategy == "random":
-            import random
             return random.choice(agent_types)
         
         elif strategy == "performance":
@@ -345,17 +492,9 @@ class AgentFactory:
             return best_agent or agent_types[0]
         
         elif strategy == "load":
-            # Select based on current load
-            least_loaded = None
-            min_load = float('inf')
-            
-            for agent_type in agent_types:
-                load = self._get_agent_load(agent_type)
-                if load < min_load:
-                    min_load = load
-                    least_loaded = agent_type
-            
-            return least_loaded or agent_types[0]
+            # Power of two choices: near-optimal balance without scanning every candidate
+            first, second = random.sample(agent_types, 2)
+            return first if self._get_agent_load(first) <= self._get_agent_load(second) else second
         
         elif strategy == "version":
             # Select newest version
@@ -363,9 +502,7 @@ class AgentFactory:
             newest_version = None
             
             for agent_type in agent_types:
-                agent_class = self._registry.get_agent_class(agent_type)
-                agent = agent_class()
-                version = agent.version
+                version = self.registry.get_agent_info(agent_type)["version"]
                 
                 if newest_version is None or self._compare_versions(version, newest_version) > 0:
                     newest_version = version
@@ -398,40 +535,29 @@ class AgentFactory:
     def _get_agent_performance_score(self, agent_type: str) -> float:
         """Get performance score for an agent type."""
         # Check if we have metrics for this agent
-        if agent_type not in self._agent_metrics:
+        metrics = self.performance_stats.get(agent_type)
+        if metrics is None or not metrics.executions:
             return 0.5  # Default neutral score
         
-        metrics = self._agent_metrics[agent_type]
-        
-        # Calculate composite score
-        success_rate = metrics.get("success_rate", 0.5)
-        avg_duration = metrics.get("avg_duration", 100)
-        
         # Normalize duration (lower is better)
-        duration_score = max(0, 1 - (avg_duration / 300))  # 5 minutes max
+        duration_score = max(0, 1 - (metrics.avg_duration / 300))  # 5 minutes max
         
         # Composite score (70% success rate, 30% speed)
-        return (success_rate * 0.7) + (duration_score * 0.3)
+        return (metrics.success_rate * 0.7) + (duration_score * 0.3)
     
     def _get_agent_load(self, agent_type: str) -> int:
-        """Get current load for an agent type."""
-        # Count active instances of this type
-        count = 0
-        for agent in self._active_agents.values():
-            if agent.agent_type == agent_type:
-                count += 1
-        return count
+        """Get current load for an agent type: live instances plus running executions."""
+        return self._active_counts.get(agent_type, 0) + self.performance_stats.get_active(agent_type)
     
     def _get_agent_reliability(self, agent_type: str) -> float:
         """Get reliability score for an agent type."""
-        if agent_type not in self._agent_metrics:
+        metrics = self.performance_stats.get(agent_type)
+        if metrics is None or not metrics.executions:
             return 0.5  # Default neutral score
         
-        metrics = self._agent_metrics[agent_type]
-        
         # Reliability based on success rate and failure count
-        success_rate = metrics.get("success_rate", 0.5)
-        failure_count = metrics.get("failure_count", 0)
+        success_rate = metrics.success_rate
+        failure_count = metrics.failure_count
         
         # Penalize high failure counts
         penalty = min(0.3, failure_count * 0.01)
@@ -447,30 +573,24 @@ class AgentFactory:
             # Fallback to string comparison
             return 1 if v1 > v2 else -1 if v1 < v2 else 0
     
-    async def health_check_all(self) -> Dict[str, Any]:
+    async def health_check_all(self, use_cache: bool = True) -> Dict[str, Any]:
         """Perform health check on all active agents."""
-        results = {}
-        healthy_count = 0
-        total_count = len(self._active_agents)
+        active = list(self._active_agents.items())
+        healths = await self._fan_out(
+            [agent for _, agent in active],
+            lambda agent: self._check_health(agent, use_cache)
+        )
         
-        for instance_id, agent in self._active_agents.items():
-            try:
-                health = await agent.health_check()
-                results[instance_id] = health
-                if health.get("status") == "healthy":
-                    healthy_count += 1
-            except Exception as e:
-                results[instance_id] = {
-                    "status": "error",
-                    "error": str(e),
-                    "agent_type": agent.agent_type
-                }
+        results = {instance_id: health for (instance_id, _), health in zip(active, healths)}
+        healthy_count = sum(1 for health in healths if health.get("status") == "healthy")
+        total_count = len(active)
         
         return {
             "total_agents": total_count,
             "healthy_agents": healthy_count,
             "health_percentage": (healthy_count / total_count * 100) if total_count > 0 else 100,
             "agents": results,
+            "check_stats": dict(self.health_stats),
             "timestamp": datetime.utcnow().isoformat()
         }
 
@@ -0,0 +1,200 @@
+"""
+Async Git Layer for ForgeFlow
+
+Runs git without blocking the event loop: commands are spawned with
+asyncio.create_subprocess_exec (argv lists, never a shell), so quoting of
+branch names and commit messages is not an issue.
+
+Commands that touch the working tree, the index or refs take a per-repo
+lock, shared by every GitRepository on the same path in the same event
+loop, because concurrent git processes on one repository fail on
+index.lock. A task can hold the lock across several commands (exclusive())
+and re-enter it. Read-only commands don't lock. Locks are held weakly and
+go away with the last task using them or with their loop.
+
+Branches are created and deleted with plumbing (update-ref --stdin) in a
+single ref transaction instead of one checkout per branch.
+"""
+
+import asyncio
+import subprocess
+import weakref
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Union
+
+import structlog
+
+from .deadline import Deadline
+
+logger = structlog.get_logger()
+
+
+async def run_process(
+    argv: Sequence[str],
+    cwd: Union[str, Path],
+    input: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> subprocess.CompletedProcess:
+    """
+    Run a process asynchronously and capture its output.
+    
+    Bounded by the deadline, if any: the process is killed and
+    subprocess.TimeoutExpired raised when it runs out.
+    """
+    if deadline:
+        deadline.check()
+    
+    process = await asyncio.create_subprocess_exec(
+        *argv,
+        cwd=str(cwd),
+        stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    
+    timeout = deadline.remaining() if deadline else None
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(input.encode() if input is not None else None),
+            timeout=timeout
+        )
+    except BaseException as e:
+        # Don't leave the process running on timeout or cancellation
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        if isinstance(e, asyncio.TimeoutError):
+            raise subprocess.TimeoutExpired(list(argv), timeout) from e
+        raise
+    
+    return subprocess.CompletedProcess(
+        args=list(argv),
+        returncode=process.returncode,
+        stdout=stdout.decode(errors="replace"),
+        stderr=stderr.decode(errors="replace")
+    )
+
+
+class _RepoLock:
+    """Per-repository lock that the owning task can re-enter."""
+    
+    __slots__ = ('lock', 'owner', '__weakref__')
+    
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.owner: Optional[asyncio.Task] = None
+
+
+# asyncio locks are bound to their loop: one table of repository locks per loop
+_repo_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakValueDictionary]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_repo_lock(path: Path) -> _RepoLock:
+    """The lock of a repository in the running event loop."""
+    loop = asyncio.get_running_loop()
+    locks = _repo_locks.get(loop)
+    if locks is None:
+        locks = _repo_locks[loop] = weakref.WeakValueDictionary()
+    
+    lock = locks.get(path)
+    if lock is None:
+        lock = locks[path] = _RepoLock()
+    return lock
+
+
+class GitRepository:
+    """
+    Async git operations on one repository.
+    
+    Mutating commands are serialized per repository; use exclusive() to
+    keep a sequence of commands (e.g. merge + add + commit) together.
+    """
+    
+    def __init__(self, path: Union[str, Path], deadline: Optional[Deadline] = None):
+        self.path = Path(path).resolve()
+        self.deadline = deadline
+    
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """Hold the repository lock across several commands."""
+        repo_lock = _get_repo_lock(self.path)
+        task = asyncio.current_task()
+        if repo_lock.owner is task:
+            yield
+            return
+        
+        async with repo_lock.lock:
+            repo_lock.owner = task
+            try:
+                yield
+            finally:
+                repo_lock.owner = None
+    
+    async def run(
+        self,
+        *args: str,
+        check: bool = True,
+        input: Optional[str] = None,
+        exclusive: bool = True
+    ) -> subprocess.CompletedProcess:
+        """
+        Run a git command. Raises RuntimeError on failure when check is set.
+        
+        exclusive=False skips the repository lock, for read-only commands.
+        """
+        if exclusive:
+            async with self.exclusive():
+                result = await run_process(("git", *args), self.path, input, self.deadline)
+        else:
+            result = await run_process(("git", *args), self.path, input, self.deadline)
+        
+        if check and result.returncode != 0:
+            raise RuntimeError(f"Git command failed: git {' '.join(args)}\n{result.stderr}")
+        
+        return result
+    
+    async def rev_parse(self, ref: str) -> str:
+        """Resolve a ref to a commit id."""
+        result = await self.run("rev-parse", "--verify", f"{ref}^{{commit}}", exclusive=False)
+        return result.stdout.strip()
+    
+    async def update_refs(self, commands: Iterable[str]) -> None:
+        """
+        Apply update-ref --stdin commands (create/update/delete/verify) as
+        one atomic ref transaction.
+        """
+        lines = list(commands)
+        if lines:
+            await self.run("update-ref", "--stdin", input="".join(f"{line}\n" for line in lines))
+    
+    async def create_branches(self, branch_names: Iterable[str], start_point: str) -> str:
+        """
+        Create branches at start_point without touching the working tree.
+        
+        All branches are created in one transaction; it fails (creating
+        none) if any already exists. Returns the start point's commit id.
+        """
+        commit = await self.rev_parse(start_point)
+        await self.update_refs(f"create refs/heads/{name} {commit}" for name in branch_names)
+        
+        logger.debug("git_branches_created", start_point=start_point, commit=commit)
+        return commit
+    
+    async def delete_branches(self, branch_names: Iterable[str]) -> None:
+        """Delete branches in one ref transaction."""
+        await self.update_refs(f"delete refs/heads/{name}" for name in branch_names)
+    
+    async def current_branch(self) -> str:
+        """Name of the checked out branch."""
+        result = await self.run("symbolic-ref", "--short", "HEAD", exclusive=False)
+        return result.stdout.strip()
+    
+    async def changed_files(self, *args: str) -> List[str]:
+        """Paths listed by git diff --name-only with the given arguments."""
+        result = await self.run("diff", "--name-only", *args, check=False, exclusive=False)
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip().split('\n')
+        return []
@@ -0,0 +1,24 @@
+"""
+Agent Manifest for ForgeFlow
+
+Static map of built-in agent types to the "module:Class" that implements
+them. The registry resolves an entry (importing its module) the first time
+the agent type is used, so importing the agents package never imports or
+instantiates agent modules. Agent metadata (version, description,
+capabilities) is declared as class attributes on the agent classes.
+
+Relative module paths are resolved against the agents package.
+"""
+
+from typing import Dict
+
+AGENT_MANIFEST: Dict[str, str] = {
+    "planner": ".planner:PlannerAgent",
+    "architect": ".architect:ArchitectAgent",
+    "coder": ".coder:CoderAgent",
+    "tester": ".tester:TesterAgent",
+    "reviewer": ".reviewer:ReviewerAgent",
+    "antihallucination": ".antihallucination:AntiHallucinationAgent",
+    "coordinator": ".coordinator:CoordinatorAgent",
+    "deployment": ".deployment:DeploymentAgent",
+}
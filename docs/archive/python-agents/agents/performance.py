@@ -0,0 +1,117 @@
+"""
+Agent Performance Statistics for ForgeFlow
+
+Online per-agent-type statistics shared between the pipeline executor,
+which records every attempt, and the AgentFactory, which uses them to
+choose between agents providing the same capability.
+
+Success rate and duration are exponentially weighted moving averages, so
+recent behaviour outweighs old history. Active execution counts are
+maintained incrementally. Every lookup is O(1).
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from .exceptions import AgentCancelledError
+
+
+class AgentTypeStats:
+    """Decayed performance figures of one agent type."""
+    
+    __slots__ = ('success_rate', 'avg_duration', 'executions', 'failure_count', 'active')
+    
+    def __init__(self):
+        self.success_rate = 0.0
+        self.avg_duration = 0.0  # in seconds
+        self.executions = 0
+        self.failure_count = 0
+        self.active = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'success_rate': self.success_rate,
+            'avg_duration': self.avg_duration,
+            'executions': self.executions,
+            'failure_count': self.failure_count,
+            'active': self.active
+        }
+
+
+class AgentPerformanceStats:
+    """
+    Per-agent-type EWMA success rate and latency plus active counters.
+    
+    alpha is the weight of each new observation; the first observation
+    of a type seeds its averages.
+    """
+    
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self._stats: Dict[str, AgentTypeStats] = {}
+    
+    def get(self, agent_type: str) -> Optional[AgentTypeStats]:
+        """Statistics of an agent type, or None if it was never seen."""
+        return self._stats.get(agent_type)
+    
+    def _get_or_create(self, agent_type: str) -> AgentTypeStats:
+        stats = self._stats.get(agent_type)
+        if stats is None:
+            stats = self._stats[agent_type] = AgentTypeStats()
+        return stats
+    
+    def record(self, agent_type: str, success: bool, duration: float) -> None:
+        """Fold one finished attempt into the averages."""
+        stats = self._get_or_create(agent_type)
+        outcome = 1.0 if success else 0.0
+        
+        if stats.executions == 0:
+            stats.success_rate = outcome
+            stats.avg_duration = duration
+        else:
+            stats.success_rate += self.alpha * (outcome - stats.success_rate)
+            stats.avg_duration += self.alpha * (duration - stats.avg_duration)
+        
+        stats.executions += 1
+        if not success:
+            stats.failure_count += 1
+    
+    def get_active(self, agent_type: str) -> int:
+        """Number of attempts of an agent type currently running."""
+        stats = self._stats.get(agent_type)
+        return stats.active if stats else 0
+    
+    @contextmanager
+    def track(self, agent_type: str) -> Iterator[None]:
+        """
+        Count an attempt as active while the block runs and record its
+        outcome and duration. Cancelled attempts aren't recorded.
+        """
+        stats = self._get_or_create(agent_type)
+        stats.active += 1
+        started = time.perf_counter()
+        try:
+            yield
+        except AgentCancelledError:
+            raise
+        except Exception:
+            self.record(agent_type, False, time.perf_counter() - started)
+            raise
+        else:
+            self.record(agent_type, True, time.perf_counter() - started)
+        finally:
+            stats.active -= 1
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get per-agent-type performance statistics."""
+        return {agent_type: stats.to_dict() for agent_type, stats in self._stats.items()}
+
+
+# Global statistics instance, fed by the executor and read by the factory
+_global_performance_stats = AgentPerformanceStats()
+
+
+def get_performance_stats() -> AgentPerformanceStats:
+    """Get the global agent performance statistics."""
+    return _global_performance_stats
@@ -4,7 +4,7 @@ Planner Agent for FibreFlow_React
 Handles project planning and task breakdown
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,14 @@ from .base import BaseAgent, AgentCapability
 class PlannerAgent(BaseAgent):
     """Agent responsible for project planning and task breakdown."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="planner",
-            version="1.0.0",
-            description="Strategic planning and task decomposition agent",
-            capabilities=[
-                AgentCapability.ANALYSIS,
-                AgentCapability.REASONING,
-                AgentCapability.PROJECT_MANAGEMENT,
-                AgentCapability.ORCHESTRATION
-            ]
-        )
+    agent_type: str = "planner"
+    version: str = "1.0.0"
+    description: str = "Strategic planning and task decomposition agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.PLANNING,
+        AgentCapability.PROJECT_MANAGEMENT,
+        AgentCapability.ORCHESTRATION
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute planning task."""
@@ -6,23 +6,116 @@ Provides dynamic agent discovery and registration system supporting:
 - Runtime agent discovery
 - Capability-based agent selection
 - Hot-reloading of agent modules
+- Lazy loading of agents listed in the static manifest
+
+The registry's contents live in an immutable snapshot. Writers build a new
+snapshot under a lock and swap it in; readers just read the current one,
+so lookups on the execution hot path never take a lock.
+
+Every registration of an agent type gets a new revision number. Reloading
+an agent swaps its class in atomically; code that already resolved the
+old class (running executions, pooled instances) keeps using it.
 """
 
 import importlib
 import inspect
 import pkgutil
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Type, Any
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Type, Any
 from threading import Lock
 
 import structlog
 
 from .base import BaseAgent, AgentCapability
-from .exceptions import AgentNotFoundError, AgentCapabilityError
+from .exceptions import AgentNotFoundError, AgentCapabilityError, AgentConfigurationError
+from .manifest import AGENT_MANIFEST
 
 logger = structlog.get_logger()
 
 
+# One bit per capability, so capability sets are plain ints
+CAPABILITY_BITS: Dict[AgentCapability, int] = {
+    capability: 1 << index for index, capability in enumerate(AgentCapability)
+}
+
+
+def capability_mask(capabilities: Iterable[AgentCapability]) -> int:
+    """Encode capabilities as a bitmask."""
+    mask = 0
+    for capability in capabilities:
+        mask |= CAPABILITY_BITS[capability]
+    return mask
+
+
+def mask_capabilities(mask: int) -> Set[AgentCapability]:
+    """Decode a capability bitmask."""
+    return {capability for capability, bit in CAPABILITY_BITS.items() if mask & bit}
+
+
+class _RegistrySnapshot:
+    """Immutable registry contents; replaced on every change, never mutated."""
+    
+    __slots__ = ('classes', 'metadata', 'lazy', 'agent_types', 'masks', 'agents')
+    
+    def __init__(
+        self,
+        registry: "AgentRegistry",
+        classes: Dict[str, Type[BaseAgent]],
+        metadata: Dict[str, Dict[str, Any]],
+        lazy: Dict[str, str]
+    ):
+        self.classes: Mapping[str, Type[BaseAgent]] = MappingProxyType(classes)
+        self.metadata: Mapping[str, Dict[str, Any]] = MappingProxyType(metadata)
+        self.lazy: Mapping[str, str] = MappingProxyType(lazy)
+        
+        # Parallel arrays for capability queries
+        self.agent_types: Tuple[str, ...] = tuple(classes)
+        self.masks: Tuple[int, ...] = tuple(
+            capability_mask(metadata[agent_type]['capabilities']) for agent_type in self.agent_types
+        )
+        
+        self.agents = AgentClassView(registry, self)
+
+
+class AgentClassView(Mapping):
+    """
+    Read-only agent type -> class mapping over one registry snapshot.
+    
+    Includes lazily registered agents, which are loaded when accessed.
+    The view is bound to its snapshot, so its identity changes whenever
+    the registry does.
+    """
+    
+    __slots__ = ('_registry', '_snapshot')
+    
+    def __init__(self, registry: "AgentRegistry", snapshot: _RegistrySnapshot):
+        self._registry = registry
+        self._snapshot = snapshot
+    
+    def __getitem__(self, agent_type: str) -> Type[BaseAgent]:
+        agent_class = self._snapshot.classes.get(agent_type)
+        if agent_class is not None:
+            return agent_class
+        if agent_type not in self._snapshot.lazy:
+            raise KeyError(agent_type)
+        return self._registry.get_agent_class(agent_type)
+    
+    def __contains__(self, agent_type: object) -> bool:
+        return agent_type in self._snapshot.classes or agent_type in self._snapshot.lazy
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._snapshot.agent_types
+        for agent_type in self._snapshot.lazy:
+            if agent_type not in self._snapshot.classes:
+                yield agent_type
+    
+    def __len__(self) -> int:
+        return len(self._snapshot.classes) + sum(
+            1 for agent_type in self._snapshot.lazy if agent_type not in self._snapshot.classes
+        )
+
+
 class AgentRegistry:
     """
     Thread-safe registry for agent discovery and management.
@@ -32,101 +125,195 @@ class AgentRegistry:
     - Plugin discovery
     - Capability-based selection
     - Hot-reloading
+    - Lazy loading: agents registered as "module:Class" targets are only
+      imported the first time they are used
+    
+    Reads are lock-free; register/unregister copy the current snapshot.
     """
     
     def __init__(self):
-        self._agents: Dict[str, Type[BaseAgent]] = {}
-        self._capabilities: Dict[AgentCapability, Set[str]] = {}
-        self._lock = Lock()
+        self._lock = Lock()  # Serializes writers only
+        self._snapshot = _RegistrySnapshot(self, {}, {}, {})
+        self._revisions: Dict[str, int] = {}  # Last revision per agent type (lock held)
         self._loaded_modules: Set[str] = set()
     
+    @property
+    def agents(self) -> Mapping[str, Type[BaseAgent]]:
+        """Read-only agent type -> class mapping of the current snapshot."""
+        return self._snapshot.agents
+    
+    def _copy_tables(self) -> Tuple[Dict[str, Type[BaseAgent]], Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Copy the current snapshot's tables for modification (lock held)."""
+        snapshot = self._snapshot
+        return dict(snapshot.classes), dict(snapshot.metadata), dict(snapshot.lazy)
+    
+    def _publish(
+        self,
+        classes: Dict[str, Type[BaseAgent]],
+        metadata: Dict[str, Dict[str, Any]],
+        lazy: Dict[str, str]
+    ) -> None:
+        """Swap in a new snapshot (lock held)."""
+        self._snapshot = _RegistrySnapshot(self, classes, metadata, lazy)
+    
     def register_agent(self, agent_class: Type[BaseAgent]) -> None:
         """Register an agent class."""
+        # Validate agent class
+        if not issubclass(agent_class, BaseAgent):
+            raise ValueError(f"Agent class {agent_class} must inherit from BaseAgent")
+        
+        metadata = agent_metadata(agent_class)
+        if not metadata['agent_type']:
+            raise ValueError(f"Agent class {agent_class} must declare an agent_type")
+        self._add_agent(metadata['agent_type'], agent_class, metadata)
+    
+    def register_lazy(self, agent_type: str, target: str) -> None:
+        """Register an agent type to be imported from a "module:Class" target on first use."""
+        self.register_manifest({agent_type: target})
+    
+    def register_manifest(self, manifest: Dict[str, str]) -> None:
+        """Lazily register every agent type of a manifest."""
         with self._lock:
-            # Validate agent class
-            if not issubclass(agent_class, BaseAgent):
-                raise ValueError(f"Agent class {agent_class} must inherit from BaseAgent")
-            
-            # Get agent type from class
-            agent_instance = agent_class()
-            agent_type = agent_instance.agent_type
-            
-            # Register agent
-            self._agents[agent_type] = agent_class
-            
-            # Register capabilities
-            for capability in agent_instance.capabilities:
-                if capability not in self._capabilities:
-                    self._capabilities[capability] = set()
-                self._capabilities[capability].add(agent_type)
+            classes, metadata, lazy = self._copy_tables()
+            lazy.update(
+                (agent_type, target) for agent_type, target in manifest.items()
+                if agent_type not in classes
+            )
+            self._publish(classes, metadata, lazy)
+    
+    def _add_agent(self, agent_type: str, agent_class: Type[BaseAgent], agent_info: Dict[str, Any]) -> None:
+        """Publish a snapshot containing an agent class, under a new revision."""
+        with self._lock:
+            revision = self._revisions.get(agent_type, 0) + 1
+            self._revisions[agent_type] = revision
             
-            logger.info(
-                "agent_registered",
-                agent_type=agent_type,
-                capabilities=[cap.value for cap in agent_instance.capabilities],
-                version=agent_instance.version
+            classes, metadata, lazy = self._copy_tables()
+            classes[agent_type] = agent_class
+            metadata[agent_type] = {**agent_info, 'revision': revision}
+            lazy.pop(agent_type, None)
+            self._publish(classes, metadata, lazy)
+        
+        logger.debug(
+            "agent_registered",
+            agent_type=agent_type,
+            capabilities=[cap.value for cap in agent_info['capabilities']],
+            version=agent_info['version'],
+            revision=revision
+        )
+    
+    def _load_agent(self, agent_type: str, target: str) -> Type[BaseAgent]:
+        """Import a lazily registered agent class and register it."""
+        module_name, _, class_name = target.partition(":")
+        try:
+            module = importlib.import_module(module_name, package=__package__)
+            agent_class = getattr(module, class_name)
+            metadata = agent_metadata(agent_class)
+        except Exception as e:
+            raise AgentConfigurationError(
+                f"Cannot load agent '{agent_type}' from {target}: {e}",
+                agent_type=agent_type
+            ) from e
+        
+        if metadata['agent_type'] != agent_type:
+            raise AgentConfigurationError(
+                f"Agent {target} declares agent_type {metadata['agent_type']!r}, expected '{agent_type}'",
+                agent_type=agent_type
             )
+        
+        self._loaded_modules.add(module.__name__)
+        self._add_agent(agent_type, agent_class, metadata)
+        
+        logger.debug("agent_loaded", agent_type=agent_type, target=target)
+        return agent_class
+    
+    def _load_pending(self) -> _RegistrySnapshot:
+        """Import every lazily registered agent and return the resulting snapshot."""
+        for agent_type, target in list(self._snapshot.lazy.items()):
+            try:
+                self._load_agent(agent_type, target)
+            except AgentConfigurationError as e:
+                logger.warning("agent_load_failed", agent_type=agent_type, error=str(e))
+        return self._snapshot
     
     def unregister_agent(self, agent_type: str) -> None:
         """Unregister an agent."""
         with self._lock:
-            if agent_type not in self._agents:
-                return
-            
-            agent_class = self._agents[agent_type]
-            agent_instance = agent_class()
-            
-            # Remove from main registry
-            del self._agents[agent_type]
-            
-            # Remove from capability mappings
-            for capability in agent_instance.capabilities:
-                if capability in self._capabilities:
-                    self._capabilities[capability].discard(agent_type)
-                    if not self._capabilities[capability]:
-                        del self._capabilities[capability]
-            
+            classes, metadata, lazy = self._copy_tables()
+            lazy.pop(agent_type, None)
+            registered = classes.pop(agent_type, None) is not None
+            metadata.pop(agent_type, None)
+            self._publish(classes, metadata, lazy)
+        
+        if registered:
             logger.info("agent_unregistered", agent_type=agent_type)
     
     def get_agent_class(self, agent_type: str) -> Type[BaseAgent]:
-        """Get agent class by type."""
-        with self._lock:
-            if agent_type not in self._agents:
-                available = list(self._agents.keys())
-                raise AgentNotFoundError(
-                    agent_type=agent_type,
-                    available_agents=available
-                )
-            return self._agents[agent_type]
+        """Get agent class by type, importing it on first use."""
+        snapshot = self._snapshot
+        
+        agent_class = snapshot.classes.get(agent_type)
+        if agent_class is not None:
+            return agent_class
+        
+        target = snapshot.lazy.get(agent_type)
+        if target is not None:
+            return self._load_agent(agent_type, target)
+        
+        raise AgentNotFoundError(
+            agent_type=agent_type,
+            available_agents=list(snapshot.agents)
+        )
     
     def list_agents(self) -> List[str]:
-        """List all registered agent types."""
-        with self._lock:
-            return list(self._agents.keys())
+        """List all registered agent types, including ones not loaded yet."""
+        return list(self._snapshot.agents)
     
     def get_agents_by_capability(self, capability: AgentCapability) -> List[str]:
         """Get all agents that provide a specific capability."""
-        with self._lock:
-            return list(self._capabilities.get(capability, set()))
+        return self.get_agents_with_capabilities([capability])
+    
+    def get_agents_with_capabilities(self, capabilities: Iterable[AgentCapability]) -> List[str]:
+        """Get all agents that provide every one of the given capabilities."""
+        required = capability_mask(capabilities)
+        snapshot = self._snapshot
+        if snapshot.lazy:
+            snapshot = self._load_pending()
+        
+        return [
+            agent_type for agent_type, mask in zip(snapshot.agent_types, snapshot.masks)
+            if mask & required == required
+        ]
+    
+    def _get_metadata(self, agent_type: str) -> Dict[str, Any]:
+        """Get the metadata recorded when an agent was registered."""
+        self.get_agent_class(agent_type)
+        return self._snapshot.metadata[agent_type]
+    
+    def get_agent_revision(self, agent_type: str) -> int:
+        """Get the revision of an agent type's current class."""
+        return self._get_metadata(agent_type)['revision']
+    
+    def is_current(self, agent_class: Type[BaseAgent], agent_type: str) -> bool:
+        """Whether agent_class is still the registered class of agent_type."""
+        return self._snapshot.classes.get(agent_type) is agent_class
     
     def get_agent_capabilities(self, agent_type: str) -> Set[AgentCapability]:
         """Get capabilities of a specific agent."""
-        agent_class = self.get_agent_class(agent_type)
-        agent_instance = agent_class()
-        return agent_instance.capabilities
+        return set(self._get_metadata(agent_type)['capabilities'])
     
     def get_agent_info(self, agent_type: str) -> Dict[str, Any]:
         """Get detailed information about an agent."""
         agent_class = self.get_agent_class(agent_type)
-        agent_instance = agent_class()
+        metadata = self._get_metadata(agent_type)
         
         return {
             "agent_type": agent_type,
-            "version": agent_instance.version,
-            "description": agent_instance.description,
-            "capabilities": [cap.value for cap in agent_instance.capabilities],
-            "dependencies": agent_instance.dependencies,
-            "compatible_agents": agent_instance.compatible_agents,
+            "version": metadata['version'],
+            "revision": metadata['revision'],
+            "description": metadata['description'],
+            "capabilities": [cap.value for cap in metadata['capabilities']],
+            "dependencies": list(metadata['dependencies']),
+            "compatible_agents": list(metadata['compatible_agents']),
             "class_name": agent_class.__name__,
             "module": agent_class.__module__
         }
@@ -137,34 +324,45 @@ class AgentRegistry:
     
     def find_agents_for_pipeline(self, required_capabilities: List[AgentCapability]) -> Dict[AgentCapability, List[str]]:
         """Find agents that can fulfill required capabilities for a pipeline."""
-        result = {}
-        missing_capabilities = []
+        snapshot = self._snapshot
+        if snapshot.lazy:
+            snapshot = self._load_pending()
         
-        for capability in required_capabilities:
-            agents = self.get_agents_by_capability(capability)
-            if agents:
-                result[capability] = agents
-            else:
-                missing_capabilities.append(capability)
+        available = 0
+        for mask in snapshot.masks:
+            available |= mask
         
+        missing_capabilities = [
+            capability for capability in required_capabilities
+            if not available & CAPABILITY_BITS[capability]
+        ]
         if missing_capabilities:
             raise AgentCapabilityError(
                 f"No agents found for capabilities: {[cap.value for cap in missing_capabilities]}",
                 required_capability=missing_capabilities[0].value if missing_capabilities else None,
-                available_capabilities=list(self._capabilities.keys())
+                available_capabilities=list(mask_capabilities(available))
             )
         
+        result = {}
+        for capability in required_capabilities:
+            bit = CAPABILITY_BITS[capability]
+            result[capability] = [
+                agent_type for agent_type, mask in zip(snapshot.agent_types, snapshot.masks)
+                if mask & bit
+            ]
+        
         return result
     
     def discover_agents(self, package_path: Optional[str] = None) -> int:
         """
         Discover and register agents from a package.
         
-        Returns the number of agents discovered.
+        Imports every module of the package, so prefer the manifest for the
+        built-in agents. Returns the number of agents discovered.
         """
         if package_path is None:
             # Default to scanning the agents package
-            package_path = "src.agents"
+            package_path = __package__
         
         discovered_count = 0
         
@@ -212,40 +410,39 @@ class AgentRegistry:
             "agent_discovery_completed",
             package=package_path,
             discovered_count=discovered_count,
-            total_agents=len(self._agents)
+            total_agents=len(self._snapshot.classes)
         )
         
         return discovered_count
     
     def reload_agent(self, agent_type: str) -> bool:
-        """Hot-reload a specific agent."""
+        """
+        Hot-reload a specific agent.
+        
+        The reloaded class replaces the current one in a single snapshot
+        swap, so new lookups never miss the agent type. Holders of the old
+        class keep using it until they finish.
+        """
         try:
             # Get current agent info
             agent_class = self.get_agent_class(agent_type)
-            module_name = agent_class.__module__
-            
-            # Unregister current agent
-            self.unregister_agent(agent_type)
             
-            # Reload the module
-            if module_name in self._loaded_modules:
-                self._loaded_modules.remove(module_name)
+            # Reload the module and pick up the class under the same name
+            module = importlib.reload(importlib.import_module(agent_class.__module__))
+            self._loaded_modules.add(module.__name__)
             
-            module = importlib.reload(importlib.import_module(module_name))
-            
-            # Re-register agents from the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, BaseAgent) and 
-                    obj != BaseAgent and
-                    not inspect.isabstract(obj) and
-                    obj().agent_type == agent_type):
-                    
-                    self.register_agent(obj)
-                    logger.info("agent_reloaded", agent_type=agent_type)
-                    return True
+            # reload() keeps names the new source no longer defines, so the old class may linger
+            reloaded_class = getattr(module, agent_class.__name__, None)
+            if (
+                reloaded_class is agent_class
+                or not (inspect.isclass(reloaded_class) and issubclass(reloaded_class, BaseAgent))
+            ):
+                logger.warning("agent_reload_failed", agent_type=agent_type, reason="Agent not found in module")
+                return False
             
-            logger.warning("agent_reload_failed", agent_type=agent_type, reason="Agent not found in module")
-            return False
+            self._add_agent(agent_type, reloaded_class, agent_metadata(reloaded_class))
+            logger.info("agent_reloaded", agent_type=agent_type, revision=self.get_agent_revision(agent_type))
+            return True
             
         except Exception as e:
             logger.error("agent_reload_error", agent_type=agent_type, error=str(e))
@@ -254,14 +451,44 @@ class AgentRegistry:
     def clear(self) -> None:
         """Clear all registered agents."""
         with self._lock:
-            self._agents.clear()
-            self._capabilities.clear()
+            self._publish({}, {}, {})
             self._loaded_modules.clear()
-            logger.info("agent_registry_cleared")
+        logger.info("agent_registry_cleared")
+
+
+_METADATA_FIELDS = ('agent_type', 'version', 'capabilities', 'description', 'dependencies', 'compatible_agents')
+
+
+def agent_metadata(agent_class: Type[BaseAgent]) -> Dict[str, Any]:
+    """
+    Read agent metadata from class attributes, without instantiating.
+    
+    BaseAgent's default properties are skipped; an agent that overrides
+    any metadata with its own property is instantiated once to read it.
+    """
+    metadata: Dict[str, Any] = {}
+    for name in _METADATA_FIELDS:
+        value = inspect.getattr_static(agent_class, name, None)
+        if value is not inspect.getattr_static(BaseAgent, name, None):
+            metadata[name] = value
+    
+    if any(isinstance(value, property) for value in metadata.values()):
+        logger.warning("agent_metadata_not_static", agent_class=agent_class.__qualname__)
+        agent_instance = agent_class()
+        metadata = {name: getattr(agent_instance, name) for name in _METADATA_FIELDS}
+    
+    metadata.setdefault('agent_type', None)
+    metadata.setdefault('version', None)
+    metadata.setdefault('description', f"{metadata['agent_type'] or agent_class.__name__} agent")
+    metadata.setdefault('dependencies', [])
+    metadata.setdefault('compatible_agents', [])
+    metadata['capabilities'] = frozenset(metadata.get('capabilities', ()))
+    return metadata
 
 
-# Global registry instance
+# Global registry instance, with the built-in agents loaded on first use
 _global_registry = AgentRegistry()
+_global_registry.register_manifest(AGENT_MANIFEST)
 
 
 # Convenience functions for global registry
@@ -4,7 +4,7 @@ Reviewer Agent for FibreFlow_React
 Handles code review and quality validation
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,15 @@ from .base import BaseAgent, AgentCapability
 class ReviewerAgent(BaseAgent):
     """Agent responsible for code review and quality validation."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="reviewer",
-            version="1.0.0",
-            description="Code review and quality validation agent",
-            capabilities=[
-                AgentCapability.CODE_VALIDATION,
-                AgentCapability.ANALYSIS,
-                AgentCapability.QUALITY_ASSURANCE,
-                AgentCapability.SECURITY_VALIDATION
-            ]
-        )
+    agent_type: str = "reviewer"
+    version: str = "1.0.0"
+    description: str = "Code review and quality validation agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.REVIEW,
+        AgentCapability.CODE_ANALYSIS,
+        AgentCapability.QUALITY_ASSURANCE,
+        AgentCapability.SECURITY_SCANNING
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute review task."""
@@ -4,7 +4,7 @@ Tester Agent for FibreFlow_React
 Handles test creation and quality assurance
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
 import asyncio
 from datetime import datetime
 
@@ -14,18 +14,14 @@ from .base import BaseAgent, AgentCapability
 class TesterAgent(BaseAgent):
     """Agent responsible for testing and quality assurance."""
     
-    def __init__(self, config: Optional[Any] = None):
-        super().__init__(
-            agent_type="tester",
-            version="1.0.0",
-            description="Test creation and quality assurance agent",
-            capabilities=[
-                AgentCapability.TESTING,
-                AgentCapability.ANALYSIS,
-                AgentCapability.CODE_VALIDATION,
-                AgentCapability.QUALITY_ASSURANCE
-            ]
-        )
+    agent_type: str = "tester"
+    version: str = "1.0.0"
+    description: str = "Test creation and quality assurance agent"
+    capabilities: Set[AgentCapability] = {
+        AgentCapability.TESTING,
+        AgentCapability.CODE_ANALYSIS,
+        AgentCapability.QUALITY_ASSURANCE
+    }
     
     async def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute testing task."""
@@ -0,0 +1,224 @@
+"""
+Git Worktree Pool for ForgeFlow
+
+Parallel coordination gives every agent its own working directory: a git
+worktree that shares the repository's object store, so agents can edit
+files and commit on their branches concurrently instead of racing
+checkouts in one working copy.
+
+Worktrees are expensive to create on large repositories, so released ones
+are reset to a clean detached state and kept for reuse (up to max_idle)
+until the pool is closed at the end of a coordination run. They live under
+the repository's git directory, out of sight of the main working copy;
+worktree directories left there by an earlier process are removed when
+the pool is first used.
+
+Git commands in a leased worktree are bounded by the deadline it was
+leased with.
+"""
+
+import asyncio
+import shutil
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Union
+from uuid import uuid4
+
+import structlog
+
+from .deadline import Deadline
+from .exceptions import AgentError
+from .git_repository import GitRepository
+
+logger = structlog.get_logger()
+
+
+class Worktree:
+    """A leased worktree, the branch checked out in it and the deadline of its lease."""
+    
+    __slots__ = ('path', 'branch', 'deadline')
+    
+    def __init__(self, path: Path, branch: Optional[str] = None, deadline: Optional[Deadline] = None):
+        self.path = path
+        self.branch = branch
+        self.deadline = deadline
+    
+    @property
+    def git(self) -> GitRepository:
+        """Git access scoped to this worktree, bounded by its lease's deadline."""
+        return GitRepository(self.path, self.deadline)
+
+
+class WorktreePool:
+    """
+    Pool of worktrees of one repository.
+    
+    Worktree creation and removal go through the main repository (and its
+    lock); commands inside a worktree only lock that worktree.
+    """
+    
+    def __init__(self, repo_path: Union[str, Path], max_idle: int = 4):
+        self.repo = GitRepository(repo_path)
+        self.max_idle = max_idle
+        self.idle: List[Worktree] = []
+        self.leased: Dict[Path, Worktree] = {}
+        self._root: Optional[Path] = None
+        self._root_lock = asyncio.Lock()
+        
+        # Statistics
+        self.pool_stats = {
+            'created': 0,
+            'reused': 0,
+            'removed': 0,
+            'orphans_removed': 0
+        }
+    
+    async def _get_root(self) -> Path:
+        """Directory holding the pool's worktrees, inside the git common dir."""
+        # Locked so no worktree is added while orphans are being removed
+        async with self._root_lock:
+            if self._root is None:
+                result = await self.repo.run("rev-parse", "--git-common-dir", exclusive=False)
+                common_dir = Path(result.stdout.strip())
+                if not common_dir.is_absolute():
+                    common_dir = self.repo.path / common_dir
+                
+                # Forget worktrees left behind by an earlier process
+                await self.repo.run("worktree", "prune")
+                
+                root = common_dir / "forgeflow-worktrees"
+                root.mkdir(parents=True, exist_ok=True)
+                await self._remove_orphans(root)
+                self._root = root
+        return self._root
+    
+    async def _remove_orphans(self, root: Path):
+        """Delete wt-* directories under root that git no longer knows as worktrees."""
+        result = await self.repo.run("worktree", "list", "--porcelain", exclusive=False)
+        registered = {
+            Path(line[len("worktree "):]).resolve()
+            for line in result.stdout.splitlines() if line.startswith("worktree ")
+        }
+        
+        for path in root.glob("wt-*"):
+            if path.resolve() in registered or path in self.leased:
+                continue
+            await asyncio.to_thread(shutil.rmtree, path, True)
+            self.pool_stats['orphans_removed'] += 1
+            logger.info("worktree_orphan_removed", path=str(path))
+    
+    async def _create(self, branch: Optional[str], deadline: Optional[Deadline] = None) -> Worktree:
+        """Add a new worktree, on branch or detached at HEAD."""
+        path = await self._get_root() / f"wt-{uuid4().hex[:12]}"
+        repo = GitRepository(self.repo.path, deadline)
+        
+        if branch:
+            await repo.run("worktree", "add", str(path), branch)
+        else:
+            await repo.run("worktree", "add", "--detach", str(path), "HEAD")
+        
+        self.pool_stats['created'] += 1
+        return Worktree(path, branch, deadline)
+    
+    async def _remove(self, worktree: Worktree):
+        """Remove a worktree and its administrative files."""
+        await self.repo.run("worktree", "remove", "--force", str(worktree.path), check=False)
+        self.pool_stats['removed'] += 1
+    
+    async def prewarm(self, count: int) -> int:
+        """Create idle worktrees ahead of time, up to max_idle. Returns how many were added."""
+        missing = max(0, min(count, self.max_idle) - len(self.idle))
+        for _ in range(missing):
+            self.idle.append(await self._create(None))
+        return missing
+    
+    async def acquire(self, branch: str, deadline: Optional[Deadline] = None) -> Worktree:
+        """Check out branch in an idle worktree, or a new one, for a lease bounded by deadline."""
+        while self.idle:
+            worktree = self.idle.pop()
+            worktree.deadline = deadline
+            try:
+                await worktree.git.run("checkout", branch)
+            except (RuntimeError, OSError) as e:
+                # A broken (or deleted) idle worktree is dropped rather than failing the lease
+                logger.warning("worktree_reuse_failed", path=str(worktree.path), error=str(e))
+                await self._remove(worktree)
+                continue
+            except AgentError:
+                # Out of time; the worktree is still clean, so keep it for the next lease
+                worktree.deadline = None
+                self.idle.append(worktree)
+                raise
+            
+            worktree.branch = branch
+            self.pool_stats['reused'] += 1
+            break
+        else:
+            worktree = await self._create(branch, deadline)
+        
+        self.leased[worktree.path] = worktree
+        logger.debug("worktree_acquired", path=str(worktree.path), branch=branch)
+        return worktree
+    
+    async def release(self, worktree: Worktree):
+        """
+        Detach and clean a worktree so its branch can be merged or checked
+        out elsewhere, then keep it idle or remove it.
+        """
+        self.leased.pop(worktree.path, None)
+        
+        if len(self.idle) >= self.max_idle:
+            await self._remove(worktree)
+            return
+        
+        # A worktree that can't be cleaned within the lease's deadline is dropped
+        try:
+            async with worktree.git.exclusive():
+                await worktree.git.run("checkout", "--detach")
+                await worktree.git.run("reset", "--hard")
+                await worktree.git.run("clean", "-fdx")
+        except (RuntimeError, OSError, AgentError) as e:
+            logger.warning("worktree_reset_failed", path=str(worktree.path), error=str(e))
+            await self._remove(worktree)
+            return
+        
+        worktree.branch = None
+        worktree.deadline = None
+        self.idle.append(worktree)
+    
+    @asynccontextmanager
+    async def lease(self, branch: str, deadline: Optional[Deadline] = None) -> AsyncIterator[Worktree]:
+        """Acquire a worktree on branch for the duration of the block."""
+        worktree = await self.acquire(branch, deadline)
+        try:
+            yield worktree
+        finally:
+            # Cleanup must finish even if the lease holder is cancelled
+            await asyncio.shield(self.release(worktree))
+    
+    async def close(self):
+        """Remove every idle worktree."""
+        idle, self.idle = self.idle, []
+        for worktree in idle:
+            await self._remove(worktree)
+        await self.repo.run("worktree", "prune", check=False)
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """Get worktree pool statistics."""
+        return {
+            **self.pool_stats,
+            'idle': len(self.idle),
+            'leased': len(self.leased)
+        }
+
+
+_worktree_pools: Dict[Path, WorktreePool] = {}
+
+
+def get_worktree_pool(repo_path: Union[str, Path]) -> WorktreePool:
+    """Get the shared worktree pool of a repository."""
+    path = Path(repo_path).resolve()
+    pool = _worktree_pools.get(path)
+    if pool is None:
+        pool = _worktree_pools[path] = WorktreePool(path)
+    return pool
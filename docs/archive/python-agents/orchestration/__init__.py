@@ -21,7 +21,8 @@ from .models import (
     PipelineStatus,
     RetryStrategy,
     OrchestrationConfig,
-    PipelineResult
+    PipelineResult,
+    BatchResult
 )
 
 __all__ = [
@@ -36,5 +37,6 @@ __all__ = [
     'PipelineStatus',
     'RetryStrategy',
     'OrchestrationConfig',
-    'PipelineResult'
+    'PipelineResult',
+    'BatchResult'
 ]
\ No newline at end of file
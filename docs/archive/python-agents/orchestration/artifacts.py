@@ -0,0 +1,316 @@
+"""
+Artifact Store - Content-addressed storage for large agent artifacts.
+
+Agents can return large payloads (generated files, reports, bundles) as
+artifacts. Keeping them on the pipeline run means every snapshot, result and
+broadcast carries them along. Artifacts above a size threshold are instead
+spilled to a local content-addressed directory and replaced by an
+ArtifactHandle; identical payloads are stored once.
+
+Layout:
+    
+    <root>/<digest[:2]>/<digest[2:]>    sha256 of the stored bytes
+    <root>/tmp/                         in-progress writes
+
+Large blobs are read back through mmap so consumers can slice them without
+loading the whole file. A blob is checked against its digest once per
+store: when it is written, or on its first read if another store wrote it.
+A corrupted blob is deleted and ArtifactIntegrityError raised; later reads
+of a verified blob only touch the pages they use.
+"""
+
+import hashlib
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Set, Union
+
+import structlog
+from pydantic import BaseModel, ConfigDict, Field
+
+from ..agents.codec import dumps, loads
+
+logger = structlog.get_logger()
+
+DEFAULT_ARTIFACT_ROOT = Path(tempfile.gettempdir()) / "forgeflow-artifacts"
+
+
+class ArtifactIntegrityError(ValueError):
+    """A stored blob doesn't match the digest of its handle."""
+
+
+class ArtifactHandle(BaseModel):
+    """Reference to an artifact held in an ArtifactStore."""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    digest: str = Field(..., description="sha256 of the stored bytes")
+    size: int = Field(..., ge=0, description="Stored size in bytes")
+    encoding: str = Field(default="bytes", description="How to decode the bytes: bytes, text or json")
+
+
+class ArtifactWriter:
+    """
+    Streaming writer for a single artifact.
+    
+    Chunks are hashed as they are written to a temporary file, which is
+    moved into place on commit. Use as a context manager: the artifact is
+    committed on a clean exit and discarded if the block raises.
+    """
+    
+    def __init__(self, store: "ArtifactStore", encoding: str = "bytes"):
+        self.store = store
+        self.encoding = encoding
+        self.size = 0
+        self.handle: Optional[ArtifactHandle] = None
+        
+        fd, self._temp_path = tempfile.mkstemp(dir=store.temp_dir)
+        self._file = os.fdopen(fd, "wb")
+        self._hash = hashlib.sha256()
+    
+    def write(self, chunk: Union[bytes, bytearray, memoryview, str]) -> int:
+        """Append a chunk to the artifact."""
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        
+        self._hash.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+        return len(chunk)
+    
+    def commit(self) -> ArtifactHandle:
+        """Finish writing and return the artifact handle."""
+        if self.handle is None:
+            self._file.close()
+            self.handle = self.store._commit_file(
+                self._temp_path, self._hash.hexdigest(), self.size, self.encoding
+            )
+        return self.handle
+    
+    def abort(self):
+        """Discard the partially written artifact."""
+        if self.handle is None and not self._file.closed:
+            self._file.close()
+            os.unlink(self._temp_path)
+    
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+class ArtifactStore:
+    """
+    Content-addressed local store with size-based spilling and dedup.
+    """
+    
+    def __init__(
+        self,
+        root: Union[str, Path, None] = None,
+        spill_threshold: int = 64 * 1024,
+        mmap_threshold: int = 1024 * 1024
+    ):
+        self.root = Path(root) if root else DEFAULT_ARTIFACT_ROOT
+        self.temp_dir = self.root / "tmp"
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.spill_threshold = spill_threshold
+        self.mmap_threshold = mmap_threshold
+        self._verified: Set[str] = set()  # digests of blobs known to match
+        
+        # Statistics
+        self.store_stats = {
+            'inline_artifacts': 0,
+            'spilled_artifacts': 0,
+            'dedup_hits': 0,
+            'bytes_written': 0,
+            'bytes_deduplicated': 0,
+            'mmap_reads': 0,
+            'corrupt_blobs': 0
+        }
+    
+    def put(self, value: Any) -> Any:
+        """
+        Store a value if it exceeds the spill threshold.
+        
+        Returns an ArtifactHandle for spilled values and the value itself
+        otherwise. Existing handles are passed through.
+        """
+        if isinstance(value, ArtifactHandle):
+            return value
+        
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            data, encoding = bytes(value), "bytes"
+        elif isinstance(value, str):
+            data, encoding = value.encode("utf-8"), "text"
+        else:
+            data, encoding = dumps(value), "json"
+        
+        if len(data) <= self.spill_threshold:
+            self.store_stats['inline_artifacts'] += 1
+            return value
+        
+        return self.put_bytes(data, encoding)
+    
+    def put_bytes(self, data: bytes, encoding: str = "bytes") -> ArtifactHandle:
+        """Store raw bytes unconditionally and return their handle."""
+        digest = hashlib.sha256(data).hexdigest()
+        
+        if self._path(digest).exists():
+            return self._record_dedup(digest, len(data), encoding)
+        
+        fd, temp_path = tempfile.mkstemp(dir=self.temp_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        
+        return self._commit_file(temp_path, digest, len(data), encoding)
+    
+    def writer(self, encoding: str = "bytes") -> ArtifactWriter:
+        """Open a streaming writer for an artifact of unknown size."""
+        return ArtifactWriter(self, encoding)
+    
+    def store_artifacts(self, artifacts: Mapping[str, Any]) -> Dict[str, Any]:
+        """Spill every large value of an artifacts mapping, keeping small ones inline."""
+        return {name: self.put(value) for name, value in artifacts.items()}
+    
+    def open(self, handle: ArtifactHandle) -> Union[bytes, memoryview]:
+        """
+        Get the stored bytes of an artifact.
+        
+        Blobs above the mmap threshold are returned as a read-only
+        memoryview over a memory map; the mapping is released with the view.
+        """
+        path = self._path(handle.digest)
+        
+        if handle.size < self.mmap_threshold:
+            data = path.read_bytes()
+            if handle.digest not in self._verified:
+                self._verify(handle, data)
+            return data
+        
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        view = memoryview(mapped)
+        if handle.digest not in self._verified:
+            try:
+                self._verify(handle, view)
+            except ArtifactIntegrityError:
+                view.release()
+                mapped.close()
+                raise
+        
+        self.store_stats['mmap_reads'] += 1
+        return view
+    
+    def read(self, handle: ArtifactHandle) -> Any:
+        """Read an artifact back in its original form."""
+        data = self.open(handle)
+        
+        if handle.encoding == "text":
+            return str(data, "utf-8")
+        if handle.encoding == "json":
+            return loads(data)
+        return data
+    
+    def resolve(self, value: Any) -> Any:
+        """Read the value behind a handle; other values are returned unchanged."""
+        if isinstance(value, ArtifactHandle):
+            return self.read(value)
+        return value
+    
+    def contains(self, handle: ArtifactHandle) -> bool:
+        """Check whether the blob behind a handle is present and intact."""
+        path = self._path(handle.digest)
+        try:
+            return _hash_file(path) == handle.digest
+        except FileNotFoundError:
+            return False
+    
+    def prune(self, max_age_seconds: float) -> int:
+        """Remove blobs not written or deduplicated within max_age_seconds."""
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        
+        for path in self.root.glob("??/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        
+        if removed:
+            logger.info("artifacts_pruned", root=str(self.root), removed=removed)
+        
+        return removed
+    
+    def remove(self):
+        """Delete the store's directory and every blob in it."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._verified.clear()
+        logger.info("artifact_store_removed", root=str(self.root))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get artifact store statistics."""
+        return {
+            **self.store_stats,
+            'root': str(self.root),
+            'spill_threshold': self.spill_threshold
+        }
+    
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+    
+    def _verify(self, handle: ArtifactHandle, data: Union[bytes, memoryview]):
+        """Check data against the handle's digest, dropping the blob if it doesn't match."""
+        if hashlib.sha256(data).hexdigest() == handle.digest:
+            self._verified.add(handle.digest)
+            return
+        
+        self.store_stats['corrupt_blobs'] += 1
+        self._path(handle.digest).unlink(missing_ok=True)
+        logger.error("artifact_corrupted", digest=handle.digest, root=str(self.root))
+        raise ArtifactIntegrityError(f"Artifact {handle.digest} doesn't match its digest")
+    
+    def _commit_file(self, temp_path: str, digest: str, size: int, encoding: str) -> ArtifactHandle:
+        """Move a fully written temporary file into its content-addressed location."""
+        path = self._path(digest)
+        
+        if path.exists():
+            os.unlink(temp_path)
+            return self._record_dedup(digest, size, encoding)
+        
+        path.parent.mkdir(exist_ok=True)
+        os.replace(temp_path, path)  # atomic: readers never see a partial blob
+        self._verified.add(digest)  # hashed while written
+        
+        self.store_stats['spilled_artifacts'] += 1
+        self.store_stats['bytes_written'] += size
+        
+        logger.debug("artifact_spilled", digest=digest, size=size, encoding=encoding)
+        
+        return ArtifactHandle(digest=digest, size=size, encoding=encoding)
+    
+    def _record_dedup(self, digest: str, size: int, encoding: str) -> ArtifactHandle:
+        os.utime(self._path(digest))  # keep shared blobs alive for prune()
+        
+        self.store_stats['dedup_hits'] += 1
+        self.store_stats['bytes_deduplicated'] += size
+        
+        return ArtifactHandle(digest=digest, size=size, encoding=encoding)
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
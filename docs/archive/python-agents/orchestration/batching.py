@@ -0,0 +1,161 @@
+"""
+Micro-batching - Coalesces executions of one agent type across pipelines.
+
+Many concurrent pipelines run the same agent type (e.g. planner on many
+briefs). For agent types opted in via micro_batch_agent_types, the
+executor hands attempts to a MicroBatcher instead of calling
+agent.execute directly. The batcher collects inputs for up to
+micro_batch_max_wait seconds or micro_batch_max_size inputs, calls
+BaseAgent.execute_batch once, and scatters the outputs back to the
+waiting executions.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from ..agents.base import AgentInput, AgentOutput
+from .models import OrchestrationConfig
+
+logger = structlog.get_logger()
+
+
+class _PendingBatch:
+    """Inputs collected for one agent class while its window is open."""
+    
+    __slots__ = ('entries', 'flush_handle')
+    
+    def __init__(self):
+        self.entries: List[Tuple[AgentInput, asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """
+    Collects agent executions into short windows and runs them as batches.
+    
+    A batch counts as one agent execution against the executor's
+    concurrency limit. Cancelling one waiter (e.g. its attempt timed out)
+    only drops that input; the rest of the batch is unaffected.
+    """
+    
+    def __init__(self, config: OrchestrationConfig, semaphore: asyncio.Semaphore):
+        self.config = config
+        self.semaphore = semaphore
+        self.pending: Dict[Any, _PendingBatch] = {}
+        self.running: Set[asyncio.Task] = set()
+        
+        # Statistics
+        self.batch_stats = {
+            'batches_executed': 0,
+            'batched_executions': 0,
+            'dropped_executions': 0,
+            'largest_batch': 0
+        }
+    
+    async def execute(self, agent_class: Any, agent_input: AgentInput) -> AgentOutput:
+        """Queue an input for the next batch of agent_class and await its output."""
+        loop = asyncio.get_running_loop()
+        
+        batch = self.pending.get(agent_class)
+        if batch is None:
+            batch = self.pending[agent_class] = _PendingBatch()
+            batch.flush_handle = loop.call_later(
+                self.config.micro_batch_max_wait, self._flush, agent_class, batch
+            )
+        
+        future = loop.create_future()
+        batch.entries.append((agent_input, future))
+        
+        if len(batch.entries) >= self.config.micro_batch_max_size:
+            self._flush(agent_class, batch)
+        
+        return await future
+    
+    def _flush(self, agent_class: Any, batch: _PendingBatch):
+        """Close a batch window and start executing it."""
+        if self.pending.get(agent_class) is batch:
+            del self.pending[agent_class]
+        batch.flush_handle.cancel()
+        
+        # Waiters cancelled while the window was open are dropped
+        entries = [(agent_input, future) for agent_input, future in batch.entries if not future.done()]
+        self.batch_stats['dropped_executions'] += len(batch.entries) - len(entries)
+        if not entries:
+            return
+        
+        task = asyncio.create_task(self._run_batch(agent_class, entries))
+        self.running.add(task)
+        task.add_done_callback(self.running.discard)
+    
+    async def _run_batch(self, agent_class: Any, entries: List[Tuple[AgentInput, asyncio.Future]]):
+        """Execute one batch and scatter its outputs to the waiters."""
+        async with self.semaphore:
+            await self._execute_entries(agent_class, entries)
+    
+    async def _execute_entries(self, agent_class: Any, entries: List[Tuple[AgentInput, asyncio.Future]]):
+        """Drop expired members, run the batch and resolve each waiter."""
+        ready = []
+        for agent_input, future in entries:
+            if future.done():
+                continue
+            try:
+                if agent_input.deadline:
+                    agent_input.deadline.check()
+                ready.append((agent_input, future))
+            except Exception as e:
+                future.set_exception(e)
+        
+        if not ready:
+            return
+        
+        self.batch_stats['batches_executed'] += 1
+        self.batch_stats['batched_executions'] += len(ready)
+        self.batch_stats['largest_batch'] = max(self.batch_stats['largest_batch'], len(ready))
+        
+        agent = agent_class()
+        try:
+            outputs = await asyncio.wait_for(
+                agent.execute_batch([agent_input for agent_input, _ in ready]),
+                timeout=self._get_batch_timeout(ready)
+            )
+        except BaseException as e:
+            cancelled = isinstance(e, asyncio.CancelledError)
+            for _, future in ready:
+                if not future.done():
+                    future.cancel() if cancelled else future.set_exception(e)
+            await agent.cleanup()
+            if cancelled:
+                raise
+            return
+        
+        for (_, future), output in zip(ready, outputs):
+            if not future.done():
+                future.set_result(output)
+        
+        logger.debug(
+            "micro_batch_completed",
+            agent_type=agent.agent_type,
+            batch_size=len(ready)
+        )
+    
+    def _get_batch_timeout(self, entries: List[Tuple[AgentInput, asyncio.Future]]) -> float:
+        """Bound a batch by the execution timeout and the latest member deadline."""
+        remaining = [
+            agent_input.deadline.remaining() if agent_input.deadline else None
+            for agent_input, _ in entries
+        ]
+        if None in remaining:
+            return self.config.execution_timeout
+        return min(self.config.execution_timeout, max(remaining))
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get micro-batching statistics."""
+        batches = self.batch_stats['batches_executed']
+        return {
+            **self.batch_stats,
+            'average_batch_size': self.batch_stats['batched_executions'] / batches if batches else 0.0,
+            'open_windows': len(self.pending),
+            'running_batches': len(self.running)
+        }
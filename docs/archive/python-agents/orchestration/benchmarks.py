@@ -0,0 +1,204 @@
+"""
+Orchestration micro-benchmarks.
+
+Run from an interpreter to compare the pydantic models with the slots-based
+hot-path state, e.g.:
+    
+    from orchestration.benchmarks import benchmark_execution_state
+    print(benchmark_execution_state())
+
+or to check the agents package import against its startup budget:
+    
+    from orchestration.benchmarks import benchmark_agent_import
+    print(benchmark_agent_import())
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+from ..agents.manifest import AGENT_MANIFEST
+from ..agents.registry import AgentRegistry
+
+from .models import AgentExecution, ExecutionStatus
+from .state import ExecutionState
+
+
+def _measure_memory(factory: Callable[[], Any], count: int) -> float:
+    """Average bytes allocated per object created by factory."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects: List[Any] = [factory() for _ in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    
+    del objects
+    return (after - before) / count
+
+
+def _measure_transitions(executions: List[Any], rounds: int) -> float:
+    """Status/progress transitions per second over the given executions."""
+    started = time.perf_counter()
+    
+    for _ in range(rounds):
+        for execution in executions:
+            execution.status = ExecutionStatus.RUNNING
+            execution.progress_percentage = 50.0
+            execution.partial_output_count += 1
+            execution.status = ExecutionStatus.PENDING
+    
+    elapsed = time.perf_counter() - started
+    return (4 * rounds * len(executions)) / elapsed if elapsed > 0 else 0.0
+
+
+def benchmark_execution_state(count: int = 10000, rounds: int = 20) -> Dict[str, Any]:
+    """
+    Compare memory per execution and transitions per second between
+    AgentExecution (pydantic) and ExecutionState (slots).
+    """
+    run_id = uuid4()
+    template = AgentExecution(agent_type="coder", run_id=run_id, depends_on=["architect"])
+    
+    model_bytes = _measure_memory(
+        lambda: AgentExecution(agent_type="coder", run_id=run_id, depends_on=["architect"]),
+        count
+    )
+    state_bytes = _measure_memory(
+        lambda: ExecutionState.create(agent_type="coder", run_id=run_id, depends_on=["architect"]),
+        count
+    )
+    
+    models = [template.model_copy() for _ in range(min(count, 1000))]
+    states = [ExecutionState.from_model(template) for _ in range(min(count, 1000))]
+    
+    model_rate = _measure_transitions(models, rounds)
+    state_rate = _measure_transitions(states, rounds)
+    
+    return {
+        'executions': count,
+        'model_bytes_per_execution': round(model_bytes),
+        'state_bytes_per_execution': round(state_bytes),
+        'model_transitions_per_second': round(model_rate),
+        'state_transitions_per_second': round(state_rate),
+        'transition_speedup': round(state_rate / model_rate, 2) if model_rate else None
+    }
+
+
+# Runs in a fresh interpreter so no module is already cached
+_AGENT_IMPORT_PROBE = """
+import importlib, json, sys, time
+
+package, agent_type = sys.argv[1], sys.argv[2]
+before = set(sys.modules)
+
+started = time.perf_counter()
+agents = importlib.import_module(package)
+import_seconds = time.perf_counter() - started
+
+manifest_modules = {
+    importlib.util.resolve_name(target.partition(":")[0], package)
+    for target in agents.AGENT_MANIFEST.values()
+}
+loaded_on_import = sorted(manifest_modules & (set(sys.modules) - before))
+
+started = time.perf_counter()
+agents.get_registry().get_agent_class(agent_type)
+first_use_seconds = time.perf_counter() - started
+
+print(json.dumps({
+    "import_seconds": import_seconds,
+    "first_use_seconds": first_use_seconds,
+    "agent_modules_loaded_on_import": loaded_on_import
+}))
+"""
+
+
+def benchmark_agent_import(budget_ms: float = 250.0, agent_type: str = "coordinator") -> Dict[str, Any]:
+    """
+    Measure a cold import of the agents package in a fresh interpreter,
+    against budget_ms, and the cost of first using agent_type.
+    
+    The import must not load any agent module listed in the manifest.
+    """
+    package = __package__.rpartition(".")[0]
+    agents_package = f"{package}.agents" if package else "agents"
+    
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path for path in sys.path if path))
+    completed = subprocess.run(
+        [sys.executable, "-c", _AGENT_IMPORT_PROBE, agents_package, agent_type],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True
+    )
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    
+    import_ms = probe['import_seconds'] * 1000
+    return {
+        'import_ms': round(import_ms, 2),
+        'budget_ms': budget_ms,
+        'within_budget': import_ms <= budget_ms and not probe['agent_modules_loaded_on_import'],
+        'agent_modules_loaded_on_import': probe['agent_modules_loaded_on_import'],
+        'first_use_agent_type': agent_type,
+        'first_use_ms': round(probe['first_use_seconds'] * 1000, 2)
+    }
+
+
+def _measure_threaded_lookups(lookup: Callable[[str], Any], agent_types: List[str], threads: int, lookups: int) -> float:
+    """Lookups per second with `threads` threads each doing `lookups` lookups."""
+    barrier = threading.Barrier(threads + 1)
+    
+    def worker():
+        barrier.wait()
+        for index in range(lookups):
+            lookup(agent_types[index % len(agent_types)])
+    
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    
+    return (threads * lookups) / elapsed if elapsed > 0 else 0.0
+
+
+def benchmark_registry_lookups(threads: int = 8, lookups: int = 100000) -> Dict[str, Any]:
+    """
+    Compare agent class lookups per second under thread contention between
+    the lock-free snapshot registry and a lock-per-lookup baseline.
+    """
+    registry = AgentRegistry()
+    registry.register_manifest(AGENT_MANIFEST)
+    
+    # Load everything up front to measure the steady state, not first-use imports
+    agent_types = registry.get_agents_with_capabilities([])
+    
+    lock = threading.Lock()
+    classes = {agent_type: registry.get_agent_class(agent_type) for agent_type in agent_types}
+    
+    def locked_lookup(agent_type: str) -> Any:
+        with lock:
+            return classes[agent_type]
+    
+    snapshot_rate = _measure_threaded_lookups(registry.get_agent_class, agent_types, threads, lookups)
+    locked_rate = _measure_threaded_lookups(locked_lookup, agent_types, threads, lookups)
+    
+    return {
+        'threads': threads,
+        'agent_types': len(agent_types),
+        'snapshot_lookups_per_second': round(snapshot_rate),
+        'locked_lookups_per_second': round(locked_rate),
+        'speedup': round(snapshot_rate / locked_rate, 2) if locked_rate else None
+    }
@@ -0,0 +1,76 @@
+"""
+Request Coalescing - Single-flight execution of identical agent requests.
+
+When several pipelines launch the same agent with identical inputs at the
+same time (resubmissions, overlapping templates), only the first call
+runs; the others await its result. Waiters are reference counted: a
+cancelled waiter just leaves, and the shared call is only cancelled once
+nobody is waiting for it anymore.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class _Flight:
+    """A shared in-flight call and the number of callers awaiting it."""
+    
+    __slots__ = ('task', 'waiters')
+    
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time and shares its outcome.
+    """
+    
+    def __init__(self):
+        self.flights: Dict[str, _Flight] = {}
+        
+        # Statistics
+        self.flight_stats = {
+            'calls': 0,
+            'coalesced_calls': 0,
+            'abandoned_flights': 0
+        }
+    
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call() for key, or join the identical call already in flight."""
+        self.flight_stats['calls'] += 1
+        
+        flight = self.flights.get(key)
+        if flight is None:
+            flight = self.flights[key] = _Flight(asyncio.create_task(call()))
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+        else:
+            self.flight_stats['coalesced_calls'] += 1
+            logger.debug("request_coalesced", key=key, waiters=flight.waiters + 1)
+        
+        flight.waiters += 1
+        try:
+            # Shielded: cancelling this waiter must not cancel the shared call
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self.flight_stats['abandoned_flights'] += 1
+                self._forget(key, flight)
+                flight.task.cancel()
+    
+    def _forget(self, key: str, flight: _Flight):
+        if self.flights.get(key) is flight:
+            del self.flights[key]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            **self.flight_stats,
+            'in_flight': len(self.flights)
+        }
@@ -6,6 +6,7 @@ Predefined templates for common deployment scenarios
 
 from typing import Dict, List, Any
 from .base import PipelineTemplate, TemplateCategory
+from .template_index import TemplateIndex
 
 
 class DeploymentTemplateRegistry:
@@ -13,6 +14,9 @@ class DeploymentTemplateRegistry:
     
     def __init__(self):
         self.templates = self._create_default_templates()
+        self.index = TemplateIndex()
+        for template in self.templates.values():
+            self.index.add(template)
     
     def _create_default_templates(self) -> Dict[str, PipelineTemplate]:
         """Create default deployment templates."""
@@ -543,7 +547,7 @@ class DeploymentTemplateRegistry:
     
     def get_templates_by_tag(self, tag: str) -> List[PipelineTemplate]:
         """Get templates by tag."""
-        return [t for t in self.templates.values() if tag in t.tags]
+        return [self.templates[t] for t in self.index.search(tags=[tag])]
 
 
 # Global deployment template registry
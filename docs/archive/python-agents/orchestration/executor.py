@@ -7,26 +7,39 @@ and comprehensive error handling.
 
 import asyncio
 import time
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
-from uuid import UUID
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set
+from uuid import UUID, uuid4
 
 import structlog
 
 from ..agents.registry import get_registry
-from ..agents.base import AgentInput
+from ..agents.performance import get_performance_stats
+from ..agents.base import AgentInput, fork_context, layer_contexts
+from ..agents.deadline import Deadline
+from ..agents.exceptions import AgentCancelledError, AgentExecutionError
 from .models import (
     PipelineRun, 
-    AgentExecution, 
     ExecutionStatus, 
     PipelineStatus,
     OrchestrationConfig,
-    PipelineResult
+    PipelineResult,
+    BatchResult
 )
 from .scheduler import AgentScheduler
 from .monitor import PipelineMonitor
 from .recovery import FailureRecovery
 from .dependencies import DependencyManager
+from .artifacts import DEFAULT_ARTIFACT_ROOT, ArtifactStore
+from .batching import MicroBatcher
+from .coalescing import SingleFlight
+from .hedging import HedgingPolicy
+from .plans import PipelinePlan
+from .state import ExecutionState, RunState
+from .streaming import OutputStream
+from .templates import get_template_registry
 
 # Import WebSocket integration if available
 try:
@@ -56,18 +69,37 @@ class PipelineExecutor:
         self.monitor = PipelineMonitor(self.config)
         self.recovery = FailureRecovery(self.config)
         self.dependency_manager = DependencyManager()
+        self.hedging = HedgingPolicy(self.config)
+        self.artifact_store = ArtifactStore(
+            self.config.artifact_store_path or DEFAULT_ARTIFACT_ROOT / f"executor-{uuid4().hex[:12]}",
+            spill_threshold=self.config.artifact_spill_threshold
+        ) if self.config.enable_artifact_store else None
+        self._owns_artifact_root = not self.config.artifact_store_path
+        self._last_artifact_prune = time.monotonic()
         
         # Execution tracking
-        self.active_runs: Dict[UUID, PipelineRun] = {}
+        self.active_runs: Dict[UUID, RunState] = {}
+        self.output_streams: Dict[UUID, OutputStream] = {}
+        self.context_layers: Dict[UUID, Mapping[str, Any]] = {}
+        self.run_wakeups: Dict[UUID, asyncio.Event] = {}
+        self.run_deadlines: Dict[UUID, Deadline] = {}
+        self.run_tasks: Dict[UUID, Dict[str, asyncio.Task]] = {}
+        self.run_plans: Dict[UUID, PipelinePlan] = {}
         self.execution_semaphore = asyncio.Semaphore(self.config.max_parallel_agents)
+        self.batcher = MicroBatcher(self.config, self.execution_semaphore)
+        self.single_flight = SingleFlight()
         
         # Pipeline control
         self.paused_pipelines: Set[UUID] = set()
         self.pause_events: Dict[UUID, asyncio.Event] = {}
+        self.preempting_executions: Set[UUID] = set()
         
         # Agent registry
         self.agent_registry = get_registry()
         
+        # Per-agent-type success rate and latency, shared with the agent factory
+        self.performance_stats = get_performance_stats()
+        
         # Performance metrics
         self.executor_metrics = {
             'total_pipelines_executed': 0,
@@ -91,13 +123,92 @@ class PipelineExecutor:
         feature_brief: str,
         project_context: Optional[Dict[str, Any]] = None,
         agent_sequence: Optional[List[str]] = None,
-        config: Optional[OrchestrationConfig] = None
+        config: Optional[OrchestrationConfig] = None,
+        template_id: Optional[str] = None
     ) -> PipelineRun:
         """
         Create a new pipeline run with the specified agents.
+        
+        With template_id, the run is stamped out of the template's compiled
+        plan and the template defaults are merged into project_context.
         """
         run_config = config or self.config
         
+        if template_id:
+            plan = get_template_registry().get_plan(template_id, self.agent_registry.agents)
+            run_state = self._stamp_pipeline_run(
+                plan, name, feature_brief, plan.resolve_context(project_context), run_config
+            )
+        else:
+            # The executor works on slots-based state; pydantic is only the boundary
+            run_state = RunState.from_model(self._build_pipeline_run(
+                name, feature_brief, project_context, agent_sequence, run_config
+            ))
+        
+        self.active_runs[run_state.id] = run_state
+        
+        logger.info(
+            "pipeline_run_created",
+            run_id=str(run_state.id),
+            name=name,
+            template_id=template_id,
+            agents=[e.agent_type for e in run_state.executions],
+            total_agents=run_state.total_agents
+        )
+        
+        return run_state.to_model()
+    
+    def _stamp_pipeline_run(
+        self,
+        plan: PipelinePlan,
+        name: str,
+        feature_brief: str,
+        project_context: Dict[str, Any],
+        run_config: OrchestrationConfig
+    ) -> RunState:
+        """
+        Create run state from a compiled plan without validation or analysis.
+        """
+        run_id = uuid4()
+        executions = [
+            ExecutionState.stamp(
+                agent_type=node.agent_type,
+                run_id=run_id,
+                depends_on=list(node.depends_on),
+                stream_dependencies=list(node.stream_dependencies),
+                optional_dependencies=list(node.optional_dependencies),
+                estimated_duration=node.estimated_duration,
+                resource_requirements=dict(node.resource_requirements),
+                max_attempts=run_config.default_max_attempts,
+                retry_strategy=run_config.default_retry_strategy
+            )
+            for node in plan.nodes
+        ]
+        
+        run_state = RunState.stamp(
+            id=run_id,
+            name=name,
+            feature_brief=feature_brief,
+            project_context=project_context,
+            orchestration_config=run_config,
+            max_parallel=run_config.max_parallel_agents,
+            executions=executions,
+            total_agents=len(executions)
+        )
+        self.run_plans[run_id] = plan
+        return run_state
+    
+    def _build_pipeline_run(
+        self,
+        name: str,
+        feature_brief: str,
+        project_context: Optional[Dict[str, Any]],
+        agent_sequence: Optional[List[str]],
+        run_config: OrchestrationConfig
+    ) -> PipelineRun:
+        """
+        Build a validated pipeline run and its executions without registering it.
+        """
         pipeline_run = PipelineRun(
             name=name,
             feature_brief=feature_brief,
@@ -121,20 +232,112 @@ class PipelineExecutor:
                 agent_class = self.agent_registry.agents[agent_type]
                 agent_instance = agent_class()
                 execution.depends_on = agent_instance.dependencies
+                execution.stream_dependencies = [
+                    dep for dep in agent_instance.stream_dependencies
+                    if dep in execution.depends_on
+                ]
+                execution.optional_dependencies = [
+                    dep for dep in agent_instance.optional_dependencies
+                    if dep in execution.depends_on
+                ]
             
             previous_agent = agent_type
         
-        self.active_runs[pipeline_run.id] = pipeline_run
+        return pipeline_run
+    
+    async def submit_batch(
+        self,
+        briefs: List[str],
+        template_id: str,
+        project_context: Optional[Dict[str, Any]] = None,
+        config: Optional[OrchestrationConfig] = None
+    ) -> BatchResult:
+        """
+        Create and execute one pipeline run per feature brief from a template.
+        
+        The template's compiled plan and context are resolved once and every
+        run is stamped out of the plan, then admitted as a group, at most
+        batch_max_active_runs at a time. Cancelling the call cancels the batch.
+        """
+        run_config = config or self.config
+        plan = get_template_registry().get_plan(template_id, self.agent_registry.agents)
+        context = plan.resolve_context(project_context)
+        
+        batch_id = uuid4()
+        runs = [
+            self._stamp_pipeline_run(plan, f"{plan.name} #{index}", brief, dict(context), run_config)
+            for index, brief in enumerate(briefs, 1)
+        ]
+        self.active_runs.update((run.id, run) for run in runs)
         
         logger.info(
-            "pipeline_run_created",
-            run_id=str(pipeline_run.id),
-            name=name,
-            agents=agent_sequence,
-            total_agents=pipeline_run.total_agents
+            "pipeline_batch_submitted",
+            batch_id=str(batch_id),
+            template_id=template_id,
+            runs=len(runs),
+            agents=[node.agent_type for node in plan.nodes],
+            max_active_runs=run_config.batch_max_active_runs
         )
         
-        return pipeline_run
+        return await self._execute_batch(
+            batch_id,
+            template_id,
+            runs,
+            run_config.batch_max_active_runs
+        )
+    
+    async def _execute_batch(
+        self,
+        batch_id: UUID,
+        template_id: str,
+        runs: List[RunState],
+        max_active_runs: int
+    ) -> BatchResult:
+        """
+        Run a submitted batch with a bounded pool of run workers.
+        """
+        started_at = datetime.utcnow()
+        results: List[Optional[PipelineResult]] = [None] * len(runs)
+        pending = iter(range(len(runs)))
+        
+        async def run_worker():
+            for index in pending:
+                results[index] = await self._run_pipeline(runs[index], monitor=False)
+        
+        workers = [
+            asyncio.create_task(run_worker()) for _ in range(min(max_active_runs, len(runs)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # On cancellation, let admitted runs clean up; drop runs never admitted
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            for index in pending:
+                self.active_runs.pop(runs[index].id, None)
+                self.run_plans.pop(runs[index].id, None)
+        
+        completed_at = datetime.utcnow()
+        batch_result = BatchResult(
+            batch_id=batch_id,
+            template_id=template_id,
+            duration_seconds=(completed_at - started_at).total_seconds(),
+            started_at=started_at,
+            completed_at=completed_at,
+            results=results
+        )
+        
+        logger.info(
+            "pipeline_batch_completed",
+            batch_id=str(batch_id),
+            runs=len(runs),
+            successful_runs=batch_result.successful_runs,
+            failed_runs=batch_result.failed_runs,
+            duration=batch_result.duration_seconds
+        )
+        
+        return batch_result
     
     async def execute_pipeline(self, run_id: UUID) -> PipelineResult:
         """
@@ -144,6 +347,10 @@ class PipelineExecutor:
         if not pipeline_run:
             raise ValueError(f"Pipeline run {run_id} not found")
         
+        # Runs stamped from a compiled plan are already validated and ordered
+        if run_id in self.run_plans:
+            return await self._run_pipeline(pipeline_run)
+        
         # Perform dependency analysis before execution
         dependency_analysis = await self.dependency_manager.analyze_pipeline_dependencies(pipeline_run)
         
@@ -159,16 +366,32 @@ class PipelineExecutor:
         
         # Optimize execution order if enabled
         if self.config.enable_pipeline_optimization:
-            pipeline_run.executions = self.dependency_manager.get_optimized_execution_order(
+            pipeline_run.set_executions(self.dependency_manager.get_optimized_execution_order(
                 pipeline_run.executions
-            )
+            ))
+        
+        return await self._run_pipeline(pipeline_run, dependency_analysis['parallelism']['potential'])
+    
+    async def _run_pipeline(
+        self,
+        pipeline_run: RunState,
+        parallelism_potential: Any = None,
+        monitor: bool = True
+    ) -> PipelineResult:
+        """
+        Execute an analyzed pipeline run and clean up its executor state.
+        """
+        run_id = pipeline_run.id
+        
+        plan = self.run_plans.get(run_id)
+        if plan is not None:
+            parallelism_potential = plan.parallelism_potential
         
         logger.info(
             "pipeline_execution_started",
             run_id=str(run_id),
             name=pipeline_run.name,
-            dependency_validation=dependency_analysis['validation']['valid'],
-            parallelism_potential=dependency_analysis['parallelism']['potential']
+            parallelism_potential=parallelism_potential
         )
         
         try:
@@ -177,7 +400,7 @@ class PipelineExecutor:
             
             # Start monitoring
             monitor_task = None
-            if self.config.enable_monitoring:
+            if monitor and self.config.enable_monitoring:
                 monitor_task = asyncio.create_task(
                     self.monitor.monitor_pipeline(pipeline_run)
                 )
@@ -187,7 +410,7 @@ class PipelineExecutor:
             
             # Broadcast pipeline start event
             if websocket_enabled:
-                await broadcast_pipeline_started(str(run_id), pipeline_run)
+                await broadcast_pipeline_started(str(run_id), pipeline_run.to_model())
             
             # Execute agents with dependency resolution and parallelization
             await self._execute_pipeline_agents(pipeline_run)
@@ -256,17 +479,44 @@ class PipelineExecutor:
             # Clean up
             if run_id in self.active_runs:
                 del self.active_runs[run_id]
+            self.run_wakeups.pop(run_id, None)
+            self.run_deadlines.pop(run_id, None)
+            self.run_tasks.pop(run_id, None)
+            self.run_plans.pop(run_id, None)
+            for execution in pipeline_run.executions:
+                self.output_streams.pop(execution.id, None)
+                self.context_layers.pop(execution.id, None)
+            
+            await self._prune_artifacts()
+    
+    async def _prune_artifacts(self):
+        """Prune expired artifacts, at most once per artifact_prune_interval."""
+        if not self.artifact_store:
+            return
+        
+        now = time.monotonic()
+        if now - self._last_artifact_prune < self.config.artifact_prune_interval:
+            return
+        self._last_artifact_prune = now
+        
+        try:
+            await asyncio.to_thread(self.artifact_store.prune, self.config.artifact_retention_seconds)
+        except OSError as e:
+            logger.warning("artifact_prune_failed", error=str(e))
     
-    async def _execute_pipeline_agents(self, pipeline_run: PipelineRun):
+    async def _execute_pipeline_agents(self, pipeline_run: RunState):
         """
         Execute all agents in the pipeline with advanced scheduling and dependency resolution.
         """
-        start_time = time.time()
-        running_tasks: Dict[str, asyncio.Task] = {}
+        running_tasks = self.run_tasks.setdefault(pipeline_run.id, {})
+        wakeup = self.run_wakeups.setdefault(pipeline_run.id, asyncio.Event())
+        run_deadline = self._get_run_deadline(pipeline_run)
         
         while not pipeline_run.is_complete():
-            # Check if pipeline is paused
-            if pipeline_run.id in self.paused_pipelines:
+            # Check if pipeline is paused; running agents that weren't
+            # preempted still finish and release their slots while paused
+            paused = pipeline_run.id in self.paused_pipelines
+            if paused and not running_tasks:
                 # Wait for resume signal
                 if pipeline_run.id not in self.pause_events:
                     self.pause_events[pipeline_run.id] = asyncio.Event()
@@ -276,18 +526,21 @@ class PipelineExecutor:
                 # Check if still not cancelled after resume
                 if pipeline_run.status == PipelineStatus.CANCELLED:
                     break
+                continue
             
-            # Check for timeout
-            if time.time() - start_time > self.config.pipeline_timeout:
-                logger.error(
-                    "pipeline_timeout",
-                    run_id=str(pipeline_run.id),
-                    timeout=self.config.pipeline_timeout
-                )
+            # Check for timeout or cancellation
+            if run_deadline.done:
+                if run_deadline.expired:
+                    logger.error(
+                        "pipeline_timeout",
+                        run_id=str(pipeline_run.id),
+                        timeout=self.config.pipeline_timeout
+                    )
+                    self._cancel_running_executions(pipeline_run, "pipeline_timeout")
                 break
             
             # Use scheduler to determine which executions to start
-            scheduled_executions = await self.scheduler.schedule_executions(pipeline_run)
+            scheduled_executions = [] if paused else await self.scheduler.schedule_executions(pipeline_run)
             
             # Start scheduled executions
             for execution in scheduled_executions:
@@ -306,14 +559,19 @@ class PipelineExecutor:
                         priority=execution.priority
                     )
             
-            # Wait for at least one task to complete
+            # Wait for at least one task to complete (or a streamed chunk to land)
             if running_tasks:
+                wakeup_task = asyncio.create_task(wakeup.wait())
                 done, pending = await asyncio.wait(
-                    running_tasks.values(),
+                    [*running_tasks.values(), wakeup_task],
                     return_when=asyncio.FIRST_COMPLETED,
-                    timeout=1.0  # Check every second
+                    timeout=min(1.0, run_deadline.remaining())  # Check every second
                 )
                 
+                wakeup_task.cancel()
+                wakeup.clear()
+                done.discard(wakeup_task)
+                
                 # Process completed tasks
                 for task in done:
                     agent_type = None
@@ -326,20 +584,35 @@ class PipelineExecutor:
                         del running_tasks[agent_type]
                         pipeline_run.currently_running -= 1
                         
+                        if task.cancelled():
+                            # Slot was already released when the task was cancelled;
+                            # an execution preempted out of its last attempt failed
+                            execution = pipeline_run.get_execution(agent_type)
+                            if execution:
+                                self._skip_failed_subtree(pipeline_run, execution)
+                            continue
+                        
                         try:
                             await task  # Get result or raise exception
                             
                             # Notify scheduler of completion
                             execution = pipeline_run.get_execution(agent_type)
                             if execution:
+                                self._skip_failed_subtree(pipeline_run, execution)
                                 queued_execution = await self.scheduler.execution_completed(execution)
-                                # If scheduler promoted a queued execution, start it
-                                if queued_execution and queued_execution.agent_type not in running_tasks:
+                                # If scheduler promoted a queued execution of this run, start it
+                                if queued_execution and self._can_start_promoted(pipeline_run, queued_execution):
                                     new_task = asyncio.create_task(
                                         self._execute_single_agent(pipeline_run, queued_execution)
                                     )
                                     running_tasks[queued_execution.agent_type] = new_task
                                     pipeline_run.currently_running += 1
+                                elif queued_execution:
+                                    # Its own (possibly paused) run re-admits it later
+                                    self.scheduler.resource_pool.release_resources(queued_execution)
+                                
+                                # Freed slots may let other pipelines proceed
+                                self._wake_pipelines()
                                     
                         except Exception as e:
                             logger.error(
@@ -347,9 +620,16 @@ class PipelineExecutor:
                                 agent_type=agent_type,
                                 error=str(e)
                             )
+                            execution = pipeline_run.get_execution(agent_type)
+                            if execution:
+                                self._skip_failed_subtree(pipeline_run, execution)
             else:
-                # No tasks running, wait briefly
-                await asyncio.sleep(0.1)
+                # No tasks running: wait for released resources or a resume
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=min(1.0, run_deadline.remaining()))
+                except asyncio.TimeoutError:
+                    pass
+                wakeup.clear()
             
             # Update progress
             pipeline_run.update_progress()
@@ -367,39 +647,80 @@ class PipelineExecutor:
         if running_tasks:
             await asyncio.gather(*running_tasks.values(), return_exceptions=True)
     
-    async def _execute_single_agent(self, pipeline_run: PipelineRun, execution: AgentExecution):
+    async def _execute_single_agent(self, pipeline_run: RunState, execution: ExecutionState):
         """
         Execute a single agent with retry logic and error handling.
+        
+        A preempted execution is requeued whichever part of its attempt
+        cycle (the attempt itself, recovery or the retry backoff) the
+        preemption lands in.
+        """
+        try:
+            await self._run_attempts(pipeline_run, execution)
+        except (asyncio.CancelledError, AgentCancelledError):
+            if execution.id in self.preempting_executions:
+                self._requeue_preempted(pipeline_run, execution)
+            raise
+    
+    async def _run_attempts(self, pipeline_run: RunState, execution: ExecutionState):
+        """
+        Run attempts of an execution until it succeeds or runs out of retries.
+        
+        The agent class is resolved once: retries keep the version the
+        execution started with even if the agent is hot-reloaded meanwhile.
         """
         agent_type = execution.agent_type
+        agent_class = None
         
-        while execution.can_retry() or execution.status == ExecutionStatus.PENDING:
+        while execution.status in (ExecutionStatus.PENDING, ExecutionStatus.RETRY):
             try:
-                # Acquire execution semaphore
-                async with self.execution_semaphore:
-                    # Get agent instance
-                    if agent_type not in self.agent_registry.agents:
-                        raise ValueError(f"Agent type '{agent_type}' not registered")
+                # Acquire execution slot
+                async with self._get_execution_slot(agent_type):
+                    # Get agent class
+                    if agent_class is None:
+                        if agent_type not in self.agent_registry.agents:
+                            raise ValueError(f"Agent type '{agent_type}' not registered")
+                        
+                        agent_class = self.agent_registry.agents[agent_type]
                     
-                    agent_class = self.agent_registry.agents[agent_type]
-                    agent = agent_class()
+                    # Each attempt is bounded by both the pipeline and execution timeouts
+                    attempt_deadline = self._get_run_deadline(pipeline_run).child(
+                        self.config.execution_timeout
+                    )
+                    attempt_deadline.check()
                     
                     # Prepare input
-                    agent_input = self._prepare_agent_input(pipeline_run, execution)
+                    agent_input = self._prepare_agent_input(pipeline_run, execution, attempt_deadline)
+                    if execution.checkpoint:
+                        agent_input.metadata['checkpoint'] = execution.checkpoint
                     execution.input_data = agent_input
                     execution.mark_started()
                     
-                    # Execute with timeout
-                    output = await asyncio.wait_for(
-                        agent.execute(agent_input),
-                        timeout=self.config.execution_timeout
-                    )
+                    # Execute with timeout (hedged if a straggler is detected)
+                    with self.performance_stats.track(agent_type):
+                        output = await self._run_agent_attempt(
+                            pipeline_run, execution, agent_class, agent_input
+                        )
+                        
+                        # Agents report handled errors as a failure output
+                        if output.status == "failure":
+                            raise AgentExecutionError(
+                                output.error_message or "Agent reported failure",
+                                agent_type=agent_type,
+                                execution_id=execution.id,
+                                phase="execute"
+                            )
                     
                     # Mark as completed
                     execution.mark_completed(output)
+                    self.hedging.record_latency(agent_type, execution.duration_seconds)
                     
-                    # Store artifacts
+                    # Store artifacts; large payloads are spilled and only handles are kept
                     if output.artifacts:
+                        if self.artifact_store:
+                            output.artifacts = await asyncio.to_thread(
+                                self.artifact_store.store_artifacts, output.artifacts
+                            )
                         pipeline_run.artifacts.update(output.artifacts)
                     
                     logger.info(
@@ -413,6 +734,21 @@ class PipelineExecutor:
                     
                     break
                     
+            except (asyncio.CancelledError, AgentCancelledError):
+                if execution.id in self.preempting_executions:
+                    raise  # Requeued by _execute_single_agent
+                
+                execution.status = ExecutionStatus.CANCELLED
+                execution.completed_at = datetime.utcnow()
+                
+                logger.info(
+                    "agent_execution_cancelled",
+                    run_id=str(pipeline_run.id),
+                    agent_type=agent_type,
+                    attempt=execution.attempt_number
+                )
+                raise
+            
             except asyncio.TimeoutError:
                 execution.status = ExecutionStatus.TIMEOUT
                 execution.last_error = f"Execution timeout after {self.config.execution_timeout}s"
@@ -466,31 +802,432 @@ class PipelineExecutor:
                     execution.status = ExecutionStatus.FAILURE
                 break
     
-    def _prepare_agent_input(self, pipeline_run: PipelineRun, execution: AgentExecution) -> AgentInput:
+    async def _run_agent_attempt(
+        self,
+        pipeline_run: RunState,
+        execution: ExecutionState,
+        agent_class: Any,
+        agent_input: AgentInput
+    ):
+        """
+        Run one attempt of an agent, streaming, coalesced with identical
+        in-flight requests, or directly.
+        """
+        if pipeline_run.has_stream_consumers(execution.agent_type):
+            stream = self.output_streams.get(execution.id)
+            if stream is None or not stream.closed:
+                return await self._run_streaming_attempt(
+                    pipeline_run, execution, agent_class, agent_input
+                )
+        
+        if execution.agent_type in self.config.coalesce_agent_types:
+            return await self._run_coalesced_attempt(
+                pipeline_run, execution, agent_class, agent_input
+            )
+        
+        return await self._run_direct_attempt(pipeline_run, execution, agent_class, agent_input)
+    
+    async def _run_coalesced_attempt(
+        self,
+        pipeline_run: RunState,
+        execution: ExecutionState,
+        agent_class: Any,
+        agent_input: AgentInput
+    ):
+        """
+        Run an attempt through single-flight coalescing, keyed by agent class
+        and input content hash.
+        
+        Each caller is bounded by its own attempt timeout. If the shared call
+        was cancelled on behalf of another run, the attempt joins or starts a
+        new flight once instead of failing. The shared call runs on behalf of
+        the caller that started it, so its hedging statistics and preemption
+        checkpoints belong to that run only.
+        """
+        # The class id keeps executions of different versions of a reloaded agent apart
+        key = (
+            f"{agent_class.__module__}.{agent_class.__qualname__}@{id(agent_class):x}:"
+            f"{agent_input.content_hash()}"
+        )
+        
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + self._get_attempt_timeout(agent_input)
+        
+        rejoined = False
+        while True:
+            try:
+                output = await asyncio.wait_for(
+                    self.single_flight.run(key, lambda: self._run_direct_attempt(
+                        pipeline_run, execution, agent_class, agent_input
+                    )),
+                    timeout=max(0.0, expires_at - loop.time())
+                )
+            except AgentCancelledError:
+                if rejoined or (agent_input.deadline and agent_input.deadline.done):
+                    raise
+                rejoined = True
+                continue
+            
+            # Callers share the output; each gets its own deep copy bound to its execution
+            return output.model_copy(
+                update={'agent_execution_id': agent_input.agent_execution_id}, deep=True
+            )
+    
+    async def _run_direct_attempt(
+        self,
+        pipeline_run: RunState,
+        execution: ExecutionState,
+        agent_class: Any,
+        agent_input: AgentInput
+    ):
+        """
+        Run one attempt of an agent, hedging it with a second attempt if it
+        exceeds the learned latency percentile for its agent type.
+        
+        Whichever attempt finishes first wins; the other is cancelled and
+        cleaned up. Raises asyncio.TimeoutError after execution_timeout.
+        """
+        agent_type = execution.agent_type
+        timeout = self._get_attempt_timeout(agent_input)
+        
+        # Opted-in agent types run in cross-pipeline batches (never hedged)
+        if agent_type in self.config.micro_batch_agent_types:
+            return await asyncio.wait_for(
+                self.batcher.execute(agent_class, agent_input), timeout=timeout
+            )
+        
+        self.hedging.record_attempt(agent_type)
+        
+        hedge_delay = self.hedging.get_hedge_delay(agent_type)
+        if hedge_delay is None or hedge_delay >= timeout:
+            agent = agent_class()
+            try:
+                return await asyncio.wait_for(agent.execute(agent_input), timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError, AgentCancelledError):
+                await agent.cleanup()
+                raise
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        primary_agent = agent_class()
+        primary_task = asyncio.create_task(primary_agent.execute(agent_input))
+        attempts = {primary_task: primary_agent}
+        hedge_task = None
+        
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=hedge_delay)
+            
+            if not done and self.hedging.try_launch_hedge(agent_type):
+                hedge_agent = agent_class()
+                hedge_input = agent_input.model_copy(update={
+                    'agent_execution_id': uuid4(),
+                    'previous_outputs': fork_context(agent_input.previous_outputs),
+                    'project_context': fork_context(agent_input.project_context)
+                })
+                hedge_task = asyncio.create_task(hedge_agent.execute(hedge_input))
+                attempts[hedge_task] = hedge_agent
+                
+                logger.info(
+                    "agent_execution_hedged",
+                    run_id=str(pipeline_run.id),
+                    agent_type=agent_type,
+                    hedge_delay=hedge_delay
+                )
+            
+            pending = set(attempts)
+            last_failure = None  # exception or failure output of the last failed attempt
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    failure = task.exception()
+                    if failure is None and task.result().status == "failure":
+                        failure = task.result()  # handled errors come back as a failure output
+                    if failure is not None:
+                        # A failed attempt doesn't win while another is still running
+                        last_failure = failure
+                        continue
+                    
+                    if task is hedge_task:
+                        self.hedging.record_hedge_win(agent_type)
+                        logger.info(
+                            "agent_execution_hedge_won",
+                            run_id=str(pipeline_run.id),
+                            agent_type=agent_type
+                        )
+                    return task.result()
+            
+            if isinstance(last_failure, BaseException):
+                raise last_failure
+            return last_failure
+        
+        finally:
+            for task, agent in attempts.items():
+                if not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except (asyncio.CancelledError, Exception):
+                        pass
+                    await agent.cleanup()
+    
+    async def _run_streaming_attempt(
+        self,
+        pipeline_run: RunState,
+        execution: ExecutionState,
+        agent_class: Any,
+        agent_input: AgentInput
+    ):
+        """
+        Run one attempt of an agent that has stream consumers, publishing
+        partial outputs as they arrive.
+        
+        The stream is closed when the attempt ends; if the attempt fails,
+        consumers see the error and later retries run without streaming.
+        """
+        stream = self.output_streams.setdefault(execution.id, OutputStream(execution.agent_type))
+        wakeup = self.run_wakeups.get(pipeline_run.id)
+        agent = agent_class()
+        
+        async def consume_stream():
+            final_output = None
+            async for chunk in agent.execute_stream(agent_input):
+                if not chunk.is_chunk:
+                    final_output = chunk
+                    continue
+                
+                await stream.publish(chunk)
+                execution.partial_output_count += 1
+                
+                # Let the executor loop admit stream dependents right away
+                if execution.partial_output_count == 1 and wakeup:
+                    wakeup.set()
+            
+            return final_output
+        
+        try:
+            output = await asyncio.wait_for(
+                consume_stream(),
+                timeout=self._get_attempt_timeout(agent_input)
+            )
+        except BaseException as e:
+            await stream.close(error=str(e) or type(e).__name__)
+            if not isinstance(e, Exception) or isinstance(e, (asyncio.TimeoutError, AgentCancelledError)):
+                await agent.cleanup()
+            raise
+        
+        await stream.close(final_output=output)
+        
+        logger.debug(
+            "agent_stream_finished",
+            run_id=str(pipeline_run.id),
+            agent_type=execution.agent_type,
+            chunks=execution.partial_output_count
+        )
+        
+        return output
+    
+    def _skip_failed_subtree(self, pipeline_run: RunState, execution: ExecutionState):
+        """Skip the pending dependents of a terminally failed execution."""
+        skipped = pipeline_run.skip_blocked_dependents(execution.agent_type)
+        
+        if skipped:
+            logger.warning(
+                "dependent_executions_skipped",
+                run_id=str(pipeline_run.id),
+                failed_agent=execution.agent_type,
+                skipped_agents=[e.agent_type for e in skipped]
+            )
+    
+    def _can_start_promoted(self, pipeline_run: RunState, execution: ExecutionState) -> bool:
+        """Check if a queued execution promoted by the scheduler can start in this run now."""
+        return (
+            execution.run_id == pipeline_run.id and
+            execution.status == ExecutionStatus.PENDING and
+            pipeline_run.id not in self.paused_pipelines and
+            execution.agent_type not in self.run_tasks.get(pipeline_run.id, {})
+        )
+    
+    def _wake_pipelines(self):
+        """Wake every pipeline loop waiting for scheduler resources."""
+        for wakeup in self.run_wakeups.values():
+            wakeup.set()
+    
+    def _preempt_running_executions(self, pipeline_run: RunState, checkpoint: bool) -> List[str]:
+        """
+        Cancel a run's in-flight agents and release their slots, leaving the
+        executions pending so resume re-admits them with their original priority.
+        """
+        preempted = []
+        
+        for agent_type, task in self.run_tasks.get(pipeline_run.id, {}).items():
+            execution = pipeline_run.get_execution(agent_type)
+            if task.done() or not execution:
+                continue
+            
+            if checkpoint:
+                # Partial outputs are kept as JSON-compatible dicts so the
+                # checkpoint serializes with the execution; resumed agents can
+                # restore them with AgentOutput.model_validate
+                stream = self.output_streams.get(execution.id)
+                execution.checkpoint = {
+                    'attempt_number': execution.attempt_number,
+                    'progress_percentage': execution.progress_percentage,
+                    'current_step': execution.current_step,
+                    'steps_completed': execution.steps_completed,
+                    'partial_outputs': [chunk.model_dump(mode="json") for chunk in stream.chunks] if stream else [],
+                    'preempted_at': datetime.utcnow().isoformat()
+                }
+            
+            self.preempting_executions.add(execution.id)
+            task.cancel()
+            self.scheduler.resource_pool.release_resources(execution)
+            preempted.append(agent_type)
+        
+        if preempted:
+            self._wake_pipelines()
+        
+        return preempted
+    
+    def _requeue_preempted(self, pipeline_run: RunState, execution: ExecutionState):
+        """
+        Return a preempted execution to pending without consuming an attempt.
+        
+        An attempt that had already failed (preempted during recovery) still
+        counts: the execution moves on to its next attempt, or stays failed
+        when it has none left.
+        """
+        self.preempting_executions.discard(execution.id)
+        
+        if execution.status in (ExecutionStatus.FAILURE, ExecutionStatus.TIMEOUT):
+            if not execution.can_retry():
+                execution.status = ExecutionStatus.FAILURE
+                return
+            execution.attempt_number += 1
+        
+        execution.status = ExecutionStatus.PENDING
+        execution.started_at = None
+        execution.preemption_count += 1
+        
+        # Stream consumers were preempted too; the next attempt streams afresh
+        self.output_streams.pop(execution.id, None)
+        execution.partial_output_count = 0
+        
+        logger.info(
+            "agent_execution_preempted",
+            run_id=str(pipeline_run.id),
+            agent_type=execution.agent_type,
+            priority=execution.priority,
+            checkpointed=execution.checkpoint is not None
+        )
+    
+    def _get_execution_slot(self, agent_type: str):
+        """Get the concurrency slot for an attempt; batched agent types take one slot per batch."""
+        if agent_type in self.config.micro_batch_agent_types:
+            return nullcontext()
+        return self.execution_semaphore
+    
+    def _get_run_deadline(self, pipeline_run: RunState) -> Deadline:
+        """Get (or start) the deadline bounding a pipeline run."""
+        if pipeline_run.id not in self.run_deadlines:
+            self.run_deadlines[pipeline_run.id] = Deadline.after(self.config.pipeline_timeout)
+        return self.run_deadlines[pipeline_run.id]
+    
+    def _get_attempt_timeout(self, agent_input: AgentInput) -> float:
+        """Get the time an attempt may run, honoring the input's deadline."""
+        if agent_input.deadline is not None:
+            remaining = agent_input.deadline.remaining()
+            if remaining is not None:
+                return min(remaining, self.config.execution_timeout)
+        return self.config.execution_timeout
+    
+    def _cancel_running_executions(self, pipeline_run: RunState, reason: str):
+        """
+        Cancel the run's deadline and in-flight agent tasks, releasing their
+        scheduler slots immediately.
+        """
+        self._get_run_deadline(pipeline_run).cancel(reason)
+        
+        for task in self.run_tasks.get(pipeline_run.id, {}).values():
+            if not task.done():
+                task.cancel()
+        
+        for execution in pipeline_run.executions:
+            if execution.status in [ExecutionStatus.RUNNING, ExecutionStatus.RETRY]:
+                execution.status = ExecutionStatus.CANCELLED
+            self.scheduler.resource_pool.release_resources(execution)
+        
+        if pipeline_run.id in self.run_wakeups:
+            self.run_wakeups[pipeline_run.id].set()
+    
+    def _prepare_agent_input(
+        self,
+        pipeline_run: RunState,
+        execution: ExecutionState,
+        deadline: Optional[Deadline] = None
+    ) -> AgentInput:
         """
         Prepare input data for agent execution based on previous outputs.
+        
+        Contexts are layered rather than copied: each completed dependency
+        contributes a read-only layer built once and shared by all of its
+        dependents, and writes by the agent land in its own front layer.
         """
-        # Collect outputs from completed dependencies
-        previous_outputs = {}
+        # Collect outputs from completed dependencies (later dependencies win)
+        layers = []
         previous_agent = None
+        dependency_streams = {}
         
         for dep_agent_type in execution.depends_on:
             dep_execution = pipeline_run.get_execution(dep_agent_type)
             if dep_execution and dep_execution.output_data:
-                previous_outputs[dep_agent_type] = dep_execution.output_data.primary_result
-                if dep_execution.output_data.context_updates:
-                    previous_outputs.update(dep_execution.output_data.context_updates)
+                layers.append(self._get_context_layer(dep_execution))
                 previous_agent = dep_agent_type
-        
-        return AgentInput(
+            elif dep_execution and dep_agent_type in execution.stream_dependencies:
+                # Dependency is still running: hand over its live stream
+                stream = self.output_streams.get(dep_execution.id)
+                if stream:
+                    dependency_streams[dep_agent_type] = stream
+                    layers.append({
+                        dep_agent_type: [chunk.primary_result for chunk in stream.chunks]
+                    })
+                    previous_agent = dep_agent_type
+        
+        # Internal, already-validated data: skip re-validation so the shared
+        # layers are passed by reference instead of being copied into dicts
+        return AgentInput.model_construct(
             run_id=pipeline_run.id,
             feature_brief=pipeline_run.feature_brief,
-            project_context=pipeline_run.project_context,
-            previous_outputs=previous_outputs,
-            previous_agent=previous_agent
+            project_context=layer_contexts(pipeline_run.project_context),
+            previous_outputs=layer_contexts(*reversed(layers)),
+            previous_agent=previous_agent,
+            dependency_streams=dependency_streams,
+            deadline=deadline,
+            artifact_store=self.artifact_store
         )
     
-    def _create_pipeline_result(self, pipeline_run: PipelineRun) -> PipelineResult:
+    def _get_context_layer(self, execution: ExecutionState) -> Mapping[str, Any]:
+        """Get the shared, read-only context contributed by a completed execution."""
+        layer = self.context_layers.get(execution.id)
+        
+        if layer is None:
+            output = execution.output_data
+            values = {execution.agent_type: output.primary_result}
+            values.update(output.context_updates or {})
+            layer = self.context_layers[execution.id] = MappingProxyType(values)
+        
+        return layer
+    
+    def _create_pipeline_result(self, pipeline_run: RunState) -> PipelineResult:
         """
         Create final pipeline result from completed run.
         """
@@ -544,6 +1281,14 @@ class PipelineExecutor:
             if execution.status in [ExecutionStatus.PENDING, ExecutionStatus.RUNNING]:
                 execution.status = ExecutionStatus.CANCELLED
         
+        # Propagate to in-flight agents and free their slots right away
+        self._cancel_running_executions(pipeline_run, "pipeline_cancelled")
+        
+        # Release a paused executor loop so it can observe the cancellation
+        self.paused_pipelines.discard(run_id)
+        if run_id in self.pause_events:
+            self.pause_events[run_id].set()
+        
         logger.info(
             "pipeline_cancelled",
             run_id=str(run_id)
@@ -551,9 +1296,27 @@ class PipelineExecutor:
         
         return True
     
-    async def pause_pipeline(self, run_id: UUID) -> bool:
+    async def shutdown(self):
+        """
+        Cancel active pipelines and release the executor's resources,
+        including its own artifact directory (a configured
+        artifact_store_path is left in place).
+        """
+        for run_id in list(self.active_runs):
+            await self.cancel_pipeline(run_id)
+        
+        if self.artifact_store and self._owns_artifact_root:
+            await asyncio.to_thread(self.artifact_store.remove)
+        
+        logger.info("pipeline_executor_shutdown")
+    
+    async def pause_pipeline(self, run_id: UUID, preempt: bool = False, checkpoint: bool = True) -> bool:
         """
         Pause a running pipeline.
+        
+        With preempt, running agents are cancelled (after capturing a
+        checkpoint, if requested) and their slots released to other
+        pipelines; resume re-admits them with their original priority.
         """
         pipeline_run = self.active_runs.get(run_id)
         if not pipeline_run or pipeline_run.status != PipelineStatus.RUNNING:
@@ -572,16 +1335,19 @@ class PipelineExecutor:
         # Update pipeline status
         pipeline_run.status = PipelineStatus.PAUSED
         
+        preempted = self._preempt_running_executions(pipeline_run, checkpoint) if preempt else []
+        
         logger.info(
             "pipeline_paused",
-            run_id=str(run_id)
+            run_id=str(run_id),
+            preempted=preempted
         )
         
         # Notify via events
         await self.monitor.record_event(
             run_id,
             'pipeline_paused',
-            {'paused_at': datetime.utcnow().isoformat()}
+            {'paused_at': datetime.utcnow().isoformat(), 'preempted_agents': preempted}
         )
         
         return True
@@ -600,6 +1366,8 @@ class PipelineExecutor:
         # Set the event to resume execution
         if run_id in self.pause_events:
             self.pause_events[run_id].set()
+        if run_id in self.run_wakeups:
+            self.run_wakeups[run_id].set()
         
         # Update pipeline status
         pipeline_run.status = PipelineStatus.RUNNING
@@ -622,13 +1390,14 @@ class PipelineExecutor:
         """
         Get current status of a pipeline run.
         """
-        return self.active_runs.get(run_id)
+        pipeline_run = self.active_runs.get(run_id)
+        return pipeline_run.to_model() if pipeline_run else None
     
     def list_active_pipelines(self) -> List[PipelineRun]:
         """
         List all currently active pipeline runs.
         """
-        return list(self.active_runs.values())
+        return [pipeline_run.to_model() for pipeline_run in self.active_runs.values()]
     
     async def analyze_pipeline_dependencies(self, run_id: UUID) -> Dict[str, Any]:
         """
@@ -694,6 +1463,8 @@ class PipelineExecutor:
         scheduler_metrics = await self.scheduler.get_scheduling_metrics()
         recovery_stats = self.recovery.get_recovery_statistics()
         dependency_health = await self.dependency_manager.health_check()
+        hedging_stats = self.hedging.get_statistics()
+        agent_performance = self.performance_stats.get_statistics()
         
         # Calculate success rates
         total_pipelines = self.executor_metrics['total_pipelines_executed']
@@ -710,6 +1481,8 @@ class PipelineExecutor:
             'scheduling_metrics': scheduler_metrics,
             'recovery_statistics': recovery_stats,
             'dependency_health': dependency_health,
+            'hedging_statistics': hedging_stats,
+            'agent_performance': agent_performance,
             'component_status': {
                 'scheduler': 'active' if len(scheduler_metrics) > 0 else 'inactive',
                 'monitor': 'active' if self.config.enable_monitoring else 'disabled',
@@ -747,7 +1520,7 @@ class PipelineExecutor:
                     optimized_executions = self.dependency_manager.get_optimized_execution_order(
                         pipeline_run.executions
                     )
-                    pipeline_run.executions = optimized_executions
+                    pipeline_run.set_executions(optimized_executions)
                     optimization_results['applied_optimizations'].append('execution_order_optimized')
                     
                 except Exception as e:
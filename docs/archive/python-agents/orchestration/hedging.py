@@ -0,0 +1,144 @@
+"""
+Hedged Execution - Speculative duplicate attempts for tail-latency control.
+
+Learns per-agent-type latency distributions and decides when a straggling
+attempt should be hedged with a second, concurrent attempt. Hedging is
+bounded by a per-type budget so it never adds more than a configured
+fraction of extra load.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+import structlog
+
+from .models import OrchestrationConfig
+
+logger = structlog.get_logger()
+
+
+class LatencyTracker:
+    """Rolling per-agent-type latency samples with percentile lookup."""
+    
+    def __init__(self, window_size: int = 200):
+        self.window_size = window_size
+        self._samples: Dict[str, Deque[float]] = {}
+    
+    def record(self, agent_type: str, duration_seconds: float):
+        """Record a completed attempt duration for an agent type."""
+        if duration_seconds is None or duration_seconds < 0:
+            return
+        
+        if agent_type not in self._samples:
+            self._samples[agent_type] = deque(maxlen=self.window_size)
+        self._samples[agent_type].append(duration_seconds)
+    
+    def sample_count(self, agent_type: str) -> int:
+        """Get number of samples recorded for an agent type."""
+        return len(self._samples.get(agent_type, ()))
+    
+    def percentile(self, agent_type: str, percentile: float) -> Optional[float]:
+        """Get latency percentile (0-100) for an agent type, if any samples exist."""
+        samples = self._samples.get(agent_type)
+        if not samples:
+            return None
+        
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round((percentile / 100.0) * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Per-agent-type accounting that caps hedges to a fraction of attempts."""
+    
+    def __init__(self, max_fraction: float):
+        self.max_fraction = max_fraction
+        self.attempts: Dict[str, int] = {}
+        self.hedges: Dict[str, int] = {}
+    
+    def record_attempt(self, agent_type: str):
+        """Record a primary attempt for an agent type."""
+        self.attempts[agent_type] = self.attempts.get(agent_type, 0) + 1
+    
+    def try_acquire(self, agent_type: str) -> bool:
+        """Reserve budget for one hedge; returns False if the budget is exhausted."""
+        attempts = self.attempts.get(agent_type, 0)
+        hedges = self.hedges.get(agent_type, 0)
+        
+        if hedges + 1 > attempts * self.max_fraction:
+            return False
+        
+        self.hedges[agent_type] = hedges + 1
+        return True
+
+
+class HedgingPolicy:
+    """
+    Decides when to launch a hedged attempt based on learned latency
+    percentiles and the per-type hedge budget.
+    """
+    
+    def __init__(self, config: OrchestrationConfig):
+        self.config = config
+        self.latency_tracker = LatencyTracker(config.hedge_window_size)
+        self.budget = HedgeBudget(config.hedge_max_extra_load)
+        
+        self.hedge_stats = {
+            'hedges_launched': 0,
+            'hedges_won': 0,
+            'hedges_denied_budget': 0
+        }
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether hedging is enabled in the configuration."""
+        return self.config.enable_hedging
+    
+    def get_hedge_delay(self, agent_type: str) -> Optional[float]:
+        """
+        Get the delay after which a running attempt should be hedged.
+        
+        Returns None when hedging is disabled or not enough samples exist.
+        """
+        if not self.enabled:
+            return None
+        
+        if self.latency_tracker.sample_count(agent_type) < self.config.hedge_min_samples:
+            return None
+        
+        return self.latency_tracker.percentile(agent_type, self.config.hedge_percentile)
+    
+    def record_attempt(self, agent_type: str):
+        """Record a primary attempt for budget accounting."""
+        self.budget.record_attempt(agent_type)
+    
+    def record_latency(self, agent_type: str, duration_seconds: float):
+        """Record the latency of a completed attempt."""
+        self.latency_tracker.record(agent_type, duration_seconds)
+    
+    def try_launch_hedge(self, agent_type: str) -> bool:
+        """Check the budget and reserve a hedge slot for an agent type."""
+        if self.budget.try_acquire(agent_type):
+            self.hedge_stats['hedges_launched'] += 1
+            return True
+        
+        self.hedge_stats['hedges_denied_budget'] += 1
+        logger.debug("hedge_denied_budget", agent_type=agent_type)
+        return False
+    
+    def record_hedge_win(self, agent_type: str):
+        """Record that a hedged attempt finished before the primary."""
+        self.hedge_stats['hedges_won'] += 1
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get hedging statistics."""
+        return {
+            **self.hedge_stats,
+            'enabled': self.enabled,
+            'attempts_by_type': dict(self.budget.attempts),
+            'hedges_by_type': dict(self.budget.hedges),
+            'hedge_threshold_by_type': {
+                agent_type: self.latency_tracker.percentile(agent_type, self.config.hedge_percentile)
+                for agent_type in self.budget.attempts
+            }
+        }
@@ -49,44 +49,13 @@ class RetryStrategy(str, Enum):
     FIXED_DELAY = "fixed_delay"
 
 
-class AgentExecution(BaseModel):
-    """Individual agent execution tracking."""
-    
-    id: UUID = Field(default_factory=uuid4)
-    agent_type: str = Field(..., description="Type of agent being executed")
-    run_id: UUID = Field(..., description="Parent pipeline run ID")
-    
-    # Execution state
-    status: ExecutionStatus = Field(default=ExecutionStatus.PENDING)
-    input_data: Optional[AgentInput] = Field(default=None)
-    output_data: Optional[AgentOutput] = Field(default=None)
-    
-    # Timing
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = Field(default=None)
-    completed_at: Optional[datetime] = Field(default=None)
-    duration_seconds: Optional[float] = Field(default=None)
-    
-    # Retry handling
-    attempt_number: int = Field(default=1, ge=1)
-    max_attempts: int = Field(default=3, ge=1)
-    retry_strategy: RetryStrategy = Field(default=RetryStrategy.EXPONENTIAL_BACKOFF)
-    last_error: Optional[str] = Field(default=None)
+class ExecutionLifecycle:
+    """
+    Execution state transitions shared by AgentExecution and the slots-based
+    ExecutionState used on the executor hot path.
+    """
     
-    # Dependencies
-    depends_on: List[str] = Field(default_factory=list, description="Agent types this depends on")
-    blocking: List[str] = Field(default_factory=list, description="Agent types blocked by this")
-    
-    # Resources
-    priority: int = Field(default=50, ge=1, le=100, description="Execution priority (1-100)")
-    resource_requirements: Dict[str, Any] = Field(default_factory=dict)
-    estimated_duration: Optional[float] = Field(default=None)
-    
-    # Progress tracking
-    progress_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
-    current_step: Optional[str] = Field(default=None)
-    steps_completed: int = Field(default=0, ge=0)
-    total_steps: int = Field(default=1, ge=1)
+    __slots__ = ()
     
     def mark_started(self):
         """Mark execution as started."""
@@ -112,6 +81,19 @@ class AgentExecution(BaseModel):
         if self.started_at:
             self.duration_seconds = (self.completed_at - self.started_at).total_seconds()
     
+    def mark_skipped(self, reason: str):
+        """Mark execution as skipped because it can never run."""
+        self.status = ExecutionStatus.CANCELLED
+        self.last_error = reason
+        self.completed_at = datetime.utcnow()
+    
+    def is_terminally_failed(self) -> bool:
+        """Check if this execution finished without success and won't be retried."""
+        return (
+            self.status in [ExecutionStatus.FAILURE, ExecutionStatus.CANCELLED, ExecutionStatus.TIMEOUT] and
+            not self.can_retry()
+        )
+    
     def can_retry(self) -> bool:
         """Check if this execution can be retried."""
         return (
@@ -136,20 +118,17 @@ class AgentExecution(BaseModel):
             return 0.0
 
 
-class PipelineRun(BaseModel):
-    """Complete pipeline execution tracking."""
+class AgentExecution(ExecutionLifecycle, BaseModel):
+    """Individual agent execution tracking."""
     
     id: UUID = Field(default_factory=uuid4)
-    name: str = Field(..., description="Human-readable pipeline name")
-    feature_brief: str = Field(..., description="Original feature description")
+    agent_type: str = Field(..., description="Type of agent being executed")
+    run_id: UUID = Field(..., description="Parent pipeline run ID")
     
     # Execution state
-    status: PipelineStatus = Field(default=PipelineStatus.CREATED)
-    executions: List[AgentExecution] = Field(default_factory=list)
-    
-    # Configuration
-    project_context: Dict[str, Any] = Field(default_factory=dict)
-    orchestration_config: 'OrchestrationConfig' = Field(default_factory=lambda: OrchestrationConfig())
+    status: ExecutionStatus = Field(default=ExecutionStatus.PENDING)
+    input_data: Optional[AgentInput] = Field(default=None)
+    output_data: Optional[AgentOutput] = Field(default=None)
     
     # Timing
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -157,26 +136,66 @@ class PipelineRun(BaseModel):
     completed_at: Optional[datetime] = Field(default=None)
     duration_seconds: Optional[float] = Field(default=None)
     
-    # Results
-    artifacts: Dict[str, Any] = Field(default_factory=dict)
-    final_output: Optional[Dict[str, Any]] = Field(default=None)
+    # Retry handling
+    attempt_number: int = Field(default=1, ge=1)
+    max_attempts: int = Field(default=3, ge=1)
+    retry_strategy: RetryStrategy = Field(default=RetryStrategy.EXPONENTIAL_BACKOFF)
+    last_error: Optional[str] = Field(default=None)
     
-    # Metrics
-    total_agents: int = Field(default=0, ge=0)
-    completed_agents: int = Field(default=0, ge=0)
-    failed_agents: int = Field(default=0, ge=0)
-    progress_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
+    # Dependencies
+    depends_on: List[str] = Field(default_factory=list, description="Agent types this depends on")
+    stream_dependencies: List[str] = Field(
+        default_factory=list,
+        description="Subset of depends_on that may be consumed as a partial-output stream"
+    )
+    optional_dependencies: List[str] = Field(
+        default_factory=list,
+        description="Subset of depends_on whose failure doesn't block this execution"
+    )
+    blocking: List[str] = Field(default_factory=list, description="Agent types blocked by this")
     
-    # Parallelization tracking
-    max_parallel: int = Field(default=1, ge=1, description="Maximum parallel executions")
-    currently_running: int = Field(default=0, ge=0)
+    # Resources
+    priority: int = Field(default=50, ge=1, le=100, description="Execution priority (1-100)")
+    resource_requirements: Dict[str, Any] = Field(default_factory=dict)
+    estimated_duration: Optional[float] = Field(default=None)
     
-    def add_execution(self, agent_type: str, depends_on: Optional[List[str]] = None) -> AgentExecution:
+    # Progress tracking
+    progress_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
+    current_step: Optional[str] = Field(default=None)
+    steps_completed: int = Field(default=0, ge=0)
+    total_steps: int = Field(default=1, ge=1)
+    partial_output_count: int = Field(default=0, ge=0, description="Partial outputs streamed so far")
+    
+    # Preemption
+    preemption_count: int = Field(default=0, ge=0, description="Times this execution was preempted")
+    checkpoint: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="State captured when preempted, handed back to the agent on resume"
+    )
+
+
+class RunLifecycle:
+    """
+    Pipeline run bookkeeping shared by PipelineRun and the slots-based
+    RunState used on the executor hot path.
+    """
+    
+    __slots__ = ()
+    
+    def add_execution(
+        self,
+        agent_type: str,
+        depends_on: Optional[List[str]] = None,
+        stream_dependencies: Optional[List[str]] = None,
+        optional_dependencies: Optional[List[str]] = None
+    ) -> AgentExecution:
         """Add a new agent execution to the pipeline."""
         execution = AgentExecution(
             agent_type=agent_type,
             run_id=self.id,
             depends_on=depends_on or [],
+            stream_dependencies=stream_dependencies or [],
+            optional_dependencies=optional_dependencies or [],
             max_attempts=self.orchestration_config.default_max_attempts,
             retry_strategy=self.orchestration_config.default_retry_strategy
         )
@@ -204,7 +223,7 @@ class PipelineRun(BaseModel):
             dependencies_satisfied = True
             for dep_agent_type in execution.depends_on:
                 dep_execution = self.get_execution(dep_agent_type)
-                if not dep_execution or dep_execution.status != ExecutionStatus.SUCCESS:
+                if not dep_execution or not self._dependency_satisfied(execution, dep_execution):
                     dependencies_satisfied = False
                     break
             
@@ -214,6 +233,64 @@ class PipelineRun(BaseModel):
         # Sort by priority (higher priority first)
         return sorted(ready, key=lambda x: x.priority, reverse=True)
     
+    def _dependency_satisfied(self, execution: AgentExecution, dep_execution: AgentExecution) -> bool:
+        """Check a single dependency edge; stream edges are satisfied by the first chunk."""
+        if dep_execution.status == ExecutionStatus.SUCCESS:
+            return True
+        
+        if self._optional_failure_tolerated(execution, dep_execution):
+            return True
+        
+        return (
+            dep_execution.agent_type in execution.stream_dependencies and
+            dep_execution.status == ExecutionStatus.RUNNING and
+            dep_execution.partial_output_count > 0
+        )
+    
+    def _optional_failure_tolerated(self, execution: AgentExecution, dep_execution: AgentExecution) -> bool:
+        """Check if a failed dependency is optional and the run continues past it."""
+        return (
+            self.orchestration_config.continue_on_optional_failure and
+            dep_execution.agent_type in execution.optional_dependencies and
+            dep_execution.is_terminally_failed()
+        )
+    
+    def skip_blocked_dependents(self, agent_type: str) -> List[AgentExecution]:
+        """
+        Skip every pending execution that transitively depends on a
+        terminally failed execution, so doomed subtrees finish at once.
+        
+        Failed optional dependencies are tolerated when
+        continue_on_optional_failure is set. Returns the skipped executions.
+        """
+        failed = self.get_execution(agent_type)
+        if not failed or not failed.is_terminally_failed():
+            return []
+        
+        skipped = []
+        blocked = [failed]
+        
+        while blocked:
+            dep_execution = blocked.pop()
+            
+            for execution in self.executions:
+                if (execution.status != ExecutionStatus.PENDING or
+                        dep_execution.agent_type not in execution.depends_on or
+                        self._optional_failure_tolerated(execution, dep_execution)):
+                    continue
+                
+                execution.mark_skipped(
+                    f"Skipped: dependency '{dep_execution.agent_type}' did not succeed"
+                )
+                skipped.append(execution)
+                blocked.append(execution)
+        
+        return skipped
+    
+    def has_stream_consumers(self, agent_type: str) -> bool:
+        """Check if any execution consumes this agent type as a stream."""
+        return any(agent_type in e.stream_dependencies for e in self.executions)
+    
     def can_run_parallel(self) -> bool:
         """Check if more agents can run in parallel."""
         return self.currently_running < self.max_parallel
@@ -255,6 +332,42 @@ class PipelineRun(BaseModel):
                   for e in self.executions)
 
 
+class PipelineRun(RunLifecycle, BaseModel):
+    """Complete pipeline execution tracking."""
+    
+    id: UUID = Field(default_factory=uuid4)
+    name: str = Field(..., description="Human-readable pipeline name")
+    feature_brief: str = Field(..., description="Original feature description")
+    
+    # Execution state
+    status: PipelineStatus = Field(default=PipelineStatus.CREATED)
+    executions: List[AgentExecution] = Field(default_factory=list)
+    
+    # Configuration
+    project_context: Dict[str, Any] = Field(default_factory=dict)
+    orchestration_config: 'OrchestrationConfig' = Field(default_factory=lambda: OrchestrationConfig())
+    
+    # Timing
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = Field(default=None)
+    completed_at: Optional[datetime] = Field(default=None)
+    duration_seconds: Optional[float] = Field(default=None)
+    
+    # Results
+    artifacts: Dict[str, Any] = Field(default_factory=dict)
+    final_output: Optional[Dict[str, Any]] = Field(default=None)
+    
+    # Metrics
+    total_agents: int = Field(default=0, ge=0)
+    completed_agents: int = Field(default=0, ge=0)
+    failed_agents: int = Field(default=0, ge=0)
+    progress_percentage: float = Field(default=0.0, ge=0.0, le=100.0)
+    
+    # Parallelization tracking
+    max_parallel: int = Field(default=1, ge=1, description="Maximum parallel executions")
+    currently_running: int = Field(default=0, ge=0)
+
+
 class OrchestrationConfig(BaseModel):
     """Configuration for pipeline orchestration."""
     
@@ -286,6 +399,31 @@ class OrchestrationConfig(BaseModel):
     enable_pipeline_optimization: bool = Field(default=True, description="Optimize execution order")
     enable_caching: bool = Field(default=True, description="Cache agent outputs")
     cache_ttl_seconds: int = Field(default=3600, ge=0, description="Cache time-to-live")
+    
+    # Hedged execution
+    enable_hedging: bool = Field(default=False, description="Launch a second attempt for straggling executions")
+    hedge_percentile: float = Field(default=95.0, gt=0, lt=100, description="Latency percentile that triggers a hedge")
+    hedge_min_samples: int = Field(default=20, ge=1, description="Samples required before hedging an agent type")
+    hedge_window_size: int = Field(default=200, ge=1, description="Latency samples kept per agent type")
+    hedge_max_extra_load: float = Field(default=0.05, ge=0, le=1.0, description="Maximum hedges as a fraction of attempts per agent type")
+    
+    # Artifact storage
+    enable_artifact_store: bool = Field(default=False, description="Spill large artifacts to a content-addressed store")
+    artifact_spill_threshold: int = Field(default=64 * 1024, ge=0, description="Artifacts larger than this (bytes) are stored as handles")
+    artifact_store_path: Optional[str] = Field(default=None, description="Artifact store directory (defaults to a temp directory of each executor)")
+    artifact_retention_seconds: float = Field(default=24 * 3600.0, gt=0, description="Artifacts neither written nor reused for this long are pruned")
+    artifact_prune_interval: float = Field(default=600.0, gt=0, description="Minimum time between artifact prunes, run as pipelines complete (seconds)")
+    
+    # Batch submission
+    batch_max_active_runs: int = Field(default=10, ge=1, description="Maximum runs of a submitted batch executing at once")
+    
+    # Micro-batching
+    micro_batch_agent_types: List[str] = Field(default_factory=list, description="Agent types whose executions are batched across pipelines")
+    micro_batch_max_size: int = Field(default=8, ge=1, description="Maximum inputs per agent batch")
+    micro_batch_max_wait: float = Field(default=0.05, gt=0, description="Maximum time an execution waits for its batch to fill (seconds)")
+    
+    # Request coalescing
+    coalesce_agent_types: List[str] = Field(default_factory=list, description="Side-effect-free agent types whose identical in-flight requests share one execution")
 
 
 class PipelineResult(BaseModel):
@@ -330,6 +468,37 @@ class PipelineResult(BaseModel):
         return (len(self.successful_agents) / total) * 100.0
 
 
+class BatchResult(BaseModel):
+    """Aggregated result of a batch of pipeline runs submitted together."""
+    
+    batch_id: UUID = Field(..., description="Batch identifier")
+    template_id: str = Field(..., description="Template every run was created from")
+    
+    # Timing
+    duration_seconds: float = Field(..., ge=0)
+    started_at: datetime = Field(...)
+    completed_at: datetime = Field(...)
+    
+    # Results, in submission order
+    results: List[PipelineResult] = Field(default_factory=list)
+    
+    @property
+    def successful_runs(self) -> int:
+        """Number of runs that completed successfully."""
+        return sum(1 for result in self.results if result.is_successful())
+    
+    @property
+    def failed_runs(self) -> int:
+        """Number of runs that did not complete successfully."""
+        return len(self.results) - self.successful_runs
+    
+    def get_success_rate(self) -> float:
+        """Calculate run success rate as percentage."""
+        if not self.results:
+            return 0.0
+        return (self.successful_runs / len(self.results)) * 100.0
+
+
 # Update forward references
 OrchestrationConfig.model_rebuild()
 PipelineRun.model_rebuild()
\ No newline at end of file
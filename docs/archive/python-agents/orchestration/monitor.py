@@ -8,7 +8,7 @@ resource usage tracking, progress monitoring, and alerting.
 import asyncio
 import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from uuid import UUID
 import json
 
@@ -300,9 +300,11 @@ class PipelineMonitor:
         
         self.monitoring_active = False
         self.monitor_tasks: Dict[UUID, asyncio.Task] = {}
+        self.recorded_transitions: Set[Tuple[UUID, str]] = set()
         
         # Monitoring data storage
         self.pipeline_histories: Dict[UUID, List[Dict[str, Any]]] = {}
+        self.pipeline_events: Dict[UUID, List[Dict[str, Any]]] = {}
         self.performance_baselines: Dict[str, Dict[str, float]] = {}
         
         logger.info(
@@ -370,30 +372,37 @@ class PipelineMonitor:
             # Clean up
             if pipeline_run.id in self.monitor_tasks:
                 del self.monitor_tasks[pipeline_run.id]
+            execution_ids = {e.id for e in pipeline_run.executions}
+            self.recorded_transitions = {
+                key for key in self.recorded_transitions if key[0] not in execution_ids
+            }
     
     async def _collect_pipeline_metrics(self, pipeline_run: PipelineRun):
         """Collect metrics for a pipeline."""
-        # Track execution state changes
+        # Track execution state changes (recorded once per transition, kept
+        # here rather than as attributes bolted onto the executions)
+        recorded = self.recorded_transitions
+        
         for execution in pipeline_run.executions:
             if execution.status == ExecutionStatus.RUNNING and execution.started_at:
-                if not hasattr(execution, '_metrics_recorded'):
+                if (execution.id, 'start') not in recorded:
                     self.metric_collector.record_execution_start(execution)
-                    execution._metrics_recorded = True
+                    recorded.add((execution.id, 'start'))
             
             elif execution.status == ExecutionStatus.SUCCESS and execution.completed_at:
-                if not hasattr(execution, '_completion_recorded'):
+                if (execution.id, 'completion') not in recorded:
                     self.metric_collector.record_execution_completion(execution)
-                    execution._completion_recorded = True
+                    recorded.add((execution.id, 'completion'))
             
             elif execution.status == ExecutionStatus.FAILURE and execution.completed_at:
-                if not hasattr(execution, '_failure_recorded'):
+                if (execution.id, 'failure') not in recorded:
                     self.metric_collector.record_execution_failure(execution)
-                    execution._failure_recorded = True
+                    recorded.add((execution.id, 'failure'))
             
             elif execution.status == ExecutionStatus.RETRY:
-                if not hasattr(execution, f'_retry_recorded_{execution.attempt_number}'):
+                if (execution.id, f'retry_{execution.attempt_number}') not in recorded:
                     self.metric_collector.record_retry(execution)
-                    setattr(execution, f'_retry_recorded_{execution.attempt_number}', True)
+                    recorded.add((execution.id, f'retry_{execution.attempt_number}'))
     
     async def _store_monitoring_snapshot(
         self, 
@@ -420,6 +429,18 @@ class PipelineMonitor:
         if len(self.pipeline_histories[pipeline_run.id]) > 1000:
             self.pipeline_histories[pipeline_run.id] = self.pipeline_histories[pipeline_run.id][-1000:]
     
+    async def record_event(self, run_id: UUID, event_type: str, data: Dict[str, Any]):
+        """Record a pipeline lifecycle event (pause, resume, ...)."""
+        event = {
+            'timestamp': datetime.utcnow().isoformat(),
+            'event': event_type,
+            'data': data
+        }
+        
+        self.pipeline_events.setdefault(run_id, []).append(event)
+        
+        logger.debug("pipeline_event_recorded", run_id=str(run_id), event_type=event_type)
+    
     def get_pipeline_metrics(self, run_id: UUID) -> Optional[Dict[str, Any]]:
         """Get current metrics for a pipeline."""
         if run_id not in self.monitor_tasks:
@@ -0,0 +1,215 @@
+"""
+Compiled Pipeline Plans
+
+A PipelineTemplate only lists an agent sequence. Turning it into a run means
+resolving each agent's dependencies, validating the DAG and working out an
+execution order - work that is identical for every run of the template.
+
+compile_plan does that once and produces an immutable PipelinePlan: the
+validated DAG, its topological levels, the critical path and a per-node
+profile (estimated duration, resource requirements). The executor
+stamps runs out of a plan without re-deriving any of it.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .scheduler import ESTIMATED_AGENT_RESOURCES
+
+
+DEFAULT_RESOURCE_PROFILE = {'cpu': 50, 'memory': 1024}
+
+
+@dataclass(frozen=True)
+class PlanNode:
+    """One agent execution in a compiled plan."""
+    agent_type: str
+    depends_on: Tuple[str, ...]
+    stream_dependencies: Tuple[str, ...]
+    optional_dependencies: Tuple[str, ...]
+    level: int
+    estimated_duration: float  # in seconds
+    critical_length: float  # longest duration path ending at this node
+    resource_requirements: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class PipelinePlan:
+    """Immutable, validated execution plan compiled from a template."""
+    template_id: str
+    name: str
+    nodes: Tuple[PlanNode, ...]  # topological order, critical path first within a level
+    levels: Tuple[Tuple[str, ...], ...]
+    critical_path: Tuple[str, ...]
+    critical_path_duration: float
+    default_config: Mapping[str, Any]
+    required_context: Tuple[str, ...]
+    
+    @property
+    def max_parallel(self) -> int:
+        """Widest level of the plan."""
+        return max((len(level) for level in self.levels), default=0)
+    
+    @property
+    def parallelism_potential(self) -> float:
+        """Parallelism potential (0.0 = fully sequential, 1.0 = fully parallel)."""
+        if len(self.nodes) <= 1:
+            return float(len(self.nodes))
+        average_level_size = len(self.nodes) / len(self.levels)
+        return min(1.0, average_level_size / len(self.nodes))
+    
+    def resolve_context(self, user_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Validate required context and merge it over the template defaults."""
+        user_context = user_context or {}
+        
+        missing = [key for key in self.required_context if key not in user_context]
+        if missing:
+            raise ValueError(f"Missing required context: {', '.join(missing)}")
+        
+        context = dict(self.default_config)
+        context.update(user_context)
+        return context
+
+
+def compile_plan(template: Any, agent_classes: Mapping[str, Any]) -> PipelinePlan:
+    """
+    Compile a PipelineTemplate into a PipelinePlan.
+    
+    Dependencies default to the previous agent in the sequence and are
+    overridden by the registered agent class, as in create_pipeline_run.
+    Raises ValueError for dependencies outside the template or cycles.
+    """
+    sequence = list(template.agent_sequence)
+    if len(set(sequence)) != len(sequence):
+        raise ValueError(f"Template {template.id} lists an agent more than once")
+    
+    dependencies: Dict[str, Tuple[str, ...]] = {}
+    stream_dependencies: Dict[str, Tuple[str, ...]] = {}
+    optional_dependencies: Dict[str, Tuple[str, ...]] = {}
+    
+    for index, agent_type in enumerate(sequence):
+        depends_on = [sequence[index - 1]] if index else []
+        streams: List[str] = []
+        optional: List[str] = []
+        
+        agent_class = agent_classes.get(agent_type)
+        if agent_class is not None:
+            agent_instance = agent_class()
+            depends_on = list(agent_instance.dependencies)
+            streams = [dep for dep in agent_instance.stream_dependencies if dep in depends_on]
+            optional = [dep for dep in agent_instance.optional_dependencies if dep in depends_on]
+        
+        unknown = [dep for dep in depends_on if dep not in sequence]
+        if unknown:
+            raise ValueError(
+                f"Template {template.id}: {agent_type} depends on agents not in the template: "
+                f"{', '.join(unknown)}"
+            )
+        
+        dependencies[agent_type] = tuple(depends_on)
+        stream_dependencies[agent_type] = tuple(streams)
+        optional_dependencies[agent_type] = tuple(optional)
+    
+    levels = _topological_levels(template.id, sequence, dependencies)
+    
+    # Spread the template estimate evenly over its agents
+    duration = template.estimated_duration / len(sequence) if sequence else 0.0
+    
+    critical_lengths: Dict[str, float] = {}
+    critical_parent: Dict[str, Optional[str]] = {}
+    for level in levels:
+        for agent_type in level:
+            parent = max(dependencies[agent_type], key=critical_lengths.get, default=None)
+            critical_parent[agent_type] = parent
+            critical_lengths[agent_type] = duration + (critical_lengths[parent] if parent else 0.0)
+    
+    critical_path: List[str] = []
+    node = max(critical_lengths, key=critical_lengths.get, default=None)
+    while node is not None:
+        critical_path.append(node)
+        node = critical_parent[node]
+    critical_path.reverse()
+    
+    # Longest remaining path first within a level, as the critical path scheduler would
+    remaining = _remaining_lengths(sequence, dependencies, duration)
+    levels = tuple(
+        tuple(sorted(level, key=lambda agent_type: -remaining[agent_type])) for level in levels
+    )
+    
+    nodes = tuple(
+        PlanNode(
+            agent_type=agent_type,
+            depends_on=dependencies[agent_type],
+            stream_dependencies=stream_dependencies[agent_type],
+            optional_dependencies=optional_dependencies[agent_type],
+            level=level_index,
+            estimated_duration=duration,
+            critical_length=critical_lengths[agent_type],
+            resource_requirements=MappingProxyType(dict(
+                ESTIMATED_AGENT_RESOURCES.get(agent_type, DEFAULT_RESOURCE_PROFILE)
+            ))
+        )
+        for level_index, level in enumerate(levels)
+        for agent_type in level
+    )
+    
+    return PipelinePlan(
+        template_id=template.id,
+        name=template.name,
+        nodes=nodes,
+        levels=levels,
+        critical_path=tuple(critical_path),
+        critical_path_duration=critical_lengths[critical_path[-1]] if critical_path else 0.0,
+        default_config=MappingProxyType(dict(template.default_config)),
+        required_context=tuple(template.required_context)
+    )
+
+
+def _topological_levels(
+    template_id: str,
+    sequence: List[str],
+    dependencies: Dict[str, Tuple[str, ...]]
+) -> List[List[str]]:
+    """Group agents into levels whose members only depend on earlier levels."""
+    pending = {agent_type: set(deps) for agent_type, deps in dependencies.items()}
+    done: set = set()
+    levels: List[List[str]] = []
+    
+    while pending:
+        level = [agent_type for agent_type in sequence if agent_type in pending and pending[agent_type] <= done]
+        if not level:
+            raise ValueError(f"Template {template_id} has circular dependencies: {', '.join(pending)}")
+        
+        for agent_type in level:
+            del pending[agent_type]
+        done.update(level)
+        levels.append(level)
+    
+    return levels
+
+
+def _remaining_lengths(
+    sequence: List[str],
+    dependencies: Dict[str, Tuple[str, ...]],
+    duration: float
+) -> Dict[str, float]:
+    """Longest duration path from each agent to the end of the pipeline."""
+    dependents: Dict[str, List[str]] = {agent_type: [] for agent_type in sequence}
+    for agent_type, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(agent_type)
+    
+    remaining: Dict[str, float] = {}
+    
+    def length(agent_type: str) -> float:
+        if agent_type not in remaining:
+            remaining[agent_type] = duration + max(
+                (length(dependent) for dependent in dependents[agent_type]), default=0.0
+            )
+        return remaining[agent_type]
+    
+    for agent_type in sequence:
+        length(agent_type)
+    
+    return remaining
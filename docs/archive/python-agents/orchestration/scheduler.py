@@ -24,6 +24,16 @@ from .models import (
 logger = structlog.get_logger()
 
 
+# Estimated resource profile per agent type
+ESTIMATED_AGENT_RESOURCES = {
+    'planner': {'cpu': 20, 'memory': 512},
+    'architect': {'cpu': 40, 'memory': 1024},
+    'coder': {'cpu': 60, 'memory': 2048},
+    'tester': {'cpu': 80, 'memory': 1536},
+    'reviewer': {'cpu': 30, 'memory': 768}
+}
+
+
 class SchedulingStrategy:
     """Base class for scheduling strategies."""
     
@@ -58,13 +68,7 @@ class ResourceAwareSchedulingStrategy(SchedulingStrategy):
     """Resource-aware scheduling strategy."""
     
     def __init__(self):
-        self.estimated_resources = {
-            'planner': {'cpu': 20, 'memory': 512},
-            'architect': {'cpu': 40, 'memory': 1024},
-            'coder': {'cpu': 60, 'memory': 2048},
-            'tester': {'cpu': 80, 'memory': 1536},
-            'reviewer': {'cpu': 30, 'memory': 768}
-        }
+        self.estimated_resources = dict(ESTIMATED_AGENT_RESOURCES)
     
     def prioritize_executions(
         self, 
@@ -154,11 +158,24 @@ class ResourcePool:
         self.current_cpu_usage = 0.0
         self.current_memory_mb = 0
         self.active_executions: Dict[str, AgentExecution] = {}
+        
+        # Parallel slots in units of 1/micro_batch_max_size: a micro-batched
+        # execution only takes its share of the batch's single slot
+        self.active_slot_units = 0
+        self.slot_capacity = config.max_parallel_agents * config.micro_batch_max_size
+    
+    def _slot_units(self, execution: AgentExecution) -> int:
+        if execution.agent_type in self.config.micro_batch_agent_types:
+            return 1
+        return self.config.micro_batch_max_size
+    
+    def _has_free_slot(self, execution: AgentExecution) -> bool:
+        return self.active_slot_units + self._slot_units(execution) <= self.slot_capacity
     
     def can_allocate_resources(self, execution: AgentExecution) -> bool:
         """Check if resources can be allocated for execution."""
         if not self.config.enable_resource_limits:
-            return len(self.active_executions) < self.config.max_parallel_agents
+            return self._has_free_slot(execution)
         
         # Estimate resource requirements
         agent_type = execution.agent_type
@@ -174,11 +191,12 @@ class ResourcePool:
             if self.current_memory_mb + estimated_memory > self.config.max_memory_mb:
                 return False
         
-        return len(self.active_executions) < self.config.max_parallel_agents
+        return self._has_free_slot(execution)
     
     def allocate_resources(self, execution: AgentExecution):
         """Allocate resources for execution."""
         self.active_executions[execution.id] = execution
+        self.active_slot_units += self._slot_units(execution)
         
         estimated_cpu = execution.resource_requirements.get('cpu', 25.0)
         estimated_memory = execution.resource_requirements.get('memory', 512)
@@ -200,6 +218,7 @@ class ResourcePool:
             return
         
         del self.active_executions[execution.id]
+        self.active_slot_units -= self._slot_units(execution)
         
         estimated_cpu = execution.resource_requirements.get('cpu', 25.0)
         estimated_memory = execution.resource_requirements.get('memory', 512)
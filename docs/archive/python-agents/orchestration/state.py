@@ -0,0 +1,177 @@
+"""
+Hot-path execution state for ForgeFlow pipelines.
+
+AgentExecution and PipelineRun are pydantic models: convenient at API and
+serialization boundaries, but every attribute write goes through
+BaseModel.__setattr__ and every instance carries a __dict__ plus pydantic
+bookkeeping. While a pipeline runs, the executor, scheduler and monitor work
+on the slots-based ExecutionState/RunState below instead, and pydantic models
+are only materialized (via to_model) when a run is reported or serialized.
+
+Both representations share their behaviour through ExecutionLifecycle and
+RunLifecycle, so transitions and readiness rules are defined once.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .models import (
+    AgentExecution,
+    PipelineRun,
+    ExecutionLifecycle,
+    RunLifecycle
+)
+
+
+class ExecutionState(ExecutionLifecycle):
+    """Slots-based mirror of AgentExecution used while a pipeline runs."""
+    
+    __slots__ = tuple(AgentExecution.model_fields)
+    
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            setattr(self, name, fields[name])
+    
+    @classmethod
+    def from_model(cls, execution: AgentExecution) -> "ExecutionState":
+        """Create hot-path state from a validated AgentExecution, without aliasing its containers."""
+        return cls(**{name: _snapshot(getattr(execution, name)) for name in cls.__slots__})
+    
+    @classmethod
+    def create(cls, **fields: Any) -> "ExecutionState":
+        """Validate fields through AgentExecution (applying defaults) and convert."""
+        return cls.from_model(AgentExecution(**fields))
+    
+    @classmethod
+    def stamp(cls, **fields: Any) -> "ExecutionState":
+        """Create from already-validated fields (e.g. a compiled plan), filling defaults without validation."""
+        return cls(**_with_defaults(AgentExecution, fields))
+    
+    def to_model(self) -> AgentExecution:
+        """Materialize a pydantic snapshot of this execution."""
+        return AgentExecution.model_construct(
+            **{name: _snapshot(getattr(self, name)) for name in self.__slots__}
+        )
+    
+    def __repr__(self) -> str:
+        return f"ExecutionState(agent_type={self.agent_type!r}, status={self.status.value!r})"
+
+
+class RunState(RunLifecycle):
+    """
+    Slots-based mirror of PipelineRun used while a pipeline runs.
+    
+    Keeps an agent_type index so dependency checks don't scan every
+    execution.
+    """
+    
+    __slots__ = tuple(PipelineRun.model_fields) + ('_by_type', '_stream_producers')
+    
+    def __init__(self, **fields: Any):
+        for name in PipelineRun.model_fields:
+            setattr(self, name, fields[name])
+        
+        self._by_type: Dict[str, ExecutionState] = {}
+        self._stream_producers: Set[str] = set()
+        self._reindex()
+    
+    @classmethod
+    def from_model(cls, pipeline_run: PipelineRun) -> "RunState":
+        """Create hot-path state from a validated PipelineRun, without aliasing its containers."""
+        fields = {name: _snapshot(getattr(pipeline_run, name)) for name in PipelineRun.model_fields}
+        fields['executions'] = [ExecutionState.from_model(e) for e in pipeline_run.executions]
+        return cls(**fields)
+    
+    @classmethod
+    def stamp(cls, **fields: Any) -> "RunState":
+        """Create from already-validated fields (e.g. a compiled plan), filling defaults without validation."""
+        return cls(**_with_defaults(PipelineRun, fields))
+    
+    def to_model(self) -> PipelineRun:
+        """Materialize a pydantic snapshot of this run."""
+        fields = {name: _snapshot(getattr(self, name)) for name in PipelineRun.model_fields}
+        fields['executions'] = [e.to_model() for e in self.executions]
+        return PipelineRun.model_construct(**fields)
+    
+    def set_executions(self, executions: List[ExecutionState]):
+        """Replace the execution order (e.g. after optimization) and reindex."""
+        self.executions = list(executions)
+        self._reindex()
+    
+    def add_execution(
+        self,
+        agent_type: str,
+        depends_on: Optional[List[str]] = None,
+        stream_dependencies: Optional[List[str]] = None,
+        optional_dependencies: Optional[List[str]] = None
+    ) -> ExecutionState:
+        """Add a new agent execution to the pipeline."""
+        execution = ExecutionState.create(
+            agent_type=agent_type,
+            run_id=self.id,
+            depends_on=depends_on or [],
+            stream_dependencies=stream_dependencies or [],
+            optional_dependencies=optional_dependencies or [],
+            max_attempts=self.orchestration_config.default_max_attempts,
+            retry_strategy=self.orchestration_config.default_retry_strategy
+        )
+        
+        self.executions.append(execution)
+        self.total_agents += 1
+        self._index(execution)
+        return execution
+    
+    def get_execution(self, agent_type: str) -> Optional[ExecutionState]:
+        """Get execution by agent type."""
+        return self._by_type.get(agent_type)
+    
+    def has_stream_consumers(self, agent_type: str) -> bool:
+        """Check if any execution consumes this agent type as a stream."""
+        return agent_type in self._stream_producers
+    
+    def _reindex(self):
+        self._by_type = {}
+        self._stream_producers = set()
+        for execution in self.executions:
+            self._index(execution)
+    
+    def _index(self, execution: ExecutionState):
+        self._by_type.setdefault(execution.agent_type, execution)
+        self._stream_producers.update(execution.stream_dependencies)
+    
+    def __repr__(self) -> str:
+        return f"RunState(id={self.id}, status={self.status.value!r}, executions={len(self.executions)})"
+
+
+def _snapshot(value: Any) -> Any:
+    """Shallow-copy mutable containers so snapshots don't alias live state."""
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def _with_defaults(model_class: Any, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Add model defaults (fresh per call for default factories) for missing fields."""
+    static_defaults, default_factories = _get_defaults(model_class)
+    for name, default in static_defaults:
+        if name not in fields:
+            fields[name] = _snapshot(default)
+    for name, factory in default_factories:
+        if name not in fields:
+            fields[name] = factory()
+    return fields
+
+
+@lru_cache(maxsize=None)
+def _get_defaults(model_class: Any) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[Tuple[str, Callable[[], Any]], ...]]:
+    """Split a model's defaults into static values and factories, once per class."""
+    static_defaults = []
+    default_factories = []
+    for name, info in model_class.model_fields.items():
+        if info.default_factory is not None:
+            default_factories.append((name, info.default_factory))
+        elif not info.is_required():
+            static_defaults.append((name, info.default))
+    return tuple(static_defaults), tuple(default_factories)
@@ -0,0 +1,91 @@
+"""
+Output Streaming - Partial agent outputs delivered to stream dependents.
+
+A producer execution publishes partial AgentOutput chunks to an
+OutputStream while it runs. Dependents that declare the producer as a
+stream dependency can start as soon as the first chunk lands and consume
+the remaining chunks as they arrive.
+"""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import structlog
+
+from ..agents.base import AgentOutput
+from ..agents.exceptions import AgentExecutionError
+
+logger = structlog.get_logger()
+
+
+class OutputStream:
+    """
+    Replayable channel of partial outputs from a single execution.
+    
+    Every subscriber receives all chunks from the beginning, so dependents
+    that start late don't miss earlier output.
+    """
+    
+    def __init__(self, agent_type: str):
+        self.agent_type = agent_type
+        self.chunks: List[AgentOutput] = []
+        self.final_output: Optional[AgentOutput] = None
+        self.error: Optional[str] = None
+        self.closed = False
+        self._condition = asyncio.Condition()
+    
+    async def publish(self, chunk: AgentOutput):
+        """Publish a partial output chunk to all subscribers."""
+        if self.closed:
+            raise RuntimeError(f"Output stream for '{self.agent_type}' is closed")
+        
+        async with self._condition:
+            self.chunks.append(chunk)
+            self._condition.notify_all()
+    
+    async def close(self, final_output: Optional[AgentOutput] = None, error: Optional[str] = None):
+        """Close the stream with the final output or an error."""
+        async with self._condition:
+            self.final_output = final_output
+            self.error = error
+            self.closed = True
+            self._condition.notify_all()
+        
+        logger.debug(
+            "output_stream_closed",
+            agent_type=self.agent_type,
+            chunks=len(self.chunks),
+            error=error
+        )
+    
+    def __aiter__(self) -> AsyncIterator[AgentOutput]:
+        return self.subscribe()
+    
+    async def subscribe(self) -> AsyncIterator[AgentOutput]:
+        """
+        Iterate over partial chunks until the producer finishes.
+        
+        Raises AgentExecutionError if the producer failed.
+        """
+        index = 0
+        
+        while True:
+            async with self._condition:
+                await self._condition.wait_for(
+                    lambda: index < len(self.chunks) or self.closed
+                )
+                new_chunks = self.chunks[index:]
+                closed = self.closed
+            
+            for chunk in new_chunks:
+                yield chunk
+            index += len(new_chunks)
+            
+            if closed and index >= len(self.chunks):
+                if self.error:
+                    raise AgentExecutionError(
+                        f"Upstream agent '{self.agent_type}' failed: {self.error}",
+                        agent_type=self.agent_type,
+                        phase="stream"
+                    )
+                return
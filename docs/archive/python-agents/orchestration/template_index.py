@@ -0,0 +1,156 @@
+"""
+Template Index - Inverted index for pipeline template search.
+
+Maps lowercase word tokens (from id, name, description and tags), exact
+tags and categories to template ids. Query tokens match indexed tokens by
+prefix, via binary search over the sorted token list. The index is
+maintained incrementally as templates are registered, so searches don't
+scan the registry.
+"""
+
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class TemplateIndex:
+    """
+    Inverted index over templates with token, tag and category postings.
+    
+    Works with any template object exposing id, name, description, tags
+    and category.
+    """
+    
+    def __init__(self):
+        self.tokens: Dict[str, Set[str]] = {}
+        self.tags: Dict[str, Set[str]] = {}
+        self.categories: Dict[str, Set[str]] = {}
+        
+        self._sorted_tokens: List[str] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+    
+    def add(self, template: Any):
+        """Index a template, replacing any previous entry with the same id."""
+        if template.id in self._entries:
+            self.remove(template.id)
+        
+        tags = {tag.lower() for tag in template.tags}
+        tokens = set(tokenize(f"{template.id} {template.name} {template.description}"))
+        for tag in tags:
+            tokens.update(tokenize(tag))
+        category = _category_key(template.category)
+        
+        for token in tokens:
+            postings = self.tokens.get(token)
+            if postings is None:
+                postings = self.tokens[token] = set()
+                insort(self._sorted_tokens, token)
+            postings.add(template.id)
+        
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(template.id)
+        self.categories.setdefault(category, set()).add(template.id)
+        
+        self._entries[template.id] = {'tokens': tokens, 'tags': tags, 'category': category}
+        if template.id not in self._order:
+            self._order[template.id] = self._next_order
+            self._next_order += 1
+    
+    def remove(self, template_id: str):
+        """Remove a template from the index."""
+        entry = self._entries.pop(template_id, None)
+        if entry is None:
+            return
+        
+        for token in entry['tokens']:
+            postings = self.tokens[token]
+            postings.discard(template_id)
+            if not postings:
+                del self.tokens[token]
+                del self._sorted_tokens[bisect_left(self._sorted_tokens, token)]
+        
+        _discard(self.tags, entry['tags'], template_id)
+        _discard(self.categories, [entry['category']], template_id)
+    
+    def match_prefix(self, prefix: str) -> Set[str]:
+        """Ids of templates having any token that starts with prefix."""
+        matches: Set[str] = set()
+        
+        index = bisect_left(self._sorted_tokens, prefix)
+        while index < len(self._sorted_tokens) and self._sorted_tokens[index].startswith(prefix):
+            matches |= self.tokens[self._sorted_tokens[index]]
+            index += 1
+        
+        return matches
+    
+    def search(
+        self,
+        query: str = "",
+        tags: Optional[Iterable[str]] = None,
+        category: Optional[Any] = None
+    ) -> List[str]:
+        """
+        Find template ids matching every query token (by prefix), every tag
+        and the category, in registration order.
+        """
+        candidates: List[Set[str]] = [self.match_prefix(token) for token in tokenize(query)]
+        candidates.extend(self.tags.get(tag.lower(), set()) for tag in tags or ())
+        if category is not None:
+            candidates.append(self.categories.get(_category_key(category), set()))
+        
+        if not candidates:
+            matches: Set[str] = set(self._entries)
+        else:
+            # Intersect smallest posting sets first
+            candidates.sort(key=len)
+            matches = set(candidates[0])
+            for postings in candidates[1:]:
+                if not matches:
+                    break
+                matches &= postings
+        
+        return sorted(matches, key=self._order.__getitem__)
+    
+    def facets(self, template_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, int]]:
+        """Count categories and tags over the given templates (default: all)."""
+        if template_ids is None:
+            category_counts = Counter({key: len(ids) for key, ids in self.categories.items()})
+            tag_counts = Counter({key: len(ids) for key, ids in self.tags.items()})
+        else:
+            category_counts = Counter()
+            tag_counts = Counter()
+            for template_id in template_ids:
+                entry = self._entries[template_id]
+                category_counts[entry['category']] += 1
+                tag_counts.update(entry['tags'])
+        
+        return {
+            'categories': dict(category_counts.most_common()),
+            'tags': dict(tag_counts.most_common())
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _category_key(category: Any) -> str:
+    return str(getattr(category, 'value', category)).lower()
+
+
+def _discard(postings_by_key: Dict[str, Set[str]], keys: Iterable[str], template_id: str):
+    for key in keys:
+        postings = postings_by_key.get(key)
+        if postings is not None:
+            postings.discard(template_id)
+            if not postings:
+                del postings_by_key[key]
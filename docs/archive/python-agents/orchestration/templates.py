@@ -10,9 +10,12 @@ Provides predefined pipeline configurations for common use cases:
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from enum import Enum
 
+from .plans import PipelinePlan, compile_plan
+from .template_index import TemplateIndex
+
 class TemplateCategory(str, Enum):
     """Categories of pipeline templates."""
     WEB_API = "web_api"
@@ -46,6 +49,8 @@ class PipelineTemplateRegistry:
     
     def __init__(self):
         self.templates: Dict[str, PipelineTemplate] = {}
+        self._plans: Dict[str, Tuple[Mapping[str, Any], PipelinePlan]] = {}
+        self.index = TemplateIndex()
         self._register_default_templates()
     
     def _register_default_templates(self):
@@ -341,30 +346,61 @@ class PipelineTemplateRegistry:
     def register(self, template: PipelineTemplate):
         """Register a new pipeline template."""
         self.templates[template.id] = template
+        self._plans.pop(template.id, None)
+        self.index.add(template)
     
     def get_template(self, template_id: str) -> Optional[PipelineTemplate]:
         """Get a template by ID."""
         return self.templates.get(template_id)
     
+    def get_plan(self, template_id: str, agent_classes: Mapping[str, Any]) -> PipelinePlan:
+        """
+        Get the compiled execution plan of a template.
+        
+        Plans are compiled once and reused until the template is
+        re-registered or a different agent class mapping is passed.
+        """
+        cached = self._plans.get(template_id)
+        if cached is not None and cached[0] is agent_classes:
+            return cached[1]
+        
+        template = self.get_template(template_id)
+        if not template:
+            raise ValueError(f"Template {template_id} not found")
+        
+        plan = compile_plan(template, agent_classes)
+        self._plans[template_id] = (agent_classes, plan)
+        return plan
+    
     def list_templates(self, category: Optional[TemplateCategory] = None) -> List[PipelineTemplate]:
         """List all templates, optionally filtered by category."""
-        templates = list(self.templates.values())
         if category:
-            templates = [t for t in templates if t.category == category]
-        return templates
+            return [self.templates[t] for t in self.index.search(category=category)]
+        return list(self.templates.values())
     
-    def search_templates(self, query: str) -> List[PipelineTemplate]:
-        """Search templates by name, description, or tags."""
-        query_lower = query.lower()
-        results = []
-        
-        for template in self.templates.values():
-            if (query_lower in template.name.lower() or
-                query_lower in template.description.lower() or
-                any(query_lower in tag for tag in template.tags)):
-                results.append(template)
+    def search_templates(
+        self,
+        query: str,
+        tags: Optional[List[str]] = None,
+        category: Optional[TemplateCategory] = None
+    ) -> List[PipelineTemplate]:
+        """
+        Search templates by words of their id, name, description or tags.
         
-        return results
+        Every query word must prefix-match a word of the template ("crud
+        serv" finds "FastAPI CRUD Service"); tags and category filter exactly.
+        """
+        return [self.templates[t] for t in self.index.search(query, tags, category)]
+    
+    def get_templates_by_tag(self, tag: str) -> List[PipelineTemplate]:
+        """Get templates carrying a tag."""
+        return [self.templates[t] for t in self.index.search(tags=[tag])]
+    
+    def get_facets(self, query: str = "", tags: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """Category and tag counts over the templates matching a search."""
+        if not query and not tags:
+            return self.index.facets()
+        return self.index.facets(self.index.search(query, tags))
     
     def get_template_config(self, template_id: str, user_context: Dict[str, Any]) -> Dict[str, Any]:
         """
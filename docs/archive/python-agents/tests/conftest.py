@@ -0,0 +1,36 @@
+"""
+Test setup: the python-agents directory isn't an installable package and
+its name isn't importable, so expose it as the "forgeflow" package.
+"""
+
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if "forgeflow" not in sys.modules:
+    package = types.ModuleType("forgeflow")
+    package.__path__ = [str(ROOT)]
+    sys.modules["forgeflow"] = package
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """A git repository on main with one commit."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    for args in (
+        ("init", "-q", "-b", "main"),
+        ("config", "user.name", "Test"),
+        ("config", "user.email", "test@example.com"),
+        ("config", "commit.gpgsign", "false")
+    ):
+        subprocess.run(("git", *args), cwd=path, check=True)
+    (path / "README.md").write_text("readme\n")
+    subprocess.run(("git", "add", "-A"), cwd=path, check=True)
+    subprocess.run(("git", "commit", "-q", "-m", "initial"), cwd=path, check=True)
+    return path
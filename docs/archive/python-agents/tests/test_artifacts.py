@@ -0,0 +1,138 @@
+"""Content-addressed artifact store."""
+
+import asyncio
+import hashlib
+import os
+import time
+
+import pytest
+
+from forgeflow.orchestration import artifacts
+from forgeflow.orchestration.artifacts import ArtifactHandle, ArtifactIntegrityError, ArtifactStore
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import OrchestrationConfig
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / "store", spill_threshold=16, mmap_threshold=1024)
+
+
+@pytest.fixture
+def hash_calls(monkeypatch):
+    calls = []
+    original = hashlib.sha256
+    
+    def sha256(*args):
+        calls.append(args)
+        return original(*args)
+    
+    monkeypatch.setattr(artifacts.hashlib, "sha256", sha256)
+    return calls
+
+
+def test_small_values_stay_inline_and_large_ones_spill(store):
+    stored = store.store_artifacts({
+        "small": "tiny",
+        "text": "x" * 100,
+        "json": {"rows": list(range(20))},
+        "bytes": b"\0" * 100
+    })
+    
+    assert stored["small"] == "tiny"
+    assert all(isinstance(stored[name], ArtifactHandle) for name in ("text", "json", "bytes"))
+    assert store.resolve(stored["text"]) == "x" * 100
+    assert store.resolve(stored["json"]) == {"rows": list(range(20))}
+    assert store.resolve(stored["bytes"]) == b"\0" * 100
+
+
+def test_identical_payloads_are_stored_once(store):
+    first = store.put("y" * 100)
+    second = store.put("y" * 100)
+    
+    assert first == second
+    assert store.get_statistics()['spilled_artifacts'] == 1
+    assert store.get_statistics()['dedup_hits'] == 1
+
+
+def test_large_blobs_are_memory_mapped(store):
+    handle = store.put_bytes(b"z" * 4096)
+    
+    view = store.open(handle)
+    
+    assert isinstance(view, memoryview)
+    assert view[:3] == b"zzz"
+    assert store.get_statistics()['mmap_reads'] == 1
+
+
+def test_blobs_are_verified_once(store, hash_calls):
+    handle = store.put_bytes(b"z" * 4096)
+    hash_calls.clear()
+    
+    # Written (and hashed) by this store: reads don't re-hash
+    store.open(handle)
+    store.open(handle)
+    assert hash_calls == []
+    
+    # Another store sharing the root verifies on its first read only
+    other = ArtifactStore(store.root, mmap_threshold=1024)
+    other.open(handle)
+    other.open(handle)
+    assert len(hash_calls) == 1
+
+
+@pytest.mark.parametrize("size", [100, 4096])  # bytes and mmap reads
+def test_corrupted_blob_is_dropped_on_first_read(store, size):
+    handle = store.put_bytes(b"a" * size)
+    path = store.root / handle.digest[:2] / handle.digest[2:]
+    path.write_bytes(b"b" * size)
+    
+    reader = ArtifactStore(store.root, mmap_threshold=1024)
+    with pytest.raises(ArtifactIntegrityError):
+        reader.open(handle)
+    
+    assert not path.exists()
+    assert not reader.contains(handle)
+    assert reader.get_statistics()['corrupt_blobs'] == 1
+
+
+def test_aborted_writer_leaves_nothing_behind(store):
+    with pytest.raises(RuntimeError):
+        with store.writer("text") as writer:
+            writer.write("partial")
+            raise RuntimeError("producer failed")
+    
+    assert list(store.temp_dir.iterdir()) == []
+    assert list(store.root.glob("??/*")) == []
+    
+    with store.writer("text") as writer:
+        writer.write("com")
+        writer.write("plete")
+    assert store.read(writer.handle) == "complete"
+
+
+def test_prune_removes_expired_blobs(store):
+    old = store.put_bytes(b"old" * 10)
+    fresh = store.put_bytes(b"fresh" * 10)
+    old_path = store.root / old.digest[:2] / old.digest[2:]
+    past = time.time() - 3600
+    os.utime(old_path, (past, past))
+    
+    assert store.prune(max_age_seconds=60) == 1
+    assert not store.contains(old)
+    assert store.contains(fresh)
+
+
+def test_executor_shutdown_removes_only_its_own_store(tmp_path):
+    own = PipelineExecutor(OrchestrationConfig(enable_artifact_store=True))
+    configured = PipelineExecutor(OrchestrationConfig(
+        enable_artifact_store=True, artifact_store_path=str(tmp_path / "shared")
+    ))
+    own.artifact_store.put_bytes(b"data")
+    configured.artifact_store.put_bytes(b"data")
+    
+    asyncio.run(own.shutdown())
+    asyncio.run(configured.shutdown())
+    
+    assert not own.artifact_store.root.exists()
+    assert configured.artifact_store.root.exists()
@@ -0,0 +1,97 @@
+"""Batches of pipeline runs stamped out of one template."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import BatchResult, OrchestrationConfig
+from forgeflow.orchestration.templates import PipelineTemplate, TemplateCategory, get_template_registry
+
+
+class BriefAgent(BaseAgent):
+    """Fails briefs marked "fatal", blocks on "hang", tracks concurrent runs."""
+    agent_type = "brief_agent"
+    version = "1.0.0"
+    capabilities = set()
+    active = 0
+    peak = 0
+    
+    async def _execute_impl(self, input_data):
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        try:
+            await asyncio.sleep(0.05)
+            if "hang" in input_data.feature_brief:
+                await asyncio.Event().wait()
+            if "fatal" in input_data.feature_brief:
+                raise RuntimeError("fatal: brief rejected")
+            return create_agent_output(
+                input_data.agent_execution_id, self.agent_type, primary_result=input_data.feature_brief
+            )
+        finally:
+            cls.active -= 1
+
+
+@pytest.fixture
+def executor():
+    get_template_registry().register(PipelineTemplate(
+        id="test_batch",
+        name="Batch",
+        description="Single-agent template for batch tests",
+        category=TemplateCategory.TESTING,
+        agent_sequence=["brief_agent"],
+        default_config={},
+        required_context=[],
+        optional_context=[],
+        tags=[],
+        difficulty="beginner",
+        estimated_duration=1
+    ))
+    BriefAgent.active = BriefAgent.peak = 0
+    
+    executor = PipelineExecutor(OrchestrationConfig(
+        pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1, batch_max_active_runs=2
+    ))
+    executor.agent_registry = SimpleNamespace(agents={"brief_agent": BriefAgent})
+    return executor
+
+
+def test_batch_returns_results_in_submission_order(executor):
+    briefs = [f"brief {index}" for index in range(5)]
+    
+    result = asyncio.run(executor.submit_batch(briefs, "test_batch"))
+    
+    assert isinstance(result, BatchResult)
+    assert result.successful_runs == 5
+    assert [r.agent_outputs["brief_agent"].primary_result for r in result.results] == briefs
+    assert BriefAgent.peak == 2
+    assert executor.active_runs == {}
+
+
+def test_failed_run_does_not_fail_the_batch(executor):
+    result = asyncio.run(executor.submit_batch(["ok", "fatal", "also ok"], "test_batch"))
+    
+    assert result.successful_runs == 2
+    assert result.failed_runs == 1
+    assert not result.results[1].is_successful()
+
+
+def test_cancelling_the_batch_drops_runs_not_yet_admitted(executor):
+    async def scenario():
+        task = asyncio.create_task(executor.submit_batch(["hang 1", "hang 2", "hang 3"], "test_batch"))
+        while BriefAgent.active < 2:
+            await asyncio.sleep(0.01)
+        assert len(executor.active_runs) == 3
+        
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    
+    assert BriefAgent.active == 0
+    assert executor.active_runs == {}
@@ -0,0 +1,164 @@
+"""Change-aware builds and test runs of the deployment agent."""
+
+import asyncio
+
+import pytest
+
+from forgeflow.agents.build_cache import BuildCache
+from forgeflow.agents.deployment import DeploymentAgent, DeploymentEnvironment
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A two-package project with dependencies installed and a previous build."""
+    path = tmp_path / "project"
+    for relative, content in {
+        "package.json": '{"name": "app"}',
+        "package-lock.json": "{}",
+        "src/index.js": "export default 1;\n",
+        "packages/ui/package.json": '{"name": "ui"}',
+        "packages/ui/button.js": "export const Button = 1;\n",
+        "node_modules/dep/index.js": "ignored\n",
+        "dist/index.js": "old build output\n"
+    }.items():
+        (path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (path / relative).write_text(content)
+    return path
+
+
+def test_snapshot_hashes_inputs_once(project, tmp_path):
+    cache = BuildCache(project, root=tmp_path / "cache")
+    
+    files = cache.snapshot()
+    assert sorted(files) == [
+        "package-lock.json", "package.json", "packages/ui/button.js", "packages/ui/package.json", "src/index.js"
+    ]
+    assert set(cache.package_hashes(files)) == {".", "packages/ui"}
+    
+    cache.snapshot()
+    assert cache.get_statistics()['files_hashed'] == 5  # the second snapshot only stat'ed
+    
+    (project / "packages/ui/button.js").write_text("export const Button = 2;\n")
+    changed = cache.package_hashes(cache.snapshot())
+    assert cache.get_statistics()['files_hashed'] == 6
+    assert cache.changed_packages("build", changed) == [".", "packages/ui"]  # nothing built yet
+
+
+def build(cache: BuildCache, output: str):
+    """Run a fake build writing output, the way the deployment agent would."""
+    packages = cache.package_hashes(cache.snapshot())
+    key = cache.build_key("npm run build", packages)
+    status = cache.restore_build(key)
+    if status is None:
+        (cache.project_path / "dist/index.js").write_text(output)
+        cache.store_build("npm run build", key, packages)
+    return status
+
+
+def test_builds_are_skipped_restored_or_rebuilt(project, tmp_path):
+    cache = BuildCache(project, root=tmp_path / "cache")
+    
+    assert build(cache, "v1") is None
+    assert build(cache, "unused") == "hit"
+    
+    (project / "src/index.js").write_text("export default 2;\n")
+    assert build(cache, "v2") is None
+    assert cache.changed_packages("npm run build", cache.package_hashes(cache.snapshot())) == []
+    
+    # Reverting the change brings back the first build's outputs
+    (project / "src/index.js").write_text("export default 1;\n")
+    assert build(cache, "unused") == "restored"
+    assert (project / "dist/index.js").read_text() == "v1"
+    
+    # A fresh cache instance picks up the persisted state
+    assert build(BuildCache(project, root=tmp_path / "cache"), "unused") == "hit"
+
+
+def test_oldest_builds_are_evicted(project, tmp_path):
+    cache = BuildCache(project, root=tmp_path / "cache", max_entries=1)
+    
+    build(cache, "v1")
+    (project / "src/index.js").write_text("export default 2;\n")
+    build(cache, "v2")
+    
+    (project / "src/index.js").write_text("export default 1;\n")
+    assert build(cache, "v1 again") is None
+    assert cache.get_statistics()['cached_builds'] == 1
+    assert len(list((cache.root / "outputs").iterdir())) == 1
+
+
+def test_only_changed_files_need_testing(project, tmp_path):
+    cache = BuildCache(project, root=tmp_path / "cache")
+    
+    assert cache.test_changes("npm test", cache.snapshot()) is None  # never passed
+    cache.record_tests("npm test", cache.snapshot())
+    assert cache.test_changes("npm test", cache.snapshot()) == []
+    
+    (project / "src/index.js").write_text("export default 2;\n")
+    assert cache.test_changes("npm test", cache.snapshot()) == ["src/index.js"]
+    assert cache.test_changes("npm run test:unit", cache.snapshot()) is None
+    
+    # Lockfile changes and deletions need the full suite
+    (project / "package-lock.json").write_text('{"lockfileVersion": 3}')
+    assert cache.test_changes("npm test", cache.snapshot()) is None
+    cache.record_tests("npm test", cache.snapshot())
+    (project / "packages/ui/button.js").unlink()
+    assert cache.test_changes("npm test", cache.snapshot()) is None
+
+
+@pytest.fixture
+def agent(project, tmp_path, monkeypatch):
+    monkeypatch.setattr("forgeflow.agents.build_cache.DEFAULT_BUILD_CACHE_ROOT", tmp_path / "cache")
+    agent = DeploymentAgent()
+    agent.working_directory = project
+    agent.command_log_dir = tmp_path / "logs"
+    return agent
+
+
+def make_environment(tmp_path, build_command: str = "") -> DeploymentEnvironment:
+    builds = tmp_path / "builds.log"
+    return DeploymentEnvironment(
+        name="test",
+        build_command=build_command or f"echo build >> {builds} && echo fresh > dist/index.js",
+        test_command=f"echo test >> {tmp_path / 'tests.log'}",
+        deploy_command="true"
+    )
+
+
+def test_agent_skips_unchanged_builds_and_tests(agent, project, tmp_path):
+    environment = make_environment(tmp_path)
+    
+    async def scenario():
+        statuses = [(await agent._execute_build(environment))["cache"] for _ in range(2)]
+        (project / "src/index.js").write_text("export default 2;\n")
+        statuses.append((await agent._execute_build(environment))["cache"])
+        statuses.append((await agent._execute_build(environment, force=True))["cache"])
+        
+        selections = [(await agent._execute_tests(environment))["selection"] for _ in range(2)]
+        return statuses, selections
+    
+    statuses, selections = asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    
+    assert statuses == ["miss", "hit", "miss", "forced"]
+    assert (tmp_path / "builds.log").read_text().count("build") == 3
+    assert selections == ["full", "skipped"]
+    assert (tmp_path / "tests.log").read_text().count("test") == 1
+
+
+def test_failed_or_cancelled_builds_are_not_cached(agent, tmp_path):
+    async def scenario():
+        failed = await agent._execute_build(make_environment(tmp_path, "exit 1"))
+        
+        task = asyncio.create_task(agent._execute_build(make_environment(tmp_path, "sleep 5")))
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        return failed, await agent._execute_build(make_environment(tmp_path))
+    
+    failed, rebuilt = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    
+    assert (failed["success"], failed["cache"], failed["error"]) == (False, "miss", "Build failed")
+    assert (rebuilt["success"], rebuilt["cache"]) == (True, "miss")
+    assert agent._get_build_cache().get_statistics()['cached_builds'] == 1
@@ -0,0 +1,132 @@
+"""Single-flight coalescing of identical in-flight agent requests."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.coalescing import SingleFlight
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+
+
+def test_identical_calls_share_one_execution():
+    calls = []
+    
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "shared"
+    
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.run("key", call), flight.run("key", call), flight.run("other", call))
+        return flight, results
+    
+    flight, results = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert results == ["shared"] * 3
+    assert len(calls) == 2
+    stats = flight.get_statistics()
+    assert (stats['calls'], stats['coalesced_calls'], stats['in_flight']) == (3, 1, 0)
+
+
+def test_failure_reaches_every_waiter_and_is_not_cached():
+    attempts = []
+    
+    async def call():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream failed")
+    
+    async def scenario():
+        flight = SingleFlight()
+        results = await asyncio.gather(flight.run("key", call), flight.run("key", call), return_exceptions=True)
+        with pytest.raises(RuntimeError):
+            await flight.run("key", call)
+        return results
+    
+    results = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert [str(result) for result in results] == ["upstream failed"] * 2
+    assert len(attempts) == 2  # the second round started a new flight
+
+
+def test_shared_call_survives_until_the_last_waiter_leaves():
+    state = {'cancelled': False}
+    
+    async def call():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            state['cancelled'] = True
+            raise
+    
+    async def scenario():
+        flight = SingleFlight()
+        first = asyncio.create_task(flight.run("key", call))
+        second = asyncio.create_task(flight.run("key", call))
+        await asyncio.sleep(0.01)
+        
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        assert not state['cancelled']
+        assert flight.get_statistics()['in_flight'] == 1
+        
+        second.cancel()
+        await asyncio.gather(second, return_exceptions=True)
+        await asyncio.sleep(0.01)
+        return flight
+    
+    flight = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert state['cancelled']
+    stats = flight.get_statistics()
+    assert (stats['abandoned_flights'], stats['in_flight']) == (1, 0)
+
+
+class LookupAgent(BaseAgent):
+    """Side-effect-free agent counting how often it actually runs."""
+    agent_type = "lookup"
+    version = "1.0.0"
+    capabilities = set()
+    runs = 0
+    
+    async def _execute_impl(self, input_data):
+        type(self).runs += 1
+        await asyncio.sleep(0.05)
+        return create_agent_output(
+            input_data.agent_execution_id, self.agent_type, primary_result={"answer": input_data.feature_brief}
+        )
+
+
+def test_executor_coalesces_identical_executions_across_runs():
+    LookupAgent.runs = 0
+    config = OrchestrationConfig(
+        pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1,
+        coalesce_agent_types=["lookup"]
+    )
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"lookup": LookupAgent})
+    
+    runs = []
+    for brief in ("same", "same", "different"):
+        run = PipelineRun(name=brief, feature_brief=brief, orchestration_config=config)
+        run.add_execution("lookup")
+        runs.append(run)
+    
+    async def scenario():
+        await asyncio.gather(*(executor._execute_pipeline_agents(run) for run in runs))
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    
+    assert LookupAgent.runs == 2
+    first, second, _ = (run.get_execution("lookup") for run in runs)
+    assert first.status == second.status == ExecutionStatus.SUCCESS
+    # Each run gets its own copy of the shared output
+    assert second.output_data.agent_execution_id != first.output_data.agent_execution_id
+    assert second.output_data.primary_result is not first.output_data.primary_result
+    assert second.output_data.primary_result == {"answer": "same"}
+    assert executor.single_flight.get_statistics()['coalesced_calls'] == 1
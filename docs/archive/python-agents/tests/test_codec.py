@@ -0,0 +1,46 @@
+"""JSON codec and fingerprints of agent models."""
+
+from uuid import uuid4
+
+import pytest
+
+from forgeflow.agents.base import AgentInput, AgentOutput, create_agent_output, layer_contexts
+from forgeflow.agents.codec import dumps, fingerprint, loads
+
+
+def test_output_round_trips_through_json():
+    output = create_agent_output(
+        uuid4(), "coder",
+        primary_result={"files": ["a.py"]},
+        artifacts={"diff": "+x"},
+        recommendations=["test it"]
+    )
+    
+    restored = AgentOutput.model_validate(loads(dumps(output)))
+    
+    assert restored == output
+
+
+def test_layered_contexts_and_sets_serialize_as_plain_json():
+    context = layer_contexts({"a": 1}, {"a": 2, "b": {3}})
+    
+    assert loads(dumps(context)) == {"a": 1, "b": [3]}
+
+
+def test_unserializable_values_are_rejected():
+    with pytest.raises(TypeError):
+        dumps({"handle": object()})
+
+
+def test_fingerprint_ignores_key_order_but_not_content():
+    assert fingerprint({"a": 1, "b": [1, 2]}) == fingerprint({"b": [1, 2], "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 2})
+
+
+def test_content_hash_ignores_run_identity():
+    first = AgentInput(run_id=uuid4(), feature_brief="brief", project_context={"lang": "py"})
+    second = AgentInput(run_id=uuid4(), feature_brief="brief", project_context={"lang": "py"})
+    other = AgentInput(run_id=uuid4(), feature_brief="other brief", project_context={"lang": "py"})
+    
+    assert first.content_hash() == second.content_hash()
+    assert first.content_hash() != other.content_hash()
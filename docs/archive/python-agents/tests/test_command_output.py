@@ -0,0 +1,153 @@
+"""Streamed capture of command output to bounded tails and rotating logs."""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from forgeflow.agents.command_output import OutputCapture, RotatingLogFile, prune_logs
+from forgeflow.agents.deadline import Deadline
+from forgeflow.agents.deployment import DeploymentAgent
+
+# Writes 20000 numbered lines to each stream, interleaved, more than a pipe buffer holds
+NOISY = (
+    "import sys\n"
+    "for i in range(20000):\n"
+    "    print(f'out {i}')\n"
+    "    print(f'err {i}', file=sys.stderr)\n"
+)
+
+
+def capture_command(capture: OutputCapture, *args: str) -> int:
+    async def run():
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        return await capture.drain(process)
+    
+    return asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+
+def test_both_streams_are_drained_into_tails_and_the_log(tmp_path):
+    log = RotatingLogFile(tmp_path / "noisy.log")
+    capture = OutputCapture(log, tail_lines=3)
+    
+    assert capture_command(capture, sys.executable, "-c", NOISY) == 0
+    log.close()
+    
+    result = capture.result("noisy", 0, 1.0)
+    assert result.stdout == "out 19997\nout 19998\nout 19999\n"
+    assert result.stderr == "err 19997\nerr 19998\nerr 19999\n"
+    assert result.line_counts == {"stdout": 20000, "stderr": 20000}
+    assert result.truncated
+    assert (tmp_path / "noisy.log").read_text().count("\n") == 40000
+
+
+def test_overlong_lines_are_split_and_carriage_returns_dropped():
+    lines = []
+    capture = OutputCapture(on_line=lambda stream, line: lines.append((stream, len(line))), max_line_length=100)
+    
+    code = "import sys; sys.stdout.write('x' * 250 + '\\r\\nshort'); sys.exit(3)"
+    assert capture_command(capture, sys.executable, "-c", code) == 3
+    
+    assert lines == [("stdout", 100), ("stdout", 100), ("stdout", 50), ("stdout", 5)]
+    assert not capture.result("long", 3, 0.1).truncated
+
+
+def test_log_rotation_keeps_a_bounded_number_of_files(tmp_path):
+    log = RotatingLogFile(tmp_path / "build.log", max_bytes=10, backup_count=2)
+    for index in range(5):
+        log.write(f"line {index}\n".encode())  # 7 bytes, one line per file
+    log.close()
+    
+    assert log.rotations == 4
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["build.log", "build.log.1", "build.log.2"]
+    assert (tmp_path / "build.log").read_text() == "line 4\n"
+    assert (tmp_path / "build.log.2").read_text() == "line 2\n"
+
+
+def test_only_the_newest_logs_are_kept(tmp_path):
+    for index in range(4):
+        path = tmp_path / f"{index}.log"
+        path.write_text("output\n")
+        os.utime(path, (index, index))
+    (tmp_path / "0.log.1").write_text("rotated\n")
+    
+    assert prune_logs(tmp_path, keep=2) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.log", "3.log"]
+    assert prune_logs(tmp_path / "missing", keep=2) == 0
+
+
+@pytest.fixture
+def agent(tmp_path):
+    agent = DeploymentAgent()
+    agent.working_directory = tmp_path
+    agent.command_log_dir = tmp_path / "logs"
+    agent.output_tail_lines = 2
+    return agent
+
+
+def test_agent_commands_stream_lines_and_keep_the_full_log(agent):
+    lines = []
+    
+    result = asyncio.run(agent._run_command(
+        "for i in 1 2 3; do echo step $i; done; echo failed >&2; exit 2",
+        on_line=lambda stream, line: lines.append(f"{stream}: {line}")
+    ))
+    
+    assert result.returncode == 2
+    assert lines == ["stdout: step 1", "stdout: step 2", "stdout: step 3", "stderr: failed"]
+    assert result.stdout == "step 2\nstep 3\n"
+    assert result.log_path.read_text().count("step") == 3
+
+
+def is_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Killed orphans stay zombies when nothing reaps them (e.g. in containers)
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return not os.path.isdir("/proc")
+
+
+def assert_process_gone(pid: int):
+    for _ in range(50):
+        if not is_running(pid):
+            return
+        time.sleep(0.02)
+    pytest.fail(f"process {pid} outlived the command")
+
+
+def run_with_child(agent, cancel: bool):
+    """Run a command whose child sleeps; returns the child's pid."""
+    pids = []
+    
+    async def scenario():
+        task = asyncio.create_task(agent._run_command(
+            "sleep 30 & echo $!; wait", on_line=lambda stream, line: pids.append(int(line))
+        ))
+        if cancel:
+            while not pids:
+                await asyncio.sleep(0.01)
+            task.cancel()
+        await task
+    
+    with pytest.raises((asyncio.CancelledError, asyncio.TimeoutError)):
+        asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    return pids[0]
+
+
+def test_deadline_kills_the_whole_process_group(agent):
+    agent.deadline = Deadline.after(0.5)
+    
+    assert_process_gone(run_with_child(agent, cancel=False))
+
+
+def test_cancellation_kills_the_whole_process_group(agent):
+    assert_process_gone(run_with_child(agent, cancel=True))
@@ -0,0 +1,99 @@
+"""Copy-free context propagation between agents."""
+
+import asyncio
+from types import SimpleNamespace
+
+from forgeflow.agents.base import (
+    BaseAgent, create_agent_output, fork_context, layer_contexts, merge_contexts
+)
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+
+
+def test_layers_are_read_through_and_never_written():
+    shared = {"lang": "py", "nested": {"a": 1}}
+    context = layer_contexts({"lang": "ts"}, shared)
+    
+    context["lang"] = "go"
+    context["new"] = True
+    
+    assert context["lang"] == "go"
+    assert context["nested"] is shared["nested"]  # not copied
+    assert shared == {"lang": "py", "nested": {"a": 1}}
+
+
+def test_fork_drops_local_writes_but_keeps_the_layers():
+    context = layer_contexts({"lang": "py"})
+    context["scratch"] = 1
+    
+    fork = fork_context(context)
+    
+    assert "scratch" not in fork
+    assert fork["lang"] == "py"
+    fork["lang"] = "ts"
+    assert context["lang"] == "py"
+
+
+def test_merge_contexts_copies_only_shared_paths():
+    first = {"db": {"host": "a"}, "untouched": {"x": 1}}
+    second = {"db": {"port": 5432}}
+    
+    merged = merge_contexts(first, second)
+    
+    assert merged == {"db": {"host": "a", "port": 5432}, "untouched": {"x": 1}}
+    assert merged["untouched"] is first["untouched"]
+    assert first["db"] == {"host": "a"}
+
+
+def make_agent(name: str, fail: bool = False, seen=None, context_updates=None):
+    class ContextAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set()
+        
+        async def _execute_impl(self, input_data):
+            if seen is not None:
+                seen[name] = dict(input_data.previous_outputs)
+                input_data.previous_outputs["producer"] = f"overwritten by {name}"
+                input_data.project_context["lang"] = name
+            if fail:
+                raise RuntimeError("fatal: no output")
+            return create_agent_output(
+                input_data.agent_execution_id, name,
+                primary_result=f"{name} result", context_updates=context_updates or {}
+            )
+    
+    return ContextAgent
+
+
+def test_dependents_share_layers_without_seeing_each_others_writes():
+    seen = {}
+    config = OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1)
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={
+        "producer": make_agent("producer", context_updates={"schema": "v1"}),
+        "broken": make_agent("broken", fail=True),
+        "first": make_agent("first", seen=seen),
+        "second": make_agent("second", seen=seen)
+    })
+    
+    run = PipelineRun(
+        name="contexts", feature_brief="brief", project_context={"lang": "py"}, orchestration_config=config
+    )
+    run.add_execution("producer")
+    run.add_execution("broken")
+    run.add_execution("first", ["producer", "broken"], optional_dependencies=["broken"])
+    run.add_execution("second", ["producer"])
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=30))
+    
+    assert run.get_execution("broken").status == ExecutionStatus.FAILURE
+    assert run.get_execution("first").status == ExecutionStatus.SUCCESS
+    # The failed optional dependency contributes no layer
+    assert seen["first"] == seen["second"] == {"producer": "producer result", "schema": "v1"}
+    assert run.project_context == {"lang": "py"}
+    
+    producer = run.get_execution("producer")
+    layer = executor.context_layers[producer.id]
+    assert executor._get_context_layer(producer) is layer  # built once, shared
+    assert layer["producer"] == "producer result"
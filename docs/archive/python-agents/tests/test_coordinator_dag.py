@@ -0,0 +1,191 @@
+"""Coordinator dependency graph: waves, parallelism bound, merge points and failures."""
+
+import asyncio
+import subprocess
+from typing import Dict, List, Optional
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.agents.coordinator import (
+    AgentAssignment, CoordinationPlan, CoordinationStrategy, CoordinatorAgent
+)
+from forgeflow.agents.factory import AgentFactory
+from forgeflow.agents.registry import AgentRegistry
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(("git", *args), cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+class Recorder:
+    """What the stub agents did, in order."""
+    
+    def __init__(self):
+        self.events: List[str] = []
+        self.seen: Dict[str, List[str]] = {}  # files present in each agent's worktree
+        self.active = 0
+        self.peak = 0
+
+
+def make_agent(name: str, recorder: Recorder, fail: bool = False, writes: Optional[str] = None):
+    """Stub agent writing writes (default <name>.txt) into its working directory."""
+    class StubAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set()
+        
+        async def _execute_impl(self, input_data):
+            recorder.events.append(f"{name} start")
+            recorder.seen[name] = sorted(path.name for path in self.working_directory.glob("*.txt"))
+            recorder.active += 1
+            recorder.peak = max(recorder.peak, recorder.active)
+            try:
+                await asyncio.sleep(0.05)
+                if fail:
+                    raise RuntimeError(f"{name} failed")
+                (self.working_directory / (writes or f"{name}.txt")).write_text(f"{name}\n")
+            finally:
+                recorder.active -= 1
+                recorder.events.append(f"{name} end")
+            return create_agent_output(input_data.agent_execution_id, name)
+    
+    return StubAgent
+
+
+def make_coordinator(repo, *agents) -> CoordinatorAgent:
+    registry = AgentRegistry()
+    for agent in agents:
+        registry.register_agent(agent)
+    
+    coordinator = CoordinatorAgent()
+    coordinator.project_path = repo
+    coordinator.factory = AgentFactory(registry)
+    return coordinator
+
+
+def make_plan(*assignments, max_parallel: int = 4, conflict_resolution: str = "manual") -> CoordinationPlan:
+    return CoordinationPlan(
+        feature_brief="brief",
+        strategy=CoordinationStrategy(
+            name="test",
+            type="parallel",
+            conflict_resolution=conflict_resolution,
+            max_parallel_agents=max_parallel
+        ),
+        assignments=[
+            AgentAssignment(agent_type=agent_type, file_patterns=[f"{agent_type}.txt"], task_description=agent_type,
+                            dependencies=list(deps))
+            for agent_type, deps in assignments
+        ]
+    )
+
+
+def test_waves_run_in_dependency_order_with_merge_points(git_repo):
+    recorder = Recorder()
+    coordinator = make_coordinator(git_repo, *(
+        make_agent(name, recorder) for name in ("planner", "coder", "tester", "reviewer")
+    ))
+    plan = make_plan(
+        ("planner", ()), ("coder", ("planner",)), ("tester", ("planner",)), ("reviewer", ("coder", "tester"))
+    )
+    
+    result = asyncio.run(coordinator._execute_dag(plan))
+    
+    assert result.success
+    events = recorder.events
+    assert events.index("planner end") < min(events.index("coder start"), events.index("tester start"))
+    assert events.index("reviewer start") > max(events.index("coder end"), events.index("tester end"))
+    assert events.index("tester start") < events.index("coder end")  # same wave, in parallel
+    
+    # Each agent forked after its dependencies were merged into the feature branch
+    assert recorder.seen["coder"] == ["planner.txt"]
+    assert recorder.seen["reviewer"] == ["coder.txt", "planner.txt", "tester.txt"]
+    
+    assert git(git_repo, "symbolic-ref", "--short", "HEAD") == result.feature_branch
+    assert git(git_repo, "ls-files", "*.txt").split() == ["coder.txt", "planner.txt", "reviewer.txt", "tester.txt"]
+
+
+def test_parallelism_is_bounded_by_max_parallel_agents(git_repo):
+    recorder = Recorder()
+    names = [f"agent{index}" for index in range(5)]
+    coordinator = make_coordinator(git_repo, *(make_agent(name, recorder) for name in names))
+    plan = make_plan(*((name, ()) for name in names), max_parallel=2)
+    
+    result = asyncio.run(coordinator._execute_dag(plan))
+    
+    assert result.success
+    assert recorder.peak == 2
+    assert all(result.agent_results[name]["success"] for name in names)
+
+
+def test_dependents_of_a_failed_agent_are_skipped(git_repo):
+    recorder = Recorder()
+    coordinator = make_coordinator(
+        git_repo,
+        make_agent("coder", recorder, fail=True),
+        make_agent("tester", recorder),
+        make_agent("reviewer", recorder),
+        make_agent("docs", recorder)
+    )
+    plan = make_plan(("coder", ()), ("tester", ("coder",)), ("reviewer", ("tester",)), ("docs", ()))
+    
+    result = asyncio.run(coordinator._execute_dag(plan))
+    
+    assert not result.agent_results["coder"]["success"]
+    for skipped in ("tester", "reviewer"):
+        assert result.agent_results[skipped] == {
+            "error": "Dependency coder failed", "success": False, "skipped": True
+        }
+    assert result.agent_results["docs"]["success"]
+    assert "tester start" not in recorder.events
+    assert git(git_repo, "ls-files", "*.txt") == "docs.txt"
+
+
+def test_unresolved_conflict_at_a_merge_point_skips_the_dependents(git_repo):
+    recorder = Recorder()
+    coordinator = make_coordinator(
+        git_repo,
+        make_agent("frontend", recorder, writes="shared.txt"),
+        make_agent("backend", recorder, writes="shared.txt"),
+        make_agent("tester", recorder),
+        make_agent("reviewer", recorder),
+        make_agent("docs", recorder)
+    )
+    plan = make_plan(
+        ("frontend", ()), ("backend", ()), ("tester", ("frontend", "backend")), ("reviewer", ("tester",)),
+        ("docs", ())
+    )
+    
+    result = asyncio.run(coordinator._execute_dag(plan))
+    
+    assert not result.success
+    assert result.manual_conflicts == ["shared.txt"]
+    assert result.agent_results["tester"]["error"] == "Dependency backend could not be merged"
+    assert result.agent_results["reviewer"]["skipped"]
+    assert result.agent_results["docs"]["success"]
+    
+    # The conflicting merge was aborted: the feature branch is checked out and clean
+    assert git(git_repo, "symbolic-ref", "--short", "HEAD") == result.feature_branch
+    assert git(git_repo, "status", "--porcelain") == ""
+    assert (git_repo / "shared.txt").read_text() == "frontend\n"
+    assert (git_repo / "docs.txt").exists()
+
+
+def test_dependency_graph_rejects_duplicates_and_cycles():
+    coordinator = CoordinatorAgent()
+    
+    def assignments(*pairs):
+        return make_plan(*pairs).assignments
+    
+    assert coordinator._build_dependency_graph(assignments(("coder", ("planner", "unassigned")), ("planner", ()))) == {
+        "coder": ("planner",), "planner": ()
+    }
+    
+    with pytest.raises(ValueError, match="more than once: coder"):
+        coordinator._build_dependency_graph(assignments(("coder", ()), ("coder", ())))
+    
+    with pytest.raises(ValueError, match="Circular dependencies"):
+        coordinator._build_dependency_graph(assignments(
+            ("planner", ()), ("coder", ("tester",)), ("tester", ("coder",))
+        ))
@@ -0,0 +1,98 @@
+"""Deadline propagation and cooperative cancellation through agents."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.agents.deadline import Deadline
+from forgeflow.agents.exceptions import AgentCancelledError, AgentTimeoutError
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import (
+    ExecutionStatus, OrchestrationConfig, PipelineRun, PipelineStatus
+)
+
+
+class PollingAgent(BaseAgent):
+    """Works in small steps, checking its deadline between them."""
+    agent_type = "polling"
+    version = "1.0.0"
+    capabilities = set()
+    seen = []
+    
+    async def _execute_impl(self, input_data):
+        type(self).seen.append(self.deadline)
+        for _ in range(500):
+            self.deadline.check()
+            await asyncio.sleep(0.01)
+        return create_agent_output(input_data.agent_execution_id, self.agent_type)
+
+
+def make_run(config: OrchestrationConfig):
+    PollingAgent.seen = []
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"polling": PollingAgent})
+    run = PipelineRun(name="deadline", feature_brief="brief", orchestration_config=config)
+    run.add_execution("polling")
+    return executor, run
+
+
+def test_children_never_outlive_their_parent():
+    parent = Deadline.after(10)
+    
+    assert parent.child(60).expires_at == parent.expires_at
+    assert parent.child(1).remaining() <= 1
+    assert Deadline().child().remaining() is None
+    
+    expired = Deadline.after(0)
+    with pytest.raises(AgentTimeoutError):
+        expired.child(60).check()
+
+
+def test_cancel_propagates_to_children():
+    parent = Deadline.after(10)
+    child = parent.child()
+    grandchild = child.child(5)
+    
+    parent.cancel("stop")
+    
+    assert child.cancelled and grandchild.cancelled
+    assert grandchild.remaining() == 0.0
+    with pytest.raises(AgentCancelledError, match="stop"):
+        grandchild.check()
+    # Deadlines derived after the cancellation start out cancelled
+    assert parent.child().cancel_reason == "stop"
+
+
+def test_agent_attempts_are_bounded_by_the_run_deadline():
+    executor, run = make_run(OrchestrationConfig(pipeline_timeout=0.3, enable_monitoring=False))
+    
+    started = time.monotonic()
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=5))
+    
+    assert time.monotonic() - started < 2
+    (deadline,) = PollingAgent.seen
+    assert deadline.expires_at <= executor.run_deadlines[run.id].expires_at
+    assert run.get_execution("polling").status == ExecutionStatus.CANCELLED
+
+
+def test_cancelling_the_pipeline_stops_the_agent_cooperatively():
+    executor, run = make_run(OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False))
+    executor.active_runs[run.id] = run
+    run.status = PipelineStatus.RUNNING
+    
+    async def scenario():
+        task = asyncio.create_task(executor._execute_pipeline_agents(run))
+        while not PollingAgent.seen:
+            await asyncio.sleep(0.01)
+        
+        assert await executor.cancel_pipeline(run.id)
+        await asyncio.wait_for(task, timeout=2)
+    
+    asyncio.run(scenario())
+    
+    (deadline,) = PollingAgent.seen
+    assert deadline.cancel_reason == "pipeline_cancelled"
+    assert run.get_execution("polling").status == ExecutionStatus.CANCELLED
@@ -0,0 +1,70 @@
+"""Slots-based hot-path state mirroring AgentExecution and PipelineRun."""
+
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+from forgeflow.orchestration.state import ExecutionState, RunState
+
+
+def make_run() -> PipelineRun:
+    run = PipelineRun(name="state", feature_brief="brief", orchestration_config=OrchestrationConfig())
+    run.add_execution("architect")
+    run.add_execution("coder", ["architect"])
+    run.add_execution("tester", ["coder"], stream_dependencies=["coder"])
+    return run
+
+
+def test_state_does_not_alias_model_containers():
+    run = make_run()
+    model = run.get_execution("coder")
+    
+    state = ExecutionState.from_model(model)
+    state.depends_on.append("planner")
+    state.resource_requirements["memory_mb"] = 1024
+    assert model.depends_on == ["architect"]
+    assert model.resource_requirements == {}
+    
+    run_state = RunState.from_model(run)
+    run_state.artifacts["report"] = "data"
+    assert run.artifacts == {}
+
+
+def test_snapshot_does_not_alias_live_state():
+    run_state = RunState.from_model(make_run())
+    execution = run_state.get_execution("coder")
+    
+    snapshot = run_state.to_model()
+    execution.depends_on.append("planner")
+    execution.status = ExecutionStatus.RUNNING
+    
+    coder = snapshot.get_execution("coder")
+    assert coder.depends_on == ["architect"]
+    assert coder.status == ExecutionStatus.PENDING
+
+
+def test_set_executions_reindexes():
+    run_state = RunState.from_model(make_run())
+    reordered = list(reversed(run_state.executions))[:2]
+    
+    run_state.set_executions(reordered)
+    
+    assert [e.agent_type for e in run_state.executions] == ["tester", "coder"]
+    assert run_state.get_execution("architect") is None
+    assert run_state.get_execution("coder") is reordered[1]
+    assert run_state.has_stream_consumers("coder")
+
+
+def test_lifecycle_transitions_match_the_model():
+    run_state = RunState.from_model(make_run())
+    architect = run_state.get_execution("architect")
+    
+    assert [e.agent_type for e in run_state.get_ready_executions()] == ["architect"]
+    
+    architect.mark_started()
+    assert architect.status == ExecutionStatus.RUNNING
+    architect.mark_failed("boom")
+    assert architect.can_retry()
+    
+    architect.attempt_number = architect.max_attempts
+    assert architect.is_terminally_failed()
+    skipped = run_state.skip_blocked_dependents("architect")
+    assert [e.agent_type for e in skipped] == ["coder", "tester"]
+    assert run_state.is_complete()
@@ -0,0 +1,47 @@
+"""Failure handling of the pipeline executor under its default configuration."""
+
+import asyncio
+from types import SimpleNamespace
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+
+
+def make_agent(name: str, fail: bool = False):
+    class TestAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set()
+        calls = 0
+        
+        async def _execute_impl(self, input_data):
+            type(self).calls += 1
+            if fail:
+                raise RuntimeError("fatal: agent failed")
+            return create_agent_output(input_data.agent_execution_id, name, primary_result=name)
+    
+    return TestAgent
+
+
+def test_failed_agent_is_retried_then_dependents_are_skipped():
+    config = OrchestrationConfig(pipeline_timeout=60)
+    executor = PipelineExecutor(config)
+    agents = {"fa": make_agent("fa", fail=True), "fb": make_agent("fb"), "fc": make_agent("fc")}
+    executor.agent_registry = SimpleNamespace(agents=agents)
+    
+    run = PipelineRun(name="chain", feature_brief="brief", orchestration_config=config)
+    run.add_execution("fa")
+    run.add_execution("fb", ["fa"])
+    run.add_execution("fc", ["fb"])
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=30))
+    
+    fa, fb, fc = (run.get_execution(name) for name in ("fa", "fb", "fc"))
+    assert agents["fa"].calls == config.default_max_attempts
+    assert fa.status == ExecutionStatus.FAILURE
+    assert fa.is_terminally_failed()
+    assert fb.status == ExecutionStatus.CANCELLED and "fa" in fb.last_error
+    assert fc.status == ExecutionStatus.CANCELLED and "fb" in fc.last_error
+    assert agents["fb"].calls == agents["fc"].calls == 0
+    assert run.is_complete()
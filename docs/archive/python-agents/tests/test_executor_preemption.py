@@ -0,0 +1,106 @@
+"""Preemption of running pipelines on pause, and re-admission on resume."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import (
+    ExecutionStatus, OrchestrationConfig, PipelineRun, PipelineStatus
+)
+
+
+def make_flaky_agent(name: str, error: str):
+    """Agent failing its first attempt with error, succeeding afterwards."""
+    class FlakyAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set()
+        calls = 0
+        
+        async def _execute_impl(self, input_data):
+            type(self).calls += 1
+            if type(self).calls == 1:
+                raise RuntimeError(error)
+            return create_agent_output(input_data.agent_execution_id, name, primary_result=name)
+    
+    return FlakyAgent
+
+
+async def wait_until(condition, timeout: float = 10.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+def start_run(executor: PipelineExecutor, config: OrchestrationConfig, *agent_types: str) -> PipelineRun:
+    run = PipelineRun(name="preempt", feature_brief="brief", orchestration_config=config)
+    for agent_type in agent_types:
+        run.add_execution(agent_type)
+    executor.active_runs[run.id] = run
+    run.status = PipelineStatus.RUNNING
+    return run
+
+
+@pytest.mark.parametrize("error, phase", [
+    ("fatal: first attempt failed", ExecutionStatus.RETRY),  # no recovery; waits in retry backoff
+    ("first attempt failed", ExecutionStatus.FAILURE)  # waits in failure recovery
+])
+def test_pause_outside_the_attempt_requeues_the_execution(error, phase):
+    config = OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False)
+    executor = PipelineExecutor(config)
+    agent = make_flaky_agent("flaky", error)
+    executor.agent_registry = SimpleNamespace(agents={"flaky": agent})
+    run = start_run(executor, config, "flaky")
+    execution = run.get_execution("flaky")
+    
+    async def scenario():
+        task = asyncio.create_task(executor._execute_pipeline_agents(run))
+        await wait_until(lambda: agent.calls == 1 and execution.status == phase)
+        await asyncio.sleep(0.05)
+        
+        assert await executor.pause_pipeline(run.id, preempt=True)
+        await wait_until(lambda: execution.status == ExecutionStatus.PENDING)
+        assert not executor.preempting_executions
+        assert execution.preemption_count == 1
+        
+        assert await executor.resume_pipeline(run.id)
+        await asyncio.wait_for(task, timeout=30)
+    
+    asyncio.run(scenario())
+    
+    assert agent.calls == 2
+    assert execution.status == ExecutionStatus.SUCCESS
+    assert execution.attempt_number == 2
+    assert run.is_complete()
+
+
+def test_preempting_the_last_failed_attempt_fails_the_execution():
+    config = OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1)
+    executor = PipelineExecutor(config)
+    agent = make_flaky_agent("flaky", "first attempt failed")
+    dependent = make_flaky_agent("dependent", "unused")
+    executor.agent_registry = SimpleNamespace(agents={"flaky": agent, "dependent": dependent})
+    run = start_run(executor, config, "flaky")
+    run.add_execution("dependent", ["flaky"])
+    execution = run.get_execution("flaky")
+    
+    async def scenario():
+        task = asyncio.create_task(executor._execute_pipeline_agents(run))
+        await wait_until(lambda: agent.calls == 1 and execution.status == ExecutionStatus.FAILURE)
+        await asyncio.sleep(0.05)
+        
+        assert await executor.pause_pipeline(run.id, preempt=True)
+        assert await executor.resume_pipeline(run.id)
+        await asyncio.wait_for(task, timeout=30)
+    
+    asyncio.run(scenario())
+    
+    assert agent.calls == 1
+    assert execution.status == ExecutionStatus.FAILURE
+    assert run.get_execution("dependent").status == ExecutionStatus.CANCELLED
+    assert not executor.preempting_executions
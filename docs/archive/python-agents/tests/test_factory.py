@@ -0,0 +1,169 @@
+"""Concurrent agent factory operations: health checks, cleanup and pipeline creation."""
+
+import asyncio
+
+import pytest
+
+from forgeflow.agents.base import AgentCapability, BaseAgent, create_agent_output
+from forgeflow.agents.exceptions import AgentConfigurationError
+from forgeflow.agents.factory import AgentFactory
+from forgeflow.agents.performance import AgentPerformanceStats
+from forgeflow.agents.registry import AgentRegistry
+
+
+class Probe:
+    """Concurrency observed by the stub agents' health checks and cleanups."""
+    
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.cancelled = 0
+        self.cleaned = []
+    
+    async def hold(self, delay: float):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+
+
+def make_agent(name: str, probe: Probe, *provides: AgentCapability, broken: bool = False):
+    class CheckedAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set(provides)
+        
+        def _initialize(self):
+            self.health_delay = 0.0
+            self.health_error = None
+        
+        async def health_check(self):
+            if broken:
+                return {"status": "error", "agent_type": name}
+            await probe.hold(self.health_delay)
+            if self.health_error:
+                raise RuntimeError(self.health_error)
+            return await super().health_check()
+        
+        async def cleanup(self):
+            await probe.hold(0.01)
+            probe.cleaned.append(self.instance_id)
+        
+        async def _execute_impl(self, input_data):
+            return create_agent_output(input_data.agent_execution_id, name)
+    
+    return CheckedAgent
+
+
+def make_factory(probe: Probe, **options) -> AgentFactory:
+    registry = AgentRegistry()
+    registry.register_agent(make_agent("planner", probe, AgentCapability.PLANNING))
+    registry.register_agent(make_agent("coder", probe, AgentCapability.CODE_GENERATION))
+    registry.register_agent(make_agent("broken", probe, AgentCapability.SECURITY, broken=True))
+    return AgentFactory(registry, performance_stats=AgentPerformanceStats(), **options)
+
+
+def test_health_checks_fan_out_with_a_bound_and_a_cache():
+    probe = Probe()
+    factory = make_factory(probe, max_concurrency=3)
+    
+    async def scenario():
+        agents = [await factory.create_agent("planner") for _ in range(8)]
+        for agent in agents:
+            agent.health_delay = 0.05
+        
+        first = await factory.health_check_all()
+        second = await factory.health_check_all()
+        fresh = await factory.health_check_all(use_cache=False)
+        return first, second, fresh
+    
+    first, second, fresh = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert first["healthy_agents"] == 8
+    assert probe.peak == 3
+    assert second["check_stats"]["cache_hits"] == 8
+    assert fresh["check_stats"]["checks"] == 8 + 8 + 8  # creation, first and uncached round
+    assert fresh["health_percentage"] == 100
+
+
+def test_slow_or_failing_health_checks_are_reported_not_raised():
+    probe = Probe()
+    factory = make_factory(probe, health_check_timeout=0.1)
+    
+    async def scenario():
+        healthy, slow, failing = [await factory.create_agent("planner") for _ in range(3)]
+        slow.health_delay = 5
+        failing.health_error = "model endpoint unreachable"
+        return await factory.health_check_all(), await factory.list_active_agents(), slow, failing
+    
+    report, listed, slow, failing = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert report["healthy_agents"] == 1
+    assert "timed out" in report["agents"][slow.instance_id]["error"]
+    assert report["agents"][failing.instance_id]["error"] == "model endpoint unreachable"
+    assert (report["check_stats"]["timeouts"], report["check_stats"]["failures"]) == (1, 1)
+    assert probe.cancelled == 1
+    # Listing reuses the cached error results
+    assert sorted(agent["status"] for agent in listed) == ["error", "error", "healthy"]
+
+
+def test_cleanup_destroys_every_agent_concurrently():
+    probe = Probe()
+    factory = make_factory(probe)
+    
+    async def scenario():
+        for _ in range(5):
+            await factory.create_agent("coder")
+        return await factory.cleanup_all()
+    
+    assert asyncio.run(asyncio.wait_for(scenario(), timeout=5)) == 5
+    assert len(probe.cleaned) == 5
+    assert probe.peak == 5
+    assert factory._active_agents == {} and factory._health_cache == {}
+
+
+def test_failed_pipeline_creation_destroys_the_created_agents():
+    probe = Probe()
+    factory = make_factory(probe)
+    
+    async def scenario():
+        agents = await factory.create_pipeline_agents([AgentCapability.PLANNING, AgentCapability.CODE_GENERATION])
+        assert {agent.agent_type for agent in agents.values()} == {"planner", "coder"}
+        await factory.cleanup_all()
+        probe.cleaned.clear()
+        
+        with pytest.raises(AgentConfigurationError, match="Failed to create agent broken"):
+            await factory.create_pipeline_agents([AgentCapability.PLANNING, AgentCapability.SECURITY])
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert len(probe.cleaned) == 1  # the planner created alongside the broken agent
+    assert factory._active_agents == {}
+
+
+def test_cancelled_health_round_cancels_in_flight_checks():
+    probe = Probe()
+    factory = make_factory(probe, max_concurrency=2)
+    
+    async def scenario():
+        agents = [await factory.create_agent("planner") for _ in range(4)]
+        for agent in agents:
+            agent.health_delay = 5
+        
+        task = asyncio.create_task(factory.health_check_all(use_cache=False))
+        while probe.active < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert probe.cancelled == 2
+    assert probe.active == 0
+    assert factory.health_stats["checks"] == 4 + 2  # the queued checks never started
@@ -0,0 +1,110 @@
+"""Async git layer: commands, ref transactions and the per-repository lock."""
+
+import asyncio
+import gc
+import subprocess
+
+import pytest
+
+from forgeflow.agents import git_repository
+from forgeflow.agents.deadline import Deadline
+from forgeflow.agents.exceptions import AgentTimeoutError
+from forgeflow.agents.git_repository import GitRepository, run_process
+
+
+def test_branches_are_created_and_deleted_in_one_transaction(git_repo):
+    git = GitRepository(git_repo)
+    
+    async def scenario():
+        head = await git.rev_parse("main")
+        assert await git.create_branches(["a", "b"], "main") == head
+        assert await git.rev_parse("b") == head
+        
+        # "a" exists: the whole transaction fails and "c" isn't created
+        with pytest.raises(RuntimeError, match="update-ref"):
+            await git.create_branches(["c", "a"], "main")
+        assert (await git.run("branch", "--list", "c", exclusive=False)).stdout == ""
+        
+        await git.delete_branches(["a", "b"])
+        assert (await git.run("branch", "--list", "a", "b", exclusive=False)).stdout == ""
+    
+    asyncio.run(scenario())
+
+
+def test_changed_files_and_current_branch(git_repo):
+    git = GitRepository(git_repo)
+    
+    async def scenario():
+        await git.run("checkout", "-q", "-b", "feature")
+        (git_repo / "new.py").write_text("x = 1\n")
+        await git.run("add", "-A")
+        await git.run("commit", "-q", "-m", "add new.py")
+        
+        assert await git.current_branch() == "feature"
+        assert await git.changed_files("main...feature") == ["new.py"]
+        assert await git.changed_files("main...no-such-branch") == []
+    
+    asyncio.run(scenario())
+
+
+def test_exclusive_serializes_tasks_and_is_reentrant(git_repo):
+    order = []
+    
+    async def holder(name):
+        git = GitRepository(git_repo)
+        async with git.exclusive():
+            order.append(f"{name} in")
+            await git.run("status", "--short")  # re-enters the held lock
+            await asyncio.sleep(0.05)
+            order.append(f"{name} out")
+    
+    async def scenario():
+        await asyncio.gather(holder("first"), holder("second"))
+    
+    asyncio.run(scenario())
+    
+    assert order == ["first in", "first out", "second in", "second out"]
+
+
+def test_lock_works_across_event_loops(git_repo):
+    async def contend():
+        git = GitRepository(git_repo)
+        await asyncio.gather(*(git.run("status", "--short") for _ in range(3)))
+    
+    # Each run has its own loop; a lock bound to the first would fail in the second
+    asyncio.run(asyncio.wait_for(contend(), timeout=5))
+    asyncio.run(asyncio.wait_for(contend(), timeout=5))
+
+
+def test_unused_locks_are_released(git_repo):
+    async def scenario():
+        await GitRepository(git_repo).run("status", "--short")
+        gc.collect()
+        return dict(git_repository._repo_locks.get(asyncio.get_running_loop(), {}))
+    
+    assert asyncio.run(scenario()) == {}
+
+
+def test_run_process_is_killed_at_the_deadline(tmp_path):
+    async def scenario():
+        with pytest.raises(subprocess.TimeoutExpired):
+            await run_process(("sleep", "5"), tmp_path, deadline=Deadline.after(0.1))
+        
+        with pytest.raises(AgentTimeoutError):
+            await run_process(("true",), tmp_path, deadline=Deadline.after(0))
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=3))
+
+
+def test_cancelled_command_releases_the_lock(git_repo):
+    async def scenario():
+        git = GitRepository(git_repo)
+        task = asyncio.create_task(git.run("-c", "alias.wait=!sleep 1", "wait"))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        await asyncio.wait_for(git.run("status", "--short"), timeout=2)
+    
+    asyncio.run(scenario())
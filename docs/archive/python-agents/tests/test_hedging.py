@@ -0,0 +1,137 @@
+"""Hedged execution of straggling agent attempts."""
+
+import asyncio
+from types import SimpleNamespace
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.hedging import HedgingPolicy
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+
+
+def make_config(**overrides) -> OrchestrationConfig:
+    settings = dict(
+        pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1,
+        enable_hedging=True, hedge_min_samples=1, hedge_max_extra_load=1.0
+    )
+    settings.update(overrides)
+    return OrchestrationConfig(**settings)
+
+
+def make_agent(*behaviours):
+    """Agent whose n-th attempt runs behaviours[n]: (delay, error or None)."""
+    class HedgedAgent(BaseAgent):
+        agent_type = "hedged"
+        version = "1.0.0"
+        capabilities = set()
+        calls = 0
+        cancelled = 0
+        
+        async def _execute_impl(self, input_data):
+            cls = type(self)
+            delay, error = behaviours[cls.calls]
+            cls.calls += 1
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cls.cancelled += 1
+                raise
+            if error:
+                raise RuntimeError(error)
+            return create_agent_output(input_data.agent_execution_id, self.agent_type, primary_result=delay)
+    
+    return HedgedAgent
+
+
+def make_executor(config: OrchestrationConfig, agent, observed_latency: float = 0.05):
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"hedged": agent})
+    executor.hedging.record_latency("hedged", observed_latency)
+    
+    run = PipelineRun(name="hedge", feature_brief="brief", orchestration_config=config)
+    run.add_execution("hedged")
+    return executor, run
+
+
+def test_policy_waits_for_samples_and_respects_the_budget():
+    policy = HedgingPolicy(make_config(hedge_min_samples=3, hedge_max_extra_load=0.5, hedge_percentile=50))
+    
+    for latency in (1.0, 2.0):
+        policy.record_latency("coder", latency)
+    assert policy.get_hedge_delay("coder") is None
+    
+    policy.record_latency("coder", 3.0)
+    assert policy.get_hedge_delay("coder") == 2.0
+    
+    policy.record_attempt("coder")
+    assert not policy.try_launch_hedge("coder")  # 1 hedge > 50% of 1 attempt
+    policy.record_attempt("coder")
+    assert policy.try_launch_hedge("coder")
+    assert policy.get_statistics()['hedges_denied_budget'] == 1
+    
+    assert HedgingPolicy(make_config(enable_hedging=False)).get_hedge_delay("coder") is None
+
+
+def test_hedge_wins_over_a_straggling_primary():
+    agent = make_agent((5.0, None), (0.0, None))
+    executor, run = make_executor(make_config(), agent)
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=3))
+    
+    execution = run.get_execution("hedged")
+    assert execution.status == ExecutionStatus.SUCCESS
+    assert execution.output_data.primary_result == 0.0
+    assert agent.calls == 2
+    assert agent.cancelled == 1  # the primary was cancelled
+    assert executor.hedging.get_statistics()['hedges_won'] == 1
+
+
+def test_failed_hedge_does_not_beat_a_running_primary():
+    agent = make_agent((0.3, None), (0.0, "hedge failed"))
+    executor, run = make_executor(make_config(), agent)
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=3))
+    
+    execution = run.get_execution("hedged")
+    assert execution.status == ExecutionStatus.SUCCESS
+    assert execution.output_data.primary_result == 0.3
+    assert executor.hedging.get_statistics()['hedges_won'] == 0
+
+
+def test_execution_fails_when_both_attempts_fail():
+    agent = make_agent((0.2, "primary failed"), (0.0, "hedge failed"))
+    executor, run = make_executor(make_config(), agent)
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=3))
+    
+    execution = run.get_execution("hedged")
+    assert execution.status == ExecutionStatus.FAILURE
+    assert "primary failed" in execution.last_error
+    assert agent.calls == 2
+
+
+def test_exhausted_budget_runs_without_a_hedge():
+    agent = make_agent((0.2, None))
+    executor, run = make_executor(make_config(hedge_max_extra_load=0.0), agent)
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=3))
+    
+    assert run.get_execution("hedged").status == ExecutionStatus.SUCCESS
+    assert agent.calls == 1
+    assert executor.hedging.get_statistics()['hedges_denied_budget'] == 1
+
+
+def test_cancelling_the_execution_cancels_both_attempts():
+    agent = make_agent((5.0, None), (5.0, None))
+    executor, run = make_executor(make_config(), agent)
+    
+    async def scenario():
+        task = asyncio.create_task(executor._execute_pipeline_agents(run))
+        while agent.calls < 2:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=3))
+    
+    assert agent.cancelled == 2
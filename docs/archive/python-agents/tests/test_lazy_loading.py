@@ -0,0 +1,78 @@
+"""Agents listed in the manifest are only imported when first used."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from forgeflow.agents.exceptions import AgentConfigurationError
+from forgeflow.agents.manifest import AGENT_MANIFEST
+from forgeflow.agents.registry import AgentRegistry
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Runs in a fresh interpreter, so modules imported by other tests don't count
+IMPORT_CHECK = f"""
+import json, sys, types
+package = types.ModuleType("forgeflow")
+package.__path__ = [{str(ROOT)!r}]
+sys.modules["forgeflow"] = package
+
+def agent_modules():
+    return sorted(name.rpartition(".")[2] for name in sys.modules if name.startswith("forgeflow.agents."))
+
+import forgeflow.agents as agents
+before = agent_modules()
+listed = sorted(agents.list_agents())
+planner = agents.get_agent("planner").__name__
+print(json.dumps([before, listed, planner, agent_modules()]))
+"""
+
+
+def test_importing_the_package_imports_no_agents():
+    output = subprocess.run(
+        (sys.executable, "-c", IMPORT_CHECK), check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+    
+    # structlog also writes to stdout; the result is the last line
+    before, listed, planner, after = json.loads(output[-1])
+    assert set(before).isdisjoint(AGENT_MANIFEST)
+    assert listed == sorted(AGENT_MANIFEST)
+    assert planner == "PlannerAgent"
+    # Only the agent that was used got imported
+    assert set(after) & set(AGENT_MANIFEST) == {"planner"}
+
+
+def test_lazy_agents_load_on_first_lookup():
+    registry = AgentRegistry()
+    registry.register_lazy("planner", "forgeflow.agents.planner:PlannerAgent")
+    
+    assert registry.list_agents() == ["planner"]
+    assert "planner" in registry.agents
+    assert registry._snapshot.classes == {}
+    
+    planner = registry.agents["planner"]
+    assert planner.__name__ == "PlannerAgent"
+    assert registry.get_agent_class("planner") is planner
+    assert registry._snapshot.lazy == {}
+    assert registry.get_agent_revision("planner") == 1
+
+
+def test_broken_targets_raise_a_configuration_error():
+    registry = AgentRegistry()
+    registry.register_manifest({
+        "missing": "forgeflow.agents.does_not_exist:MissingAgent",
+        "renamed": "forgeflow.agents.planner:PlannerAgent",
+        "coder": "forgeflow.agents.coder:CoderAgent"
+    })
+    
+    with pytest.raises(AgentConfigurationError, match="Cannot load agent 'missing'"):
+        registry.get_agent_class("missing")
+    with pytest.raises(AgentConfigurationError, match="declares agent_type 'planner', expected 'renamed'"):
+        registry.get_agent_class("renamed")
+    
+    # Capability queries load what they can and skip broken entries
+    assert registry.get_agents_with_capabilities([]) == ["coder"]
+    assert set(registry.list_agents()) == {"coder", "missing", "renamed"}
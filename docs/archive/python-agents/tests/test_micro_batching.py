@@ -0,0 +1,149 @@
+"""Micro-batching of one agent type's executions across pipelines."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from forgeflow.agents.base import AgentInput, BaseAgent, create_agent_output
+from forgeflow.agents.deadline import Deadline
+from forgeflow.agents.exceptions import AgentTimeoutError
+from forgeflow.orchestration.batching import MicroBatcher
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+
+
+class BatchedAgent(BaseAgent):
+    """Records the size of every batch and fails briefs starting with 'bad'."""
+    agent_type = "batched"
+    version = "1.0.0"
+    capabilities = set()
+    batches = []
+    
+    async def _execute_batch_impl(self, inputs):
+        type(self).batches.append(len(inputs))
+        await asyncio.sleep(0.01)
+        return await super()._execute_batch_impl(inputs)
+    
+    async def _execute_impl(self, input_data):
+        if input_data.feature_brief.startswith("bad"):
+            raise RuntimeError(f"cannot handle {input_data.feature_brief}")
+        return create_agent_output(
+            input_data.agent_execution_id, self.agent_type, primary_result=input_data.feature_brief
+        )
+
+
+def make_batcher(**overrides) -> MicroBatcher:
+    BatchedAgent.batches = []
+    settings = dict(enable_monitoring=False, micro_batch_max_size=8, micro_batch_max_wait=0.05)
+    settings.update(overrides)
+    return MicroBatcher(OrchestrationConfig(**settings), asyncio.Semaphore(4))
+
+
+def make_input(brief: str, deadline=None) -> AgentInput:
+    return AgentInput(run_id=uuid4(), feature_brief=brief, deadline=deadline)
+
+
+def test_concurrent_inputs_share_one_batch():
+    async def scenario():
+        batcher = make_batcher()
+        outputs = await asyncio.gather(*(
+            batcher.execute(BatchedAgent, make_input(f"brief {index}")) for index in range(3)
+        ))
+        return batcher, outputs
+    
+    batcher, outputs = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert BatchedAgent.batches == [3]
+    assert [output.primary_result for output in outputs] == ["brief 0", "brief 1", "brief 2"]
+    stats = batcher.get_statistics()
+    assert (stats['batches_executed'], stats['largest_batch'], stats['open_windows']) == (1, 3, 0)
+
+
+def test_full_batch_flushes_without_waiting_for_the_window():
+    async def scenario():
+        batcher = make_batcher(micro_batch_max_size=2, micro_batch_max_wait=10)
+        return await asyncio.gather(*(
+            batcher.execute(BatchedAgent, make_input(f"brief {index}")) for index in range(4)
+        ))
+    
+    outputs = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert BatchedAgent.batches == [2, 2]
+    assert len(outputs) == 4
+
+
+def test_failing_input_does_not_fail_the_batch():
+    async def scenario():
+        batcher = make_batcher()
+        return await asyncio.gather(
+            batcher.execute(BatchedAgent, make_input("good")),
+            batcher.execute(BatchedAgent, make_input("bad brief"))
+        )
+    
+    good, bad = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert BatchedAgent.batches == [2]
+    assert good.status == "success"
+    assert bad.status == "failure"
+    assert "cannot handle bad brief" in bad.error_message
+
+
+def test_expired_member_is_dropped_before_the_batch_runs():
+    async def scenario():
+        batcher = make_batcher()
+        live = batcher.execute(BatchedAgent, make_input("live"))
+        expired = batcher.execute(BatchedAgent, make_input("expired", Deadline.after(0)))
+        return await asyncio.gather(live, expired, return_exceptions=True)
+    
+    live, expired = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert live.primary_result == "live"
+    assert isinstance(expired, AgentTimeoutError)
+    assert BatchedAgent.batches == [1]
+
+
+def test_cancelled_waiter_only_drops_its_own_input():
+    async def scenario():
+        batcher = make_batcher()
+        kept = asyncio.create_task(batcher.execute(BatchedAgent, make_input("kept")))
+        dropped = asyncio.create_task(batcher.execute(BatchedAgent, make_input("dropped")))
+        await asyncio.sleep(0)
+        dropped.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await dropped
+        return batcher, await kept
+    
+    batcher, kept = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert kept.primary_result == "kept"
+    assert BatchedAgent.batches == [1]
+    assert batcher.get_statistics()['dropped_executions'] == 1
+
+
+def test_executor_batches_the_same_agent_across_pipelines():
+    BatchedAgent.batches = []
+    config = OrchestrationConfig(
+        pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1,
+        micro_batch_agent_types=["batched"]
+    )
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"batched": BatchedAgent})
+    
+    runs = []
+    for brief in ("first", "second", "bad third"):
+        run = PipelineRun(name=brief, feature_brief=brief, orchestration_config=config)
+        run.add_execution("batched")
+        runs.append(run)
+    
+    async def scenario():
+        await asyncio.gather(*(executor._execute_pipeline_agents(run) for run in runs))
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    
+    assert BatchedAgent.batches == [3]
+    statuses = [run.get_execution("batched").status for run in runs]
+    assert statuses == [ExecutionStatus.SUCCESS, ExecutionStatus.SUCCESS, ExecutionStatus.FAILURE]
+    assert runs[1].get_execution("batched").output_data.primary_result == "second"
@@ -0,0 +1,117 @@
+"""Merging agent branches: one octopus merge for disjoint changes, one by one otherwise."""
+
+import asyncio
+import subprocess
+
+from forgeflow.agents.coordinator import CoordinationPlan, CoordinationStrategy, CoordinatorAgent
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(("git", *args), cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def make_branch(repo, branch: str, **files: str):
+    """Commit files (name -> content) on a new branch forked from main."""
+    git(repo, "checkout", "-q", "-b", branch, "main")
+    for name, content in files.items():
+        (repo / f"{name}.txt").write_text(content)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", f"{branch} work")
+    git(repo, "checkout", "-q", "main")
+
+
+def make_coordinator(repo) -> CoordinatorAgent:
+    coordinator = CoordinatorAgent()
+    coordinator.project_path = repo
+    return coordinator
+
+
+def make_plan(conflict_resolution: str = "manual") -> CoordinationPlan:
+    return CoordinationPlan(
+        feature_brief="brief",
+        strategy=CoordinationStrategy(name="test", type="parallel", conflict_resolution=conflict_resolution),
+        assignments=[]
+    )
+
+
+def merge(coordinator, branches, plan=None, predicted_overlaps=None):
+    return asyncio.run(asyncio.wait_for(
+        coordinator._merge_agent_branches(branches, "feature", plan or make_plan(), predicted_overlaps),
+        timeout=30
+    ))
+
+
+def parents(repo, revision: str) -> set:
+    return set(git(repo, "rev-list", "--parents", "-n", "1", revision).split()[1:])
+
+
+def test_partition_by_overlap():
+    coordinator = CoordinatorAgent()
+    changed = {
+        "a": {"a.txt"}, "b": {"b.txt", "api.txt"}, "c": {"shared.txt"}, "d": {"shared.txt"},
+        "e": {"e.txt"}, "empty": set()
+    }
+    
+    disjoint, overlapping = coordinator._partition_by_overlap(
+        changed, base_changed_paths={"b": {"api.txt"}}, predicted_overlaps={("e", "a"), ("e", "empty")}
+    )
+    
+    # b clashes with the base branch, c and d with each other, a and e were predicted to overlap
+    assert disjoint == []
+    assert overlapping == ["a", "b", "c", "d", "e"]
+    
+    disjoint, overlapping = coordinator._partition_by_overlap(changed, predicted_overlaps={("e", "empty")})
+    assert (disjoint, overlapping) == (["a", "b", "e"], ["c", "d"])
+
+
+def test_disjoint_branches_are_merged_in_one_octopus_merge(git_repo):
+    make_branch(git_repo, "agent/a", a="a\n")
+    make_branch(git_repo, "agent/b", b="b\n")
+    make_branch(git_repo, "agent/c", shared="c\n")
+    make_branch(git_repo, "agent/d", shared="d\n")
+    git(git_repo, "branch", "feature", "main")
+    
+    resolved, manual, failed = merge(make_coordinator(git_repo), ["agent/a", "agent/b", "agent/c", "agent/d"])
+    
+    assert (resolved, manual, failed) == ([], ["shared.txt"], ["agent/d"])
+    assert git(git_repo, "symbolic-ref", "--short", "HEAD") == "feature"
+    assert git(git_repo, "status", "--porcelain") == ""
+    
+    # agent/c was merged on its own after one merge of agent/a and agent/b
+    octopus = git(git_repo, "rev-parse", "feature^")
+    assert parents(git_repo, "feature") == {octopus, git(git_repo, "rev-parse", "agent/c")}
+    assert parents(git_repo, octopus) == {git(git_repo, "rev-parse", f"agent/{name}") for name in "ab"}
+    assert git(git_repo, "ls-files", "*.txt").split() == ["a.txt", "b.txt", "shared.txt"]
+    assert (git_repo / "shared.txt").read_text() == "c\n"
+
+
+def test_failed_octopus_merge_falls_back_to_merging_one_by_one(git_repo, monkeypatch):
+    make_branch(git_repo, "agent/a", a="a\n", shared="a\n")
+    make_branch(git_repo, "agent/b", b="b\n", shared="b\n")
+    git(git_repo, "branch", "feature", "main")
+    coordinator = make_coordinator(git_repo)
+    # Misjudge both branches as disjoint so the octopus merge conflicts
+    monkeypatch.setattr(coordinator, "_partition_by_overlap", lambda *args: (["agent/a", "agent/b"], []))
+    
+    resolved, manual, failed = merge(coordinator, ["agent/a", "agent/b"], make_plan("auto"))
+    
+    assert (resolved, manual, failed) == (["shared.txt"], [], [])
+    assert git(git_repo, "status", "--porcelain") == ""
+    assert all(len(parents(git_repo, revision)) <= 2 for revision in git(git_repo, "rev-list", "feature").split())
+    shared = (git_repo / "shared.txt").read_text()
+    assert "a\n" in shared and "b\n" in shared and "<<<<<<<" not in shared
+
+
+def test_predicted_overlaps_are_merged_one_by_one(git_repo):
+    make_branch(git_repo, "agent/a", a="a\n")
+    make_branch(git_repo, "agent/b", b="b\n")
+    git(git_repo, "branch", "feature", "main")
+    
+    resolved, manual, failed = merge(
+        make_coordinator(git_repo), ["agent/a", "agent/b"], predicted_overlaps={("agent/a", "agent/b")}
+    )
+    
+    assert (resolved, manual, failed) == ([], [], [])
+    # agent/a fast-forwarded the feature branch, agent/b was merged into it
+    assert parents(git_repo, "feature") == {git(git_repo, "rev-parse", f"agent/{name}") for name in "ab"}
+    assert git(git_repo, "ls-files", "*.txt").split() == ["a.txt", "b.txt"]
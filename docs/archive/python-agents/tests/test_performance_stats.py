@@ -0,0 +1,123 @@
+"""EWMA agent performance statistics and the selection strategies they feed."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import AgentCapability, BaseAgent, create_agent_output
+from forgeflow.agents.exceptions import AgentCancelledError
+from forgeflow.agents.factory import AgentFactory
+from forgeflow.agents.performance import AgentPerformanceStats
+from forgeflow.agents.registry import AgentRegistry
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import OrchestrationConfig, PipelineRun
+
+
+def test_first_observation_seeds_and_later_ones_decay():
+    stats = AgentPerformanceStats(alpha=0.5)
+    
+    stats.record("coder", True, 10.0)
+    stats.record("coder", False, 20.0)
+    stats.record("coder", False, 20.0)
+    
+    coder = stats.get("coder")
+    assert coder.success_rate == pytest.approx(0.25)
+    assert coder.avg_duration == pytest.approx(17.5)
+    assert (coder.executions, coder.failure_count) == (3, 2)
+    assert stats.get("planner") is None
+    assert stats.get_active("planner") == 0
+
+
+def test_track_records_outcomes_but_not_cancellations():
+    stats = AgentPerformanceStats()
+    
+    with stats.track("coder"):
+        assert stats.get_active("coder") == 1
+    with pytest.raises(RuntimeError):
+        with stats.track("coder"):
+            raise RuntimeError("failed")
+    for cancellation in (AgentCancelledError("pipeline_cancelled"), asyncio.CancelledError()):
+        with pytest.raises(type(cancellation)):
+            with stats.track("coder"):
+                raise cancellation
+    
+    coder = stats.get("coder")
+    assert (coder.executions, coder.failure_count, coder.active) == (2, 1, 0)
+    assert stats.get_statistics()["coder"]["success_rate"] == pytest.approx(0.8)
+
+
+def make_agent(name: str):
+    class CodingAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = {AgentCapability.CODE_GENERATION}
+        
+        async def _execute_impl(self, input_data):
+            return create_agent_output(input_data.agent_execution_id, name)
+    
+    return CodingAgent
+
+
+def make_factory(stats: AgentPerformanceStats) -> AgentFactory:
+    registry = AgentRegistry()
+    registry.register_agent(make_agent("fast"))
+    registry.register_agent(make_agent("flaky"))
+    return AgentFactory(registry, performance_stats=stats)
+
+
+def test_selection_strategies_follow_recent_behaviour():
+    stats = AgentPerformanceStats()
+    factory = make_factory(stats)
+    
+    def select(strategy):
+        return asyncio.run(factory._select_best_agent(["flaky", "fast"], AgentCapability.CODE_GENERATION, strategy))
+    
+    for _ in range(10):
+        stats.record("flaky", True, 5.0)
+        stats.record("fast", True, 5.0)
+    assert factory._get_agent_performance_score("fast") == factory._get_agent_performance_score("flaky")
+    
+    # A recent streak of failures outweighs the older successes
+    for _ in range(3):
+        stats.record("flaky", False, 5.0)
+    assert select("performance") == "fast"
+    assert select("reliability") == "fast"
+    
+    # The least loaded of the two candidates wins
+    with stats.track("fast"), stats.track("fast"):
+        assert select("load") == "flaky"
+
+
+class TimedAgent(BaseAgent):
+    """Succeeds quickly for "ok" briefs and fails others."""
+    agent_type = "timed"
+    version = "1.0.0"
+    capabilities = set()
+    
+    async def _execute_impl(self, input_data):
+        await asyncio.sleep(0.02)
+        if input_data.feature_brief != "ok":
+            raise RuntimeError("fatal: rejected")
+        return create_agent_output(input_data.agent_execution_id, self.agent_type)
+
+
+def test_executor_feeds_every_attempt_into_the_statistics():
+    stats = AgentPerformanceStats(alpha=0.5)
+    config = OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1)
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"timed": TimedAgent})
+    executor.performance_stats = stats
+    
+    async def scenario():
+        for brief in ("ok", "rejected"):
+            run = PipelineRun(name=brief, feature_brief=brief, orchestration_config=config)
+            run.add_execution("timed")
+            await executor._execute_pipeline_agents(run)
+    
+    asyncio.run(asyncio.wait_for(scenario(), timeout=30))
+    
+    timed = stats.get("timed")
+    assert (timed.executions, timed.failure_count, timed.active) == (2, 1, 0)
+    assert timed.success_rate == pytest.approx(0.5)
+    assert timed.avg_duration >= 0.02
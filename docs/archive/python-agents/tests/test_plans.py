@@ -0,0 +1,146 @@
+"""Compiled pipeline plans and their reuse across runs."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import OrchestrationConfig
+from forgeflow.orchestration.plans import compile_plan
+from forgeflow.orchestration.templates import PipelineTemplate, PipelineTemplateRegistry, TemplateCategory
+
+
+def make_template(*agent_sequence, template_id: str = "test_plan", **overrides) -> PipelineTemplate:
+    settings = dict(
+        id=template_id,
+        name="Plan",
+        description="Template for plan tests",
+        category=TemplateCategory.TESTING,
+        agent_sequence=list(agent_sequence),
+        default_config={"language": "python"},
+        required_context=["repository"],
+        optional_context=[],
+        tags=[],
+        difficulty="beginner",
+        estimated_duration=50
+    )
+    settings.update(overrides)
+    return PipelineTemplate(**settings)
+
+
+def make_agent(name: str, *deps: str, optional=()):
+    class PlannedAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        capabilities = set()
+        
+        @property
+        def dependencies(self):
+            return list(deps)
+        
+        @property
+        def optional_dependencies(self):
+            return list(optional)
+        
+        async def _execute_impl(self, input_data):
+            return create_agent_output(input_data.agent_execution_id, name)
+    
+    return PlannedAgent
+
+
+AGENTS = {
+    "planner": make_agent("planner"),
+    "tester": make_agent("tester", "planner"),
+    "coder": make_agent("coder", "planner"),
+    "docs": make_agent("docs", "coder"),
+    "reviewer": make_agent("reviewer", "docs", "tester", optional=("tester", "unrelated"))
+}
+
+
+def test_plan_levels_and_critical_path():
+    plan = compile_plan(make_template("planner", "tester", "coder", "docs", "reviewer"), AGENTS)
+    
+    # The longer coder branch is scheduled first within its level
+    assert plan.levels == (("planner",), ("coder", "tester"), ("docs",), ("reviewer",))
+    assert plan.critical_path == ("planner", "coder", "docs", "reviewer")
+    assert plan.critical_path_duration == 40.0
+    assert plan.max_parallel == 2
+    
+    nodes = {node.agent_type: node for node in plan.nodes}
+    assert nodes["reviewer"].depends_on == ("docs", "tester")
+    assert nodes["reviewer"].optional_dependencies == ("tester",)
+    assert nodes["coder"].resource_requirements["memory"] == 2048
+    with pytest.raises(TypeError):
+        nodes["coder"].resource_requirements["memory"] = 1
+
+
+def test_unregistered_agents_depend_on_their_predecessor():
+    plan = compile_plan(make_template("first", "second", "third"), {})
+    
+    assert [node.depends_on for node in plan.nodes] == [(), ("first",), ("second",)]
+    assert plan.parallelism_potential == pytest.approx(1 / 3)
+
+
+def test_invalid_templates_are_rejected():
+    with pytest.raises(ValueError, match="more than once"):
+        compile_plan(make_template("planner", "planner"), AGENTS)
+    
+    with pytest.raises(ValueError, match="not in the template: planner"):
+        compile_plan(make_template("coder"), AGENTS)
+    
+    cyclic = {"one": make_agent("one", "two"), "two": make_agent("two", "one")}
+    with pytest.raises(ValueError, match="circular dependencies"):
+        compile_plan(make_template("one", "two"), cyclic)
+
+
+def test_context_is_validated_and_merged_over_the_defaults():
+    plan = compile_plan(make_template("planner"), AGENTS)
+    
+    with pytest.raises(ValueError, match="Missing required context: repository"):
+        plan.resolve_context({"language": "go"})
+    
+    assert plan.resolve_context({"repository": "app", "language": "go"}) == {"repository": "app", "language": "go"}
+    assert plan.default_config == {"language": "python"}
+
+
+def test_plans_are_cached_until_the_template_or_agents_change():
+    registry = PipelineTemplateRegistry()
+    registry.register(make_template("planner", "coder"))
+    
+    plan = registry.get_plan("test_plan", AGENTS)
+    assert registry.get_plan("test_plan", AGENTS) is plan
+    
+    other_agents = dict(AGENTS)
+    assert registry.get_plan("test_plan", other_agents) is not plan
+    
+    registry.register(make_template("planner", "coder", "docs"))
+    assert [node.agent_type for node in registry.get_plan("test_plan", other_agents).nodes] == [
+        "planner", "coder", "docs"
+    ]
+    
+    with pytest.raises(ValueError, match="not found"):
+        registry.get_plan("missing", AGENTS)
+
+
+def test_runs_are_stamped_out_of_the_plan(monkeypatch):
+    registry = PipelineTemplateRegistry()
+    registry.register(make_template("planner", "tester", "coder"))
+    monkeypatch.setattr("forgeflow.orchestration.executor.get_template_registry", lambda: registry)
+    
+    executor = PipelineExecutor(OrchestrationConfig(enable_monitoring=False))
+    executor.agent_registry = SimpleNamespace(agents=AGENTS)
+    
+    run = asyncio.run(executor.create_pipeline_run(
+        "stamped", "brief", {"repository": "app"}, template_id="test_plan"
+    ))
+    
+    assert run.project_context == {"language": "python", "repository": "app"}
+    assert {execution.agent_type: execution.depends_on for execution in run.executions} == {
+        "planner": [], "tester": ["planner"], "coder": ["planner"]
+    }
+    assert executor.run_plans[run.id] is registry.get_plan("test_plan", AGENTS)
+    
+    with pytest.raises(ValueError, match="Missing required context"):
+        asyncio.run(executor.create_pipeline_run("stamped", "brief", template_id="test_plan"))
@@ -0,0 +1,258 @@
+"""Agent registry snapshots, capability bitmasks and hot reload."""
+
+import asyncio
+import importlib
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from forgeflow.agents.base import AgentCapability, BaseAgent, create_agent_output
+from forgeflow.agents.exceptions import AgentCapabilityError, AgentNotFoundError
+from forgeflow.agents.factory import AgentFactory
+from forgeflow.agents.performance import AgentPerformanceStats
+from forgeflow.agents.registry import AgentRegistry, capability_mask, mask_capabilities
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import OrchestrationConfig, PipelineRun
+
+
+def make_agent(name: str, *capabilities: AgentCapability):
+    class RegisteredAgent(BaseAgent):
+        agent_type = name
+        version = "1.0.0"
+        instances = 0
+        
+        def __init__(self, *args, **kwargs):
+            type(self).instances += 1
+            super().__init__(*args, **kwargs)
+        
+        async def _execute_impl(self, input_data):
+            return create_agent_output(input_data.agent_execution_id, name)
+    
+    RegisteredAgent.capabilities = set(capabilities)
+    return RegisteredAgent
+
+
+def make_registry() -> AgentRegistry:
+    registry = AgentRegistry()
+    registry.register_agent(make_agent("planner", AgentCapability.PLANNING))
+    registry.register_agent(make_agent("coder", AgentCapability.CODE_GENERATION, AgentCapability.DEBUGGING))
+    registry.register_agent(make_agent("tester", AgentCapability.TESTING, AgentCapability.DEBUGGING))
+    return registry
+
+
+def test_capability_masks_round_trip():
+    capabilities = {AgentCapability.TESTING, AgentCapability.REVIEW}
+    
+    assert mask_capabilities(capability_mask(capabilities)) == capabilities
+    assert capability_mask([]) == 0
+    assert len({capability_mask([capability]) for capability in AgentCapability}) == len(AgentCapability)
+
+
+def test_capability_queries():
+    registry = make_registry()
+    
+    assert registry.get_agents_by_capability(AgentCapability.DEBUGGING) == ["coder", "tester"]
+    assert registry.get_agents_with_capabilities([AgentCapability.DEBUGGING, AgentCapability.TESTING]) == ["tester"]
+    assert registry.get_agents_with_capabilities([]) == ["planner", "coder", "tester"]
+    assert registry.find_agents_for_pipeline([AgentCapability.PLANNING, AgentCapability.DEBUGGING]) == {
+        AgentCapability.PLANNING: ["planner"],
+        AgentCapability.DEBUGGING: ["coder", "tester"]
+    }
+    
+    with pytest.raises(AgentCapabilityError) as error:
+        registry.find_agents_for_pipeline([AgentCapability.PLANNING, AgentCapability.SECURITY])
+    assert "security" in str(error.value)
+
+
+def test_metadata_is_read_without_instantiating_agents():
+    registry = AgentRegistry()
+    agent_class = make_agent("planner", AgentCapability.PLANNING)
+    registry.register_agent(agent_class)
+    
+    info = registry.get_agent_info("planner")
+    
+    assert info["capabilities"] == ["planning"]
+    assert info["version"] == "1.0.0"
+    assert registry.get_agent_capabilities("planner") == {AgentCapability.PLANNING}
+    assert agent_class.instances == 0
+
+
+def test_readers_keep_a_consistent_snapshot():
+    registry = make_registry()
+    view = registry.agents
+    
+    registry.unregister_agent("coder")
+    registry.register_agent(make_agent("reviewer", AgentCapability.REVIEW))
+    
+    # The old view still shows the registry as it was
+    assert list(view) == ["planner", "coder", "tester"]
+    assert registry.agents is not view
+    assert list(registry.agents) == ["planner", "tester", "reviewer"]
+    with pytest.raises(TypeError):
+        registry._snapshot.classes["coder"] = None
+    
+    with pytest.raises(AgentNotFoundError):
+        registry.get_agent_class("coder")
+    with pytest.raises(KeyError):
+        registry.agents["coder"]
+
+
+def test_lookups_never_miss_during_concurrent_registration():
+    registry = make_registry()
+    stop = threading.Event()
+    misses = []
+    
+    def read():
+        while not stop.is_set():
+            try:
+                registry.get_agent_class("planner")
+                if "tester" not in registry.get_agents_by_capability(AgentCapability.TESTING):
+                    misses.append("tester")
+            except AgentNotFoundError as e:
+                misses.append(e)
+    
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for index in range(300):
+            registry.register_agent(make_agent(f"extra{index % 10}", AgentCapability.RESEARCH))
+            registry.register_agent(make_agent("planner", AgentCapability.PLANNING))
+            registry.unregister_agent(f"extra{index % 10}")
+    finally:
+        stop.set()
+        for reader in readers:
+            reader.join()
+    
+    assert misses == []
+    assert registry.get_agent_revision("planner") == 301
+
+
+AGENT_MODULE = """
+import asyncio
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+
+
+class ReloadableAgent(BaseAgent):
+    agent_type = "reloadable"
+    version = "{version}"
+    capabilities = set()
+    
+    async def _execute_impl(self, input_data):
+        await asyncio.sleep({delay})
+        return create_agent_output(input_data.agent_execution_id, self.agent_type, primary_result=self.version)
+"""
+
+
+@pytest.fixture
+def agent_module(tmp_path, monkeypatch):
+    """Writes the reloadable agent module; returns a function rewriting it."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Rewrites within the same second must not be served from a stale .pyc
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    path = tmp_path / "reloadable_agent.py"
+    
+    def write(version: str = "1.0.0", delay: float = 0.0, source: str = AGENT_MODULE):
+        path.write_text(source.format(version=version, delay=delay))
+        importlib.invalidate_caches()
+    
+    write()
+    yield write
+    sys.modules.pop("reloadable_agent", None)
+
+
+def make_reloadable_registry() -> AgentRegistry:
+    registry = AgentRegistry()
+    registry.register_lazy("reloadable", "reloadable_agent:ReloadableAgent")
+    return registry
+
+
+def test_reload_swaps_the_class_under_a_new_revision(agent_module):
+    registry = make_reloadable_registry()
+    old_class = registry.get_agent_class("reloadable")
+    old_view = registry.agents
+    
+    agent_module("2.0.0")
+    assert registry.reload_agent("reloadable")
+    
+    new_class = registry.get_agent_class("reloadable")
+    assert new_class is not old_class
+    assert registry.get_agent_info("reloadable")["version"] == "2.0.0"
+    assert registry.get_agent_revision("reloadable") == 2
+    assert registry.is_current(new_class, "reloadable")
+    assert not registry.is_current(old_class, "reloadable")
+    assert old_view["reloadable"] is old_class
+
+
+def test_failed_reload_keeps_the_current_class(agent_module):
+    registry = make_reloadable_registry()
+    current = registry.get_agent_class("reloadable")
+    
+    agent_module(source="from forgeflow.agents.base import BaseAgent\n")
+    assert not registry.reload_agent("reloadable")
+    
+    agent_module(source="class ReloadableAgent(:\n")
+    assert not registry.reload_agent("reloadable")
+    assert not registry.reload_agent("unknown")
+    
+    assert registry.get_agent_class("reloadable") is current
+    assert registry.get_agent_revision("reloadable") == 1
+
+
+def test_pooled_instances_of_a_replaced_version_are_retired(agent_module):
+    registry = make_reloadable_registry()
+    factory = AgentFactory(registry, performance_stats=AgentPerformanceStats())
+    
+    async def scenario():
+        idle = await factory.acquire_agent("reloadable")
+        in_use = await factory.acquire_agent("reloadable")
+        await factory.release_agent(idle)
+        
+        agent_module("2.0.0")
+        assert registry.reload_agent("reloadable")
+        
+        fresh = await factory.acquire_agent("reloadable")  # never the stale idle instance
+        assert await factory.evict_stale_agents() == 0  # acquire already destroyed it
+        await factory.release_agent(in_use)
+        return idle, in_use, fresh
+    
+    idle, in_use, fresh = asyncio.run(asyncio.wait_for(scenario(), timeout=5))
+    
+    assert fresh.version == "2.0.0"
+    assert set(factory._active_agents) == {fresh.instance_id}
+    assert idle.instance_id not in factory._active_agents
+    assert factory._agent_pools["reloadable"] == []
+
+
+def test_running_executions_finish_on_the_version_they_started_with(agent_module):
+    agent_module(delay=0.2)
+    registry = make_reloadable_registry()
+    config = OrchestrationConfig(pipeline_timeout=60, enable_monitoring=False, default_max_attempts=1)
+    executor = PipelineExecutor(config)
+    executor.agent_registry = registry
+    
+    def make_run():
+        run = PipelineRun(name="reload", feature_brief="brief", orchestration_config=config)
+        run.add_execution("reloadable")
+        return run
+    
+    async def scenario():
+        running = make_run()
+        task = asyncio.create_task(executor._execute_pipeline_agents(running))
+        await asyncio.sleep(0.05)
+        
+        agent_module("2.0.0")
+        assert registry.reload_agent("reloadable")
+        await task
+        
+        later = make_run()
+        await executor._execute_pipeline_agents(later)
+        return running, later
+    
+    running, later = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+    
+    assert running.get_execution("reloadable").output_data.primary_result == "1.0.0"
+    assert later.get_execution("reloadable").output_data.primary_result == "2.0.0"
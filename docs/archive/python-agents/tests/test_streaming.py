@@ -0,0 +1,128 @@
+"""Partial-output streaming from agents to their stream dependents."""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from forgeflow.agents.base import AgentInput, AgentOutput, BaseAgent, create_agent_output
+from forgeflow.agents.exceptions import AgentExecutionError
+from forgeflow.orchestration.executor import PipelineExecutor
+from forgeflow.orchestration.models import ExecutionStatus, OrchestrationConfig, PipelineRun
+from forgeflow.orchestration.streaming import OutputStream
+
+
+def chunk(agent_type: str, value) -> AgentOutput:
+    return create_agent_output(uuid4(), agent_type, status="partial", is_chunk=True, primary_result=value)
+
+
+class PartialResultAgent(BaseAgent):
+    agent_type = "partial_result"
+    version = "1.0.0"
+    capabilities = set()
+    supports_streaming = True
+    
+    async def _execute_impl(self, input_data):
+        return create_agent_output(input_data.agent_execution_id, self.agent_type, status="partial")
+    
+    async def _stream_impl(self, input_data):
+        yield chunk(self.agent_type, 1)
+        yield chunk(self.agent_type, 2)
+        yield await self._execute_impl(input_data)
+
+
+def test_final_output_with_partial_status_is_not_a_chunk():
+    agent = PartialResultAgent()
+    input_data = AgentInput(run_id=uuid4(), feature_brief="brief")
+    
+    async def collect():
+        return [output async for output in agent.execute_stream(input_data)]
+    
+    outputs = asyncio.run(collect())
+    
+    assert [output.primary_result for output in outputs[:2]] == [1, 2]
+    assert all(output.is_chunk for output in outputs[:2])
+    assert not outputs[-1].is_chunk
+    assert outputs[-1].status == "partial"
+    assert outputs[-1].error_message is None
+
+
+def test_stream_dependent_consumes_chunks_while_producer_runs():
+    seen = []
+    
+    class Producer(BaseAgent):
+        agent_type = "producer"
+        version = "1.0.0"
+        capabilities = set()
+        supports_streaming = True
+        
+        async def _execute_impl(self, input_data):
+            return create_agent_output(input_data.agent_execution_id, self.agent_type, primary_result="done")
+        
+        async def _stream_impl(self, input_data):
+            yield chunk(self.agent_type, "first")
+            # Only finish once the consumer has seen the first chunk
+            for _ in range(200):
+                if seen:
+                    break
+                await asyncio.sleep(0.01)
+            yield await self._execute_impl(input_data)
+    
+    class Consumer(BaseAgent):
+        agent_type = "consumer"
+        version = "1.0.0"
+        capabilities = set()
+        
+        async def _execute_impl(self, input_data):
+            async for item in input_data.dependency_streams["producer"]:
+                seen.append(item.primary_result)
+            return create_agent_output(input_data.agent_execution_id, self.agent_type, primary_result=seen)
+    
+    config = OrchestrationConfig(pipeline_timeout=60)
+    executor = PipelineExecutor(config)
+    executor.agent_registry = SimpleNamespace(agents={"producer": Producer, "consumer": Consumer})
+    
+    run = PipelineRun(name="stream", feature_brief="brief", orchestration_config=config)
+    run.add_execution("producer")
+    run.add_execution("consumer", ["producer"], stream_dependencies=["producer"])
+    
+    asyncio.run(asyncio.wait_for(executor._execute_pipeline_agents(run), timeout=30))
+    
+    producer, consumer = run.get_execution("producer"), run.get_execution("consumer")
+    assert producer.status == ExecutionStatus.SUCCESS
+    assert producer.partial_output_count == 1
+    assert producer.output_data.primary_result == "done"
+    assert consumer.status == ExecutionStatus.SUCCESS
+    assert seen == ["first"]
+
+
+def test_late_subscriber_replays_chunks_then_sees_the_error():
+    async def scenario():
+        stream = OutputStream("producer")
+        await stream.publish(chunk("producer", 1))
+        await stream.publish(chunk("producer", 2))
+        await stream.close(error="boom")
+        
+        received = []
+        with pytest.raises(AgentExecutionError, match="boom"):
+            async for item in stream:
+                received.append(item.primary_result)
+        return received
+    
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_cancelled_subscriber_leaves_the_stream_usable():
+    async def scenario():
+        stream = OutputStream("producer")
+        waiting = asyncio.create_task(stream.subscribe().__anext__())
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+        
+        await stream.publish(chunk("producer", "after"))
+        await stream.close()
+        return [item.primary_result async for item in stream]
+    
+    assert asyncio.run(scenario()) == ["after"]
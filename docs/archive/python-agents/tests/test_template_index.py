@@ -0,0 +1,86 @@
+"""Inverted-index template search."""
+
+from types import SimpleNamespace
+
+from forgeflow.orchestration.template_index import TemplateIndex, tokenize
+from forgeflow.orchestration.templates import PipelineTemplateRegistry, TemplateCategory
+
+
+def make_template(template_id: str, name: str, tags=(), category=TemplateCategory.WEB_API, description=""):
+    return SimpleNamespace(id=template_id, name=name, description=description, tags=list(tags), category=category)
+
+
+def make_index() -> TemplateIndex:
+    index = TemplateIndex()
+    index.add(make_template("crud_api", "FastAPI CRUD Service", tags=["python", "REST"]))
+    index.add(make_template("etl", "Batch ETL", tags=["python", "data"], category=TemplateCategory.DATA_PIPELINE))
+    index.add(make_template("spa", "React App", tags=["frontend"], category=TemplateCategory.FRONTEND,
+                            description="Single page service worker app"))
+    return index
+
+
+def test_every_query_word_must_prefix_match():
+    index = make_index()
+    
+    assert tokenize("FastAPI-CRUD v2") == ["fastapi", "crud", "v2"]
+    assert index.search("crud serv") == ["crud_api"]
+    assert index.search("serv") == ["crud_api", "spa"]  # name and description, in registration order
+    assert index.search("crud react") == []
+    assert index.search("zzz") == []
+    assert index.search() == ["crud_api", "etl", "spa"]
+
+
+def test_tags_and_category_filter_exactly():
+    index = make_index()
+    
+    assert index.search(tags=["Python"]) == ["crud_api", "etl"]
+    assert index.search(tags=["pyth"]) == []
+    assert index.search("py", tags=["data"]) == ["etl"]
+    assert index.search(category=TemplateCategory.FRONTEND) == ["spa"]
+    assert index.search(category="data_pipeline", tags=["rest"]) == []
+
+
+def test_reindexing_replaces_the_old_entry():
+    index = make_index()
+    index.add(make_template("crud_api", "GraphQL Gateway", tags=["python"]))
+    
+    assert index.search("fastapi") == []
+    assert index.search("graph") == ["crud_api"]
+    assert index.search() == ["crud_api", "etl", "spa"]  # keeps its original position
+    assert "rest" not in index.tags and "fastapi" not in index.tokens
+    
+    index.remove("etl")
+    index.remove("missing")
+    assert len(index) == 2
+    assert "etl" not in index._sorted_tokens
+    assert index._sorted_tokens == sorted(index.tokens)
+
+
+def test_facets_count_categories_and_tags():
+    index = make_index()
+    
+    assert index.facets()['tags'] == {"python": 2, "rest": 1, "data": 1, "frontend": 1}
+    assert index.facets(index.search(tags=["python"])) == {
+        'categories': {"web_api": 1, "data_pipeline": 1},
+        'tags': {"python": 2, "rest": 1, "data": 1}
+    }
+
+
+def test_registry_search_matches_a_full_scan():
+    registry = PipelineTemplateRegistry()
+    
+    for word in ("api", "multi agent", "test", "react front"):
+        scanned = [
+            template.id for template in registry.templates.values()
+            if all(
+                any(token.startswith(query) for token in tokenize(
+                    f"{template.id} {template.name} {template.description} {' '.join(template.tags)}"
+                ))
+                for query in tokenize(word)
+            )
+        ]
+        assert [template.id for template in registry.search_templates(word)] == scanned
+    
+    orchestration = registry.list_templates(TemplateCategory.ORCHESTRATION)
+    assert orchestration and all(t.category == TemplateCategory.ORCHESTRATION for t in orchestration)
+    assert registry.get_facets("multi")['categories'] == {"orchestration": len(registry.search_templates("multi"))}
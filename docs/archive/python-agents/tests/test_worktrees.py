@@ -0,0 +1,174 @@
+"""Worktree pool, and coordinated agents working in their leased worktree."""
+
+import asyncio
+import subprocess
+
+import pytest
+
+from forgeflow.agents.base import BaseAgent, create_agent_output
+from forgeflow.agents.coordinator import AgentAssignment, CoordinationPlan, CoordinatorAgent
+from forgeflow.agents.factory import AgentFactory
+from forgeflow.agents.registry import AgentRegistry
+from forgeflow.agents.worktrees import WorktreePool, get_worktree_pool
+
+
+def git(repo, *args) -> str:
+    return subprocess.run(("git", *args), cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def test_leased_worktree_is_cleaned_and_reused(git_repo):
+    git(git_repo, "branch", "one")
+    git(git_repo, "branch", "two")
+    pool = WorktreePool(git_repo)
+    
+    async def scenario():
+        async with pool.lease("one") as worktree:
+            first_path = worktree.path
+            assert git(worktree.path, "symbolic-ref", "--short", "HEAD") == "one"
+            (worktree.path / "scratch.txt").write_text("uncommitted\n")
+        
+        assert pool.get_statistics()['idle'] == 1
+        
+        async with pool.lease("two") as worktree:
+            assert worktree.path == first_path
+            assert git(worktree.path, "symbolic-ref", "--short", "HEAD") == "two"
+            assert not (worktree.path / "scratch.txt").exists()
+        
+        await pool.close()
+    
+    asyncio.run(scenario())
+    
+    stats = pool.get_statistics()
+    assert (stats['created'], stats['reused'], stats['removed']) == (1, 1, 1)
+    assert git(git_repo, "worktree", "list").count("\n") == 0  # only the main worktree
+    assert git(git_repo, "status", "--porcelain") == ""
+
+
+def test_broken_idle_worktree_is_replaced(git_repo):
+    git(git_repo, "branch", "one")
+    pool = WorktreePool(git_repo)
+    
+    async def scenario():
+        await pool.prewarm(1)
+        broken = pool.idle[0]
+        git(broken.path, "checkout", "-q", "--detach")
+        git(git_repo, "worktree", "remove", "--force", str(broken.path))
+        
+        async with pool.lease("one") as worktree:
+            assert worktree.path != broken.path
+            assert (worktree.path / "README.md").exists()
+        
+        await pool.close()
+    
+    asyncio.run(scenario())
+    
+    assert pool.get_statistics()['created'] == 2
+
+
+def test_orphaned_worktree_directories_are_removed(git_repo):
+    orphan = git_repo / ".git" / "forgeflow-worktrees" / "wt-orphan"
+    orphan.mkdir(parents=True)
+    (orphan / "leftover.txt").write_text("from a crashed run\n")
+    pool = WorktreePool(git_repo)
+    
+    asyncio.run(pool.prewarm(1))
+    
+    assert not orphan.exists()
+    assert pool.get_statistics()['orphans_removed'] == 1
+    asyncio.run(pool.close())
+
+
+def test_cancelled_lease_holder_still_releases_the_worktree(git_repo):
+    git(git_repo, "branch", "one")
+    pool = WorktreePool(git_repo)
+    leased = asyncio.Event()
+    
+    async def holder():
+        async with pool.lease("one"):
+            leased.set()
+            await asyncio.Event().wait()
+    
+    async def scenario():
+        task = asyncio.create_task(holder())
+        await leased.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        stats = pool.get_statistics()
+        await pool.close()
+        return stats
+    
+    stats = asyncio.run(scenario())
+    
+    assert (stats['leased'], stats['idle']) == (0, 1)
+    # The branch is no longer checked out anywhere, so it can be deleted
+    git(git_repo, "branch", "-D", "one")
+
+
+class WritingAgent(BaseAgent):
+    """Writes a file named after its task into the directory it works in."""
+    agent_type = "writer"
+    version = "1.0.0"
+    capabilities = set()
+    
+    async def _execute_impl(self, input_data):
+        (self.working_directory / f"{input_data.task_description}.txt").write_text("work\n")
+        return create_agent_output(input_data.agent_execution_id, self.agent_type)
+
+
+class ReadOnlyAgent(BaseAgent):
+    agent_type = "reader"
+    version = "1.0.0"
+    capabilities = set()
+    
+    async def _execute_impl(self, input_data):
+        assert (self.working_directory / "README.md").exists()
+        return create_agent_output(input_data.agent_execution_id, self.agent_type)
+
+
+def make_coordinator(repo) -> CoordinatorAgent:
+    registry = AgentRegistry()
+    registry.register_agent(WritingAgent)
+    registry.register_agent(ReadOnlyAgent)
+    
+    coordinator = CoordinatorAgent()
+    coordinator.project_path = repo
+    coordinator.factory = AgentFactory(registry)
+    return coordinator
+
+
+def make_plan(*assignments: AgentAssignment) -> CoordinationPlan:
+    coordinator = CoordinatorAgent()
+    return CoordinationPlan(
+        feature_brief="brief",
+        strategy=coordinator.strategies["parallel_isolated"],
+        assignments=list(assignments),
+        estimated_duration=1
+    )
+
+
+def test_agents_work_and_commit_in_their_worktree(git_repo):
+    git(git_repo, "branch", "agent/writer")
+    git(git_repo, "branch", "agent/reader")
+    coordinator = make_coordinator(git_repo)
+    writer = AgentAssignment(agent_type="writer", file_patterns=["*"], task_description="feature")
+    reader = AgentAssignment(agent_type="reader", file_patterns=["*"], task_description="review")
+    plan = make_plan(writer, reader)
+    
+    async def scenario():
+        results = await asyncio.gather(
+            coordinator._execute_agent_on_branch(writer, plan, "agent/writer"),
+            coordinator._execute_agent_on_branch(reader, plan, "agent/reader")
+        )
+        await get_worktree_pool(git_repo).close()
+        return results
+    
+    results = asyncio.run(scenario())
+    
+    assert all(result["success"] for result in results)
+    # The writer's file was committed on its branch, not left in the main checkout
+    assert git(git_repo, "show", "--name-only", "--format=", "agent/writer") == "feature.txt"
+    assert not (git_repo / "feature.txt").exists()
+    # The reader changed nothing, so its branch has no new commit
+    assert git(git_repo, "rev-parse", "agent/reader") == git(git_repo, "rev-parse", "main")